@@ -1,6 +1,7 @@
 """Audio capture using GStreamer pipeline."""
 
 import logging
+import threading
 from typing import Callable
 
 import gi
@@ -91,6 +92,10 @@ class AudioCapture:
 
         self._on_error: Callable[[str], None] | None = None
 
+        # Background setup (see setup_async)
+        self._setup_thread: threading.Thread | None = None
+        self._destroy_pending = False
+
     @property
     def format(self) -> AudioFormat:
         """Return the audio format."""
@@ -104,7 +109,12 @@ class AudioCapture:
     @property
     def is_setup(self) -> bool:
         """Return whether the pipeline is set up."""
-        return self._pipeline is not None
+        return self._pipeline is not None and self._setup_thread is None
+
+    @property
+    def is_setting_up(self) -> bool:
+        """Return whether a background setup is in progress."""
+        return self._setup_thread is not None
 
     def _get_source_element(self) -> str:
         """Get the audio source element name based on preference."""
@@ -238,6 +248,56 @@ class AudioCapture:
         self._on_error = on_error
         return self._create_pipeline()
 
+    def setup_async(
+        self,
+        on_error: Callable[[str], None] | None = None,
+        on_done: Callable[[bool], None] | None = None,
+    ) -> None:
+        """Set up the GStreamer pipeline on a background thread.
+
+        Opening the audio device can take tens of milliseconds; this keeps
+        it off the caller's main loop.  Does nothing if the pipeline is
+        already set up or being set up.
+
+        Args:
+            on_error: Callback for error notifications.
+            on_done: Called in the main loop with the setup result.
+        """
+        if self.is_setup or self._setup_thread is not None:
+            return
+
+        self._destroy_pending = False
+        self._setup_thread = threading.Thread(
+            target=self._setup_thread_main,
+            args=(on_error, on_done),
+            name="speak2type-audio-setup",
+            daemon=True,
+        )
+        self._setup_thread.start()
+
+    def _setup_thread_main(
+        self,
+        on_error: Callable[[str], None] | None,
+        on_done: Callable[[bool], None] | None,
+    ) -> None:
+        """Background setup thread body."""
+        ok = self.setup(on_error=on_error)
+        GLib.idle_add(self._finish_async_setup, ok, on_done)
+
+    def _finish_async_setup(
+        self, ok: bool, on_done: Callable[[bool], None] | None
+    ) -> bool:
+        """GLib idle callback — background setup finished."""
+        self._setup_thread = None
+        if self._destroy_pending:
+            # destroy() was requested while the device was opening
+            self._destroy_pending = False
+            self.destroy()
+            ok = False
+        if on_done:
+            on_done(ok)
+        return GLib.SOURCE_REMOVE
+
     def start(self) -> bool:
         """Start recording audio.
 
@@ -265,11 +325,14 @@ class AudioCapture:
         LOG.info("Started recording")
         return True
 
-    def stop(self) -> AudioSegment | None:
+    def stop(self, abort: bool = False) -> AudioSegment | None:
         """Stop recording and return captured audio.
 
+        Args:
+            abort: Discard the captured audio without copying it out.
+
         Returns:
-            AudioSegment with captured audio, or None if no audio.
+            AudioSegment with captured audio, or None if no audio or aborted.
         """
         if self._pipeline is None:
             LOG.error("Pipeline not set up")
@@ -283,6 +346,11 @@ class AudioCapture:
         # Pipeline stays PLAYING - callback continues to drain samples
         # but discards them since _is_recording is False
 
+        if abort:
+            self._buffer.clear()
+            LOG.info("Recording aborted")
+            return None
+
         # Get captured audio
         if len(self._buffer) == 0:
             LOG.warning("No audio captured")
@@ -301,7 +369,15 @@ class AudioCapture:
         return segment
 
     def destroy(self) -> None:
-        """Clean up resources."""
+        """Clean up resources.
+
+        If a background setup is still running, the pipeline is destroyed
+        as soon as it finishes instead.
+        """
+        if self._setup_thread is not None:
+            self._destroy_pending = True
+            return
+
         if self._bus:
             self._bus.remove_signal_watch()
             self._bus = None
@@ -49,6 +49,15 @@ BACKEND_SPECS: dict[str, BackendSpec] = {
         check_import="pywhispercpp",
         has_models=True,
     ),
+    "faster-whisper": BackendSpec(
+        id="faster-whisper",
+        name="faster-whisper",
+        description="OpenAI Whisper on CTranslate2 with int8 weights. Faster than "
+        "whisper.cpp on CPU; uses CUDA when available. Models download on first use.",
+        pip_packages=["faster-whisper>=1.1.0"],
+        check_import="faster_whisper",
+        has_models=False,
+    ),
     "http": BackendSpec(
         id="http",
         name="HTTP Backend",
@@ -22,6 +22,14 @@ except ImportError:
     WHISPER_AVAILABLE = False
     LOG.warning("Whisper backend not available", exc_info=True)
 
+# Try to import faster-whisper backend
+try:
+    from .faster_whisper_adapter import FasterWhisperBackend, FASTER_WHISPER_AVAILABLE
+except ImportError:
+    FasterWhisperBackend = None
+    FASTER_WHISPER_AVAILABLE = False
+    LOG.warning("faster-whisper backend not available", exc_info=True)
+
 # Try to import Parakeet backend
 try:
     from .parakeet_adapter import ParakeetBackend, PARAKEET_AVAILABLE
@@ -47,6 +55,8 @@ __all__ = [
     "VOSK_AVAILABLE",
     "WhisperBackend",
     "WHISPER_AVAILABLE",
+    "FasterWhisperBackend",
+    "FASTER_WHISPER_AVAILABLE",
     "ParakeetBackend",
     "PARAKEET_AVAILABLE",
     "HttpBackend",
@@ -56,13 +66,25 @@ __all__ = [
 ]
 
 
+# Set once the defaults have gone into the global registry
+_already_registered = False
+
+
 def register_default_backends(registry: BackendRegistry | None = None) -> None:
     """Register available backends with the registry.
 
+    Constructing the backends probes for models on disk, so the global
+    registry is only populated once per process; later calls are no-ops.
+
     Args:
         registry: Registry to use, or None for global registry.
     """
+    global _already_registered
+
     if registry is None:
+        if _already_registered:
+            return
+        _already_registered = True
         registry = get_registry()
 
     # Try to register Vosk
@@ -87,6 +109,17 @@ def register_default_backends(registry: BackendRegistry | None = None) -> None:
         except Exception as e:
             LOG.warning("Failed to initialize Whisper: %s", e)
 
+    # Try to register faster-whisper
+    if FASTER_WHISPER_AVAILABLE and FasterWhisperBackend is not None:
+        try:
+            backend = FasterWhisperBackend()
+            if backend.is_available:
+                registry.register(backend)
+            else:
+                LOG.info("faster-whisper available but no model loaded")
+        except Exception as e:
+            LOG.warning("Failed to initialize faster-whisper: %s", e)
+
     # Try to register Parakeet
     if PARAKEET_AVAILABLE and ParakeetBackend is not None:
         try:
@@ -10,6 +10,22 @@ if TYPE_CHECKING:
 
 LOG = logging.getLogger(__name__)
 
+# 200 ms of 16 kHz mono S16LE silence, transcribed once by backend warmup()
+WARMUP_SEGMENT = AudioSegment(pcm_bytes=bytes(6400))
+
+
+class WarmupMixin:
+    """Default warmup() for backends that run a local model."""
+
+    def warmup(self) -> None:
+        """Run a short silent transcription so the first real one is not cold.
+
+        Called from the worker thread before it accepts jobs.
+        """
+        if self.is_available:
+            LOG.debug("Warming up %s backend", self.id)
+            self.transcribe(WARMUP_SEGMENT, locale_hint="en_US")
+
 
 class PlaceholderBackend:
     """Placeholder backend for testing when no real backend is configured."""
@@ -0,0 +1,236 @@
+"""faster-whisper speech recognition backend adapter.
+
+This adapter uses faster-whisper (Whisper on CTranslate2) for offline
+speech recognition. With int8 weights it is several times faster than
+whisper.cpp on CPU for the same model size, and uses CUDA when present.
+"""
+
+import logging
+from pathlib import Path
+from typing import Any
+
+from ..types import AudioSegment, TranscriptResult, Segment
+from .base import WarmupMixin
+from .whisper_adapter import SPECIAL_PATTERN
+
+LOG = logging.getLogger(__name__)
+
+# Check if faster-whisper and its dependencies are available
+try:
+    import numpy as np
+    from faster_whisper import BatchedInferencePipeline, WhisperModel
+    FASTER_WHISPER_AVAILABLE = True
+except ImportError:
+    np = None  # type: ignore[assignment]
+    FASTER_WHISPER_AVAILABLE = False
+    LOG.warning(
+        "faster-whisper dependencies not available. Install with: pip install faster-whisper"
+    )
+
+
+class FasterWhisperBackend(WarmupMixin):
+    """Whisper speech recognition backend using faster-whisper.
+
+    Models are given either as a size name (e.g. "base", "small"), which
+    faster-whisper downloads on first use, or as a path to a converted
+    CTranslate2 model directory.  The model is loaded on the first
+    warmup() or transcribe() call, on the worker thread, so constructing
+    the backend at IBus startup never touches the network.
+    """
+
+    DEFAULT_MODEL = "base"
+
+    def __init__(
+        self,
+        model: str | Path | None = None,
+        language: str | None = None,
+        device: str = "auto",
+        compute_type: str = "int8",
+        n_threads: int = 4,
+        batch_size: int = 1,
+    ) -> None:
+        """Initialize the faster-whisper backend.
+
+        Args:
+            model: Model size name or path to a CTranslate2 model directory.
+            language: Language code (e.g., 'en') or None to use the locale hint.
+            device: "cpu", "cuda" or "auto".
+            compute_type: CTranslate2 weight type, e.g. "int8" or "float16".
+            n_threads: Number of threads for CPU inference.
+            batch_size: Number of chunks of one utterance decoded together.
+                Values above 1 use faster-whisper's BatchedInferencePipeline,
+                which only pays off for long utterances.
+        """
+        self._model: Any = None
+        self._pipeline: Any = None
+        self._load_failed = False
+        self._model_name = str(model or self.DEFAULT_MODEL)
+        self._language = language
+        self._device = device
+        self._compute_type = compute_type
+        self._n_threads = n_threads
+        self._batch_size = max(1, batch_size)
+
+        if not FASTER_WHISPER_AVAILABLE:
+            LOG.error("faster-whisper not available")
+
+    @property
+    def id(self) -> str:
+        return "faster-whisper"
+
+    @property
+    def name(self) -> str:
+        return f"faster-whisper ({self._model_name}, {self._compute_type})"
+
+    @property
+    def is_available(self) -> bool:
+        """Check if faster-whisper is available and the model has not failed to load."""
+        return FASTER_WHISPER_AVAILABLE and not self._load_failed
+
+    def _ensure_model(self) -> bool:
+        """Load the model on first use.
+
+        Returns:
+            True if the model is loaded.
+        """
+        if self._model is None and not self._load_failed:
+            self._load_failed = not self._load_model()
+        return self._model is not None
+
+    def _load_model(self) -> bool:
+        """Load the model named by ``self._model_name``.
+
+        Returns:
+            True if model loaded successfully.
+        """
+        if not FASTER_WHISPER_AVAILABLE:
+            return False
+
+        try:
+            LOG.info(
+                "Loading faster-whisper model %s (%s, %s)",
+                self._model_name,
+                self._device,
+                self._compute_type,
+            )
+            self._model = WhisperModel(
+                self._model_name,
+                device=self._device,
+                compute_type=self._compute_type,
+                cpu_threads=self._n_threads,
+            )
+            self._pipeline = (
+                BatchedInferencePipeline(model=self._model) if self._batch_size > 1 else None
+            )
+            LOG.info("faster-whisper model loaded successfully")
+            return True
+
+        except Exception as e:
+            LOG.error("Failed to load faster-whisper model: %s", e)
+            self._model = None
+            self._pipeline = None
+            return False
+
+    def transcribe(
+        self,
+        segment: AudioSegment,
+        locale_hint: str,
+        options: dict | None = None,
+    ) -> TranscriptResult:
+        """Transcribe an audio segment using faster-whisper.
+
+        Args:
+            segment: Audio segment to transcribe.
+            locale_hint: Locale hint, used as the language if none is set.
+            options: Additional options.
+
+        Returns:
+            Transcription result.
+        """
+        if not (FASTER_WHISPER_AVAILABLE and self._ensure_model()):
+            return TranscriptResult(
+                text="[faster-whisper not available - install faster-whisper]",
+                confidence=0.0,
+            )
+
+        language = self._language or (locale_hint[:2] if locale_hint else None)
+
+        try:
+            audio_int16 = np.frombuffer(segment.pcm_bytes, dtype=np.int16)
+            audio_float = audio_int16.astype(np.float32) / 32768.0
+
+            LOG.debug(
+                "Transcribing %d samples (%.2f seconds)",
+                len(audio_float),
+                len(audio_float) / segment.format.sample_rate,
+            )
+
+            kwargs = {
+                "language": language,
+                "vad_filter": True,
+                "without_timestamps": True,
+            }
+            if self._pipeline is not None:
+                segments_iter, _ = self._pipeline.transcribe(
+                    audio_float, batch_size=self._batch_size, **kwargs
+                )
+            else:
+                segments_iter, _ = self._model.transcribe(audio_float, **kwargs)
+
+            # Segments are generated lazily; decoding happens while iterating
+            text_parts = []
+            segments_list = []
+            for seg in segments_iter:
+                seg_text = seg.text.strip()
+                if not seg_text or SPECIAL_PATTERN.match(seg_text):
+                    continue
+                text_parts.append(seg_text)
+                segments_list.append(
+                    Segment(
+                        text=seg_text,
+                        start_ms=int(seg.start * 1000),
+                        end_ms=int(seg.end * 1000),
+                    )
+                )
+
+            text = " ".join(text_parts)
+
+            LOG.debug("faster-whisper transcription: '%s'", text)
+
+            return TranscriptResult(
+                text=text,
+                segments=segments_list if segments_list else None,
+                language=language,
+            )
+
+        except Exception as e:
+            LOG.exception("faster-whisper transcription error: %s", e)
+            return TranscriptResult(
+                text="",
+                confidence=0.0,
+                error=f"faster-whisper transcription error: {e}",
+            )
+
+    def set_model(self, model: str | Path) -> bool:
+        """Set a new model.
+
+        Args:
+            model: Model size name or path to a CTranslate2 model directory.
+
+        Returns:
+            True if model loaded successfully.
+        """
+        self._model_name = str(model)
+        self._load_failed = not self._load_model()
+        return not self._load_failed
+
+    def set_language(self, language: str | None) -> None:
+        """Set the transcription language.
+
+        Unlike whisper.cpp the language is a per-call option, so the model
+        is not reloaded.
+
+        Args:
+            language: Language code (e.g., 'en') or None to use the locale hint.
+        """
+        self._language = language
@@ -15,6 +15,7 @@ from pathlib import Path
 from typing import Any
 
 from ..types import AudioSegment, TranscriptResult, Segment
+from .base import WarmupMixin
 
 LOG = logging.getLogger(__name__)
 
@@ -38,7 +39,7 @@ MODEL_NAMES = {
 }
 
 
-class ParakeetBackend:
+class ParakeetBackend(WarmupMixin):
     """Parakeet ONNX speech recognition backend.
 
     Uses onnx-asr to run NVIDIA Parakeet TDT models for high-performance
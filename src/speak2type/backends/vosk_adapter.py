@@ -10,6 +10,7 @@ import os
 from pathlib import Path
 
 from ..types import AudioSegment, TranscriptResult, Segment
+from .base import WarmupMixin
 
 LOG = logging.getLogger(__name__)
 
@@ -35,7 +36,7 @@ def get_model_dir() -> Path:
     return get_xdg_data_home() / "speak2type" / "models" / "vosk"
 
 
-class VoskBackend:
+class VoskBackend(WarmupMixin):
     """Vosk speech recognition backend for batch transcription.
 
     Uses the Vosk library to transcribe pre-recorded audio segments.
@@ -12,6 +12,7 @@ from pathlib import Path
 from typing import TYPE_CHECKING
 
 from ..types import AudioSegment, TranscriptResult, Segment
+from .base import WarmupMixin
 
 if TYPE_CHECKING:
     from pywhispercpp.model import Model as WhisperModel
@@ -45,7 +46,7 @@ def get_model_dir() -> Path:
     return get_xdg_data_home() / "speak2type" / "models" / "whisper"
 
 
-class WhisperBackend:
+class WhisperBackend(WarmupMixin):
     """Whisper speech recognition backend using whisper.cpp.
 
     Uses pywhispercpp for high-quality offline transcription.
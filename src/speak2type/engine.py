@@ -13,7 +13,7 @@ gi.require_version("IBus", "1.0")
 gi.require_version("GLib", "2.0")
 gi.require_version("Gio", "2.0")
 
-from gi.repository import IBus, GLib, Gio, GObject
+from gi.repository import IBus, GLib, Gio
 
 from .types import EngineState, RecordMode, AudioSource, TranscriptResult
 from .audio_capture import AudioCapture
@@ -23,10 +23,31 @@ from .global_hotkey import GlobalHotkeyListener
 
 LOG = logging.getLogger(__name__)
 
+# Input purposes in which recording is disabled for privacy
+_SENSITIVE_PURPOSES = frozenset({
+    int(IBus.InputPurpose.PASSWORD),
+    int(IBus.InputPurpose.PIN),
+})
+
+# IBus engine name and the D-Bus object path engines are exported at
+_ENGINE_NAME = "speak2type"
+_ENGINE_OBJECT_PATH = "/org/freedesktop/IBus/speak2type"
+_SCHEMA_ID = "org.freedesktop.ibus.engine.stt"
+
 # Default push-to-talk hotkey: Alt+Space
 DEFAULT_PTT_KEYVAL = IBus.KEY_space
 DEFAULT_PTT_MODIFIERS = IBus.ModifierType.MOD1_MASK  # Alt key
 
+# Modifier bits that take part in PTT hotkey matching, and the IBus key
+# release flag, as plain ints for the per-keystroke path
+_PTT_RELEVANT_MASK = int(
+    IBus.ModifierType.SHIFT_MASK
+    | IBus.ModifierType.CONTROL_MASK
+    | IBus.ModifierType.MOD1_MASK  # Alt
+    | IBus.ModifierType.MOD4_MASK  # Super
+)
+_RELEASE_MASK = int(IBus.ModifierType.RELEASE_MASK)
+
 # Mapping from GTK accelerator modifier names to IBus modifier masks
 _MODIFIER_MAP = {
     "alt": IBus.ModifierType.MOD1_MASK,
@@ -38,6 +59,14 @@ _MODIFIER_MAP = {
     "mod4": IBus.ModifierType.MOD4_MASK,
 }
 
+# Clipboard tools as (required XDG_SESSION_TYPE or None for any, argv,
+# whether to wait for the tool to exit).  Tried in order; all of them read
+# the text to copy from stdin.
+_CLIPBOARD_COMMANDS: tuple[tuple[str | None, list[str], bool], ...] = (
+    ("wayland", ["wl-copy"], False),
+    (None, ["xclip", "-selection", "clipboard"], True),
+)
+
 
 def parse_accelerator(accel: str) -> tuple[int, int]:
     """Parse a GTK accelerator string into (keyval, modifiers).
@@ -67,14 +96,22 @@ def parse_accelerator(accel: str) -> tuple[int, int]:
     key_name = remaining.strip()
     if not key_name:
         LOG.warning("No key name in accelerator '%s'", accel)
-        return DEFAULT_PTT_KEYVAL, DEFAULT_PTT_MODIFIERS
+        return DEFAULT_PTT_KEYVAL, int(DEFAULT_PTT_MODIFIERS)
 
     keyval = IBus.keyval_from_name(key_name)
     if keyval == 0:
         LOG.warning("Unknown key name in accelerator '%s': %s", accel, key_name)
-        return DEFAULT_PTT_KEYVAL, DEFAULT_PTT_MODIFIERS
+        return DEFAULT_PTT_KEYVAL, int(DEFAULT_PTT_MODIFIERS)
 
-    return keyval, modifiers
+    return keyval, int(modifiers)
+
+
+def _new_settings() -> Gio.Settings | None:
+    """Return the engine's GSettings, or None if the schema is not installed."""
+    schema_source = Gio.SettingsSchemaSource.get_default()
+    if schema_source and schema_source.lookup(_SCHEMA_ID, True):
+        return Gio.Settings.new(_SCHEMA_ID)
+    return None
 
 
 class Speak2TypeEngine(IBus.Engine):
@@ -82,12 +119,60 @@ class Speak2TypeEngine(IBus.Engine):
 
     __gtype_name__ = "Speak2TypeEngine"
 
-    def __init__(self, bus: IBus.Bus, object_path: str) -> None:
+    # Preedit texts are built once and reused; IBus serializes them on each
+    # update_preedit_text() call, so sharing the objects is safe.
+    _TEXT_EMPTY = IBus.Text.new_from_string("")
+    _TEXT_RECORDING = IBus.Text.new_from_string("🎙️ Recording...")
+    _TEXT_TRANSCRIBING = IBus.Text.new_from_string("⏳ Transcribing...")
+    _TEXT_NO_BACKEND = IBus.Text.new_from_string("No backend — open speak2type settings")
+    _TEXT_BUSY = IBus.Text.new_from_string("⏳ Busy…")
+
+    # Panel label and check state of the toggle-recording property, per
+    # engine state
+    _PROP_LABELS = {
+        EngineState.IDLE: IBus.Text.new_from_string("Recognition off"),
+        EngineState.RECORDING: IBus.Text.new_from_string("Recording..."),
+        EngineState.TRANSCRIBING: IBus.Text.new_from_string("Transcribing..."),
+        EngineState.COMMITTING: IBus.Text.new_from_string("Recognition off"),
+    }
+    _PROP_STATES = {
+        EngineState.IDLE: IBus.PropState.UNCHECKED,
+        EngineState.RECORDING: IBus.PropState.CHECKED,
+        EngineState.TRANSCRIBING: IBus.PropState.CHECKED,
+        EngineState.COMMITTING: IBus.PropState.UNCHECKED,
+    }
+
+    # One GSettings client per process, shared by all engines (see
+    # _get_settings); each Gio.Settings holds its own dconf connection.
+    _SETTINGS: Gio.Settings | None = None
+
+    @classmethod
+    def _get_settings(cls) -> Gio.Settings | None:
+        """Return the shared GSettings client, creating it on first use."""
+        if cls._SETTINGS is None:
+            cls._SETTINGS = _new_settings()
+        return cls._SETTINGS
+
+    def __init__(
+        self,
+        bus: IBus.Bus,
+        object_path: str,
+        worker: TranscriptionWorker | None = None,
+        audio_capture: AudioCapture | None = None,
+        audio_owner: "Speak2TypeEngineFactory | None" = None,
+    ) -> None:
         """Initialize the engine.
 
         Args:
             bus: IBus bus connection.
             object_path: D-Bus object path.
+            worker: Transcription worker shared by the factory's engines, or
+                None if no backend is installed.
+            audio_capture: Audio capture shared by the factory's engines.
+                A private one is created if not given.
+            audio_owner: Factory that owns a shared audio_capture.  It is
+                told when this engine starts and stops using the capture,
+                and releases the microphone once no engine is enabled.
         """
         # Initialize with focus-id capability if available
         if hasattr(IBus.Engine.props, "has_focus_id"):
@@ -112,32 +197,39 @@ class Speak2TypeEngine(IBus.Engine):
         self._ptt_source: str | None = None  # 'ibus' or 'global' when PTT is active
 
         # Settings (optional - schema may not be installed)
-        self._settings = None
-        schema_source = Gio.SettingsSchemaSource.get_default()
-        if schema_source and schema_source.lookup("org.freedesktop.ibus.engine.stt", True):
-            self._settings = Gio.Settings.new("org.freedesktop.ibus.engine.stt")
+        settings = self._get_settings()
+        if settings:
             LOG.info("Loaded GSettings schema")
         else:
             LOG.warning("GSettings schema not installed, using defaults")
 
+        # Cached setting values.  GSettings reads go through dconf, so they
+        # are read once here and refreshed from changed:: signals instead of
+        # being queried on the recording/transcription path.
         self._record_mode = RecordMode.PUSH_TO_TALK
+        self._ptt_accel = "<Alt>space"
         self._ptt_keyval = DEFAULT_PTT_KEYVAL
-        self._ptt_modifiers = DEFAULT_PTT_MODIFIERS
-        if self._settings:
-            self._load_settings()
-
-        # Audio capture
-        audio_source = AudioSource.AUTO
-        if self._settings:
-            audio_source_str = self._settings.get_string("audio-source")
-            audio_source = AudioSource(audio_source_str) if audio_source_str else AudioSource.AUTO
-        self._audio_capture = AudioCapture(audio_source=audio_source)
-
-        # Initialize worker to None (set in _setup_backend)
-        self._worker = None
-
-        # Set up backend from registry
-        self._setup_backend()
+        self._ptt_modifiers = int(DEFAULT_PTT_MODIFIERS)
+        self._locale = "en_US"
+        self._audio_source = AudioSource.AUTO
+        if settings:
+            self._load_settings(settings)
+        # Cached for do_process_key_event(), which runs on every keystroke
+        self._is_ptt_mode = self._record_mode == RecordMode.PUSH_TO_TALK
+
+        # Audio capture and transcription worker.  The backend model and the
+        # audio pipeline are heavyweight, so the factory creates them once
+        # and hands the same instances to every engine it creates.
+        if audio_capture is None:
+            audio_capture = AudioCapture(audio_source=self._audio_source)
+        self._audio_capture = audio_capture
+        self._audio_owner = audio_owner
+        self._audio_in_use = False  # Between do_enable() and do_disable()
+        self._worker = worker
+        self._worker_start_id: int = 0
+
+        # Pending coalesced panel update (see _schedule_ui_update)
+        self._ui_update_id: int = 0
 
         # Global hotkey listener (XDG Desktop Portal)
         self._global_hotkey = GlobalHotkeyListener(
@@ -146,12 +238,24 @@ class Speak2TypeEngine(IBus.Engine):
             accelerator=self._get_accelerator_string(),
         )
 
-        # Listen for hotkey setting changes
-        if self._settings:
-            self._settings.connect("changed::ptt-hotkey", self._on_hotkey_changed)
-
-        # Properties for IBus panel
+        # Listen for setting changes
+        # (disconnected in do_destroy, the settings object outlives engines)
+        self._settings_handlers: list[int] = []
+        if settings:
+            self._settings_handlers = [
+                settings.connect("changed::ptt-hotkey", self._on_hotkey_changed),
+                settings.connect("changed::record-mode", self._on_record_mode_changed),
+                settings.connect("changed::locale", self._on_locale_changed),
+            ]
+
+        # Properties for IBus panel.  ibus-daemon only forwards them to the
+        # panel for the focused context, so they are registered on every
+        # focus-in, but only once while the same context keeps focus.  The
+        # toggle-recording property is a single object mutated in place on
+        # state changes; update_property() serializes its current fields.
+        self._toggle_prop = self._create_toggle_property(EngineState.IDLE)
         self._prop_list = self._create_properties()
+        self._props_registered_for_client = False
 
         # Pending text for commit
         self._pending_text = ""
@@ -176,51 +280,13 @@ class Speak2TypeEngine(IBus.Engine):
 
         LOG.info("Speak2TypeEngine created")
 
-    def _setup_backend(self) -> None:
-        """Set up the speech recognition backend and worker thread.
-
-        If no backend is available (e.g. fresh install before the user
-        configures one via preferences), the engine starts without a
-        backend.  Dictation attempts will show a guidance message instead
-        of silently producing placeholder text.
-
-        See .aisteering/policy-exceptions.md — ENGINE_NO_BACKEND.
-        """
-        # Register default backends
-        register_default_backends()
-
-        # Get configured backend from settings (default to parakeet)
-        backend_id = "parakeet"
-        if self._settings:
-            backend_id = self._settings.get_string("backend") or "parakeet"
-        registry = get_registry()
-
-        # Try to activate the configured backend
-        if not registry.set_current(backend_id):
-            available = [b for b in registry.available_backends if b != "placeholder"]
-            if available:
-                # A different backend is available — try the first one
-                registry.set_current(available[0])
-                LOG.warning(
-                    "Configured backend '%s' not available, using '%s'",
-                    backend_id, available[0],
-                )
-            else:
-                LOG.warning(
-                    "No speech recognition backend installed. "
-                    "Open speak2type settings to install one."
-                )
-                return
-
-        backend = registry.current
-        LOG.info("Using backend: %s (%s)", backend.id, backend.name)
-
-        # Create worker thread with the backend
-        self._worker = TranscriptionWorker(
-            backend=backend,
-            on_result=self._on_transcription_result,
-            on_error=self._on_transcription_error,
-        )
+    def _start_worker(self) -> bool:
+        """GLib idle callback — start the worker thread after do_enable()."""
+        self._worker_start_id = 0
+        # The worker is shared, another engine may have started it already
+        if self._worker and not self._worker.is_running:
+            self._worker.start()
+        return GLib.SOURCE_REMOVE
 
     def _on_transcription_error(self, error: Exception) -> None:
         """Handle transcription error (called in main loop)."""
@@ -228,26 +294,27 @@ class Speak2TypeEngine(IBus.Engine):
 
         # Clear preedit (only relevant in IBus-aware apps)
         if self._has_real_focus:
-            self.update_preedit_text(
-                IBus.Text.new_from_string(""),
-                0,
-                False,
-            )
+            self.update_preedit_text(self._TEXT_EMPTY, 0, False)
 
         self._transition_to(EngineState.IDLE)
 
-    def _load_settings(self) -> None:
-        """Load settings from GSettings."""
+    def _load_settings(self, settings: Gio.Settings) -> None:
+        """Load settings from GSettings.
+
+        Args:
+            settings: The shared settings object.
+        """
         try:
-            mode = self._settings.get_string("record-mode")
+            mode = settings.get_string("record-mode")
             if mode:
                 self._record_mode = RecordMode(mode)
         except Exception as e:
             LOG.warning("Failed to load record-mode setting: %s", e)
 
         try:
-            hotkey = self._settings.get_string("ptt-hotkey")
+            hotkey = settings.get_string("ptt-hotkey")
             if hotkey and hotkey != "None":
+                self._ptt_accel = hotkey
                 self._ptt_keyval, self._ptt_modifiers = parse_accelerator(hotkey)
                 LOG.info(
                     "PTT hotkey: '%s' -> keyval=%d, modifiers=%d",
@@ -256,21 +323,46 @@ class Speak2TypeEngine(IBus.Engine):
         except Exception as e:
             LOG.warning("Failed to load ptt-hotkey setting: %s", e)
 
+        self._locale = settings.get_string("locale") or "en_US"
+
+        try:
+            source = settings.get_string("audio-source")
+            if source:
+                self._audio_source = AudioSource(source)
+        except Exception as e:
+            LOG.warning("Failed to load audio-source setting: %s", e)
+
+    def _on_record_mode_changed(self, settings: Gio.Settings, key: str) -> None:
+        """Handle record-mode change from settings."""
+        try:
+            self._record_mode = RecordMode(settings.get_string(key))
+        except ValueError as e:
+            LOG.warning("Invalid record-mode setting: %s", e)
+            return
+        self._is_ptt_mode = self._record_mode == RecordMode.PUSH_TO_TALK
+        LOG.info("Record mode updated: %s", self._record_mode.value)
+
+    def _on_locale_changed(self, settings: Gio.Settings, key: str) -> None:
+        """Handle locale change from settings."""
+        self._locale = settings.get_string(key) or "en_US"
+
+    def _create_toggle_property(self, state: EngineState) -> IBus.Property:
+        """Create the toggle-recording property as shown in a given state."""
+        return IBus.Property(
+            key="toggle-recording",
+            label=self._PROP_LABELS[state],
+            icon="audio-input-microphone",
+            type=IBus.PropType.TOGGLE,
+            state=self._PROP_STATES[state],
+            tooltip=IBus.Text.new_from_string("Toggle speech recognition"),
+        )
+
     def _create_properties(self) -> IBus.PropList:
         """Create IBus properties for the panel."""
         props = IBus.PropList()
 
         # Toggle recording button
-        props.append(
-            IBus.Property(
-                key="toggle-recording",
-                label=IBus.Text.new_from_string("Recognition off"),
-                icon="audio-input-microphone",
-                type=IBus.PropType.TOGGLE,
-                state=IBus.PropState.UNCHECKED,
-                tooltip=IBus.Text.new_from_string("Toggle speech recognition"),
-            )
-        )
+        props.append(self._toggle_prop)
 
         # Mode indicator
         props.append(
@@ -284,34 +376,46 @@ class Speak2TypeEngine(IBus.Engine):
 
         return props
 
+    def _register_properties(self) -> None:
+        """Register the panel properties unless already done since focus-in."""
+        if not self._props_registered_for_client:
+            self.register_properties(self._prop_list)
+            self._props_registered_for_client = True
+
+    def _schedule_ui_update(self) -> None:
+        """Request a panel update, coalescing bursts into one per idle turn.
+
+        Several transitions often fire within a single main-loop iteration
+        (e.g. content-type change followed by a state change); each used to
+        issue its own update_property D-Bus call.
+        """
+        if not self._ui_update_id:
+            self._ui_update_id = GLib.idle_add(
+                self._flush_ui_update, priority=GLib.PRIORITY_DEFAULT_IDLE
+            )
+
+    def _flush_ui_update(self) -> bool:
+        """GLib idle callback — push the current state to the panel once."""
+        self._ui_update_id = 0
+        self._update_state_ui()
+        return GLib.SOURCE_REMOVE
+
     def _update_state_ui(self) -> None:
         """Update UI to reflect current state."""
-        if self._state == EngineState.RECORDING:
-            label = "Recording..."
-            state = IBus.PropState.CHECKED
-        elif self._state == EngineState.TRANSCRIBING:
-            label = "Transcribing..."
-            state = IBus.PropState.CHECKED
-        else:
-            label = "Recognition off"
-            state = IBus.PropState.UNCHECKED
-
-        prop = IBus.Property(
-            key="toggle-recording",
-            label=IBus.Text.new_from_string(label),
-            icon="audio-input-microphone",
-            type=IBus.PropType.TOGGLE,
-            state=state,
-            sensitive=not self._recording_disabled,
-        )
+        prop = self._toggle_prop
+        prop.set_label(self._PROP_LABELS[self._state])
+        prop.set_state(self._PROP_STATES[self._state])
+        prop.set_sensitive(not self._recording_disabled)
         self.update_property(prop)
 
     def _transition_to(self, new_state: EngineState) -> None:
         """Transition to a new state."""
         old_state = self._state
         self._state = new_state
-        LOG.debug("State transition: %s -> %s", old_state.name, new_state.name)
-        self._update_state_ui()
+        # Skip the enum .name lookups unless debug logging is on
+        if LOG.isEnabledFor(logging.DEBUG):
+            LOG.debug("State transition: %s -> %s", old_state.name, new_state.name)
+        self._schedule_ui_update()
 
     def _start_recording(self) -> bool:
         """Start recording audio.
@@ -327,8 +431,24 @@ class Speak2TypeEngine(IBus.Engine):
             LOG.info("Recording disabled (privacy mode)")
             return False
 
-        # Ensure audio capture is set up (only once, not every recording)
+        # Back-pressure: refuse to record more utterances than the worker
+        # will hold while the backend is still catching up
+        if self._worker and self._worker.pending_count() >= self._worker.max_pending:
+            LOG.warning(
+                "Transcription backlog full (%d pending), not recording",
+                self._worker.pending_count(),
+            )
+            if self._has_real_focus:
+                self.update_preedit_text(self._TEXT_BUSY, 0, True)
+                GLib.timeout_add(1500, self._clear_error_preedit)
+            return False
+
+        # Audio capture is normally opened in the background by do_enable()
         if not self._audio_capture.is_setup:
+            if self._audio_capture.is_setting_up:
+                LOG.info("Audio capture still initializing, ignoring PTT")
+                return False
+            # Background setup failed or never ran: set up synchronously
             if not self._audio_capture.setup(on_error=self._on_audio_error):
                 LOG.error("Failed to set up audio capture")
                 return False
@@ -343,11 +463,7 @@ class Speak2TypeEngine(IBus.Engine):
 
         # Show recording indicator (only visible in IBus-aware apps)
         if self._has_real_focus:
-            self.update_preedit_text(
-                IBus.Text.new_from_string("🎙️ Recording..."),
-                0,
-                True,
-            )
+            self.update_preedit_text(self._TEXT_RECORDING, 0, True)
 
         return True
 
@@ -360,64 +476,56 @@ class Speak2TypeEngine(IBus.Engine):
         # Stop audio capture and get segment
         segment = self._audio_capture.stop()
 
-        # Clear preedit (only relevant in IBus-aware apps)
-        if self._has_real_focus:
-            self.update_preedit_text(
-                IBus.Text.new_from_string(""),
-                0,
-                False,
-            )
-
         if segment is None or segment.duration_ms < 200:
             LOG.info("No audio or too short, returning to idle")
+            # Clear preedit (only relevant in IBus-aware apps)
+            if self._has_real_focus:
+                self.update_preedit_text(self._TEXT_EMPTY, 0, False)
             self._transition_to(EngineState.IDLE)
             return
 
         self._transition_to(EngineState.TRANSCRIBING)
 
-        # Show transcribing indicator (only visible in IBus-aware apps)
-        if self._has_real_focus:
-            self.update_preedit_text(
-                IBus.Text.new_from_string("⏳ Transcribing..."),
-                0,
-                True,
-            )
-
-        # Submit to worker
+        # Submit to worker first so transcription starts as early as
+        # possible.  The recording indicator is then replaced by a single
+        # preedit update rather than cleared and set again.
         if self._worker:
-            locale = "en_US"
-            if self._settings:
-                locale = self._settings.get_string("locale") or "en_US"
-            self._worker.submit(segment, locale_hint=locale)
+            self._worker.submit(
+                segment,
+                locale_hint=self._locale,
+                on_result=self._on_transcription_result,
+                on_error=self._on_transcription_error,
+            )
+            # Show transcribing indicator (only visible in IBus-aware apps)
+            if self._has_real_focus:
+                self.update_preedit_text(self._TEXT_TRANSCRIBING, 0, True)
         else:
             LOG.error("No backend installed — open speak2type settings to configure one")
-            self.update_preedit_text(
-                IBus.Text.new_from_string("No backend — open speak2type settings"),
-                0,
-                True,
-            )
+            self.update_preedit_text(self._TEXT_NO_BACKEND, 0, True)
             GLib.timeout_add(3000, self._clear_no_backend_message)
 
+    def _abort_recording(self) -> None:
+        """Discard an in-progress recording and return to idle."""
+        if self._state == EngineState.RECORDING:
+            self._audio_capture.stop(abort=True)
+            self._transition_to(EngineState.IDLE)
+
     def _clear_no_backend_message(self) -> bool:
         """Clear the 'no backend' preedit message and return to idle."""
-        self.update_preedit_text(IBus.Text.new_from_string(""), 0, False)
+        self.update_preedit_text(self._TEXT_EMPTY, 0, False)
         self._transition_to(EngineState.IDLE)
         return GLib.SOURCE_REMOVE
 
     def _clear_error_preedit(self) -> bool:
         """Clear an error preedit message after timeout."""
-        self.update_preedit_text(IBus.Text.new_from_string(""), 0, False)
+        self.update_preedit_text(self._TEXT_EMPTY, 0, False)
         return GLib.SOURCE_REMOVE
 
     def _on_transcription_result(self, result: TranscriptResult) -> None:
         """Handle transcription result (called in main loop)."""
         # Clear preedit (only relevant in IBus-aware apps)
         if self._has_real_focus:
-            self.update_preedit_text(
-                IBus.Text.new_from_string(""),
-                0,
-                False,
-            )
+            self.update_preedit_text(self._TEXT_EMPTY, 0, False)
 
         if result.error:
             LOG.error("Transcription failed: %s", result.error)
@@ -444,30 +552,43 @@ class Speak2TypeEngine(IBus.Engine):
     def _copy_to_clipboard(self, text: str) -> None:
         """Copy text to the system clipboard.
 
-        On Wayland, wl-copy stays resident to serve the clipboard content.
-        We use Popen (fire-and-forget) so it does not block the main loop.
+        Every tool in _CLIPBOARD_COMMANDS reads the text from stdin, so long
+        dictations never hit ARG_MAX.  wl-copy stays resident to serve the
+        clipboard, so it is started fire-and-forget.  xclip exits once its
+        forked child owns the selection; it is waited for (and reaped), so
+        a paste that follows never sees the previous clipboard content.
         """
         session_type = os.environ.get("XDG_SESSION_TYPE", "")
 
+        tool = next(
+            (
+                (cmd, wait)
+                for session, cmd, wait in _CLIPBOARD_COMMANDS
+                if session in (None, session_type) and shutil.which(cmd[0])
+            ),
+            None,
+        )
+        if tool is None:
+            LOG.error("No clipboard tool found (install wl-clipboard or xclip)")
+            return
+        cmd, wait = tool
+
         try:
-            if session_type == "wayland" and shutil.which("wl-copy"):
-                # wl-copy stays alive to serve clipboard; don't wait for it.
-                subprocess.Popen(
-                    ["wl-copy", "--", text],
-                    stdin=subprocess.DEVNULL,
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.DEVNULL,
-                )
-            elif shutil.which("xclip"):
-                subprocess.run(
-                    ["xclip", "-selection", "clipboard"],
-                    input=text,
-                    capture_output=True,
-                    text=True,
-                    timeout=2,
-                )
+            proc = subprocess.Popen(
+                cmd,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+            if wait:
+                proc.communicate(text.encode("utf-8"), timeout=2)
             else:
-                LOG.error("No clipboard tool found (install wl-clipboard or xclip)")
+                proc.stdin.write(text.encode("utf-8"))
+                proc.stdin.close()
+        except subprocess.TimeoutExpired:
+            LOG.error("Clipboard copy timed out: %s", cmd[0])
+            proc.kill()
+            proc.wait()
         except Exception as e:
             LOG.error("Clipboard copy error: %s", e)
 
@@ -567,17 +688,29 @@ class Speak2TypeEngine(IBus.Engine):
         LOG.error("Audio error: %s", error)
         self._transition_to(EngineState.IDLE)
 
+    def _post_audio_error(self, error: str) -> None:
+        """Marshal an audio capture error onto the main loop."""
+        GLib.idle_add(self._on_audio_error, error)
+
+    def _start_audio_setup(self) -> None:
+        """Set up audio capture on a background thread."""
+        self._audio_capture.setup_async(
+            on_error=self._post_audio_error,
+            on_done=self._on_audio_setup_done,
+        )
+
+    def _on_audio_setup_done(self, ok: bool) -> None:
+        """Handle the end of background audio setup (called in main loop)."""
+        if not ok:
+            LOG.error("Failed to set up audio capture")
+
     # ------------------------------------------------------------------
     # Global hotkey (XDG Desktop Portal) callbacks
     # ------------------------------------------------------------------
 
     def _get_accelerator_string(self) -> str:
         """Get the PTT hotkey as a GTK accelerator string from settings."""
-        if self._settings:
-            accel = self._settings.get_string("ptt-hotkey")
-            if accel and accel != "None":
-                return accel
-        return "<Alt>space"
+        return self._ptt_accel
 
     def _on_global_ptt_press(self) -> None:
         """Handle global PTT key press (from portal)."""
@@ -627,30 +760,11 @@ class Speak2TypeEngine(IBus.Engine):
         """Handle PTT hotkey change from settings."""
         accel = settings.get_string(key)
         if accel and accel != "None":
+            self._ptt_accel = accel
             self._ptt_keyval, self._ptt_modifiers = parse_accelerator(accel)
             self._global_hotkey.update_shortcut(accel)
             LOG.info("PTT hotkey updated: %s", accel)
 
-    def _is_ptt_key(self, keyval: int, modifiers: int) -> bool:
-        """Check if the key event matches the push-to-talk hotkey.
-
-        Args:
-            keyval: Key value from IBus.
-            modifiers: Modifier mask from IBus.
-
-        Returns:
-            True if this is the PTT key.
-        """
-        # Mask out release and other irrelevant modifiers
-        relevant_mods = modifiers & (
-            IBus.ModifierType.SHIFT_MASK
-            | IBus.ModifierType.CONTROL_MASK
-            | IBus.ModifierType.MOD1_MASK  # Alt
-            | IBus.ModifierType.MOD4_MASK  # Super
-        )
-
-        return keyval == self._ptt_keyval and relevant_mods == self._ptt_modifiers
-
     # IBus Engine overrides
 
     def do_process_key_event(
@@ -666,30 +780,39 @@ class Speak2TypeEngine(IBus.Engine):
         Returns:
             True if the key event was handled.
         """
-        is_release = bool(state & IBus.ModifierType.RELEASE_MASK)
-        LOG.debug("KEY EVENT: keyval=%d (%s), keycode=%d, state=%d, release=%s",
-                  keyval, IBus.keyval_name(keyval), keycode, state, is_release)
+        # Password/PIN field: recording is impossible, so pass everything
+        # through.  A PTT session begun before the field was focused still
+        # has to see its key release, so only short-circuit once it has.
+        if self._recording_disabled and self._ptt_key_physically_released:
+            return False
+
+        is_release = bool(state & _RELEASE_MASK)
+        # Runs on every keystroke: only pay for keyval_name() and the
+        # modifier masking when debug logging is actually enabled.
+        if LOG.isEnabledFor(logging.DEBUG):
+            LOG.debug("KEY EVENT: keyval=%d (%s), keycode=%d, state=%d, release=%s",
+                      keyval, IBus.keyval_name(keyval), keycode, state, is_release)
+            LOG.debug("PTT check: keyval=%d (want %d), mods=%d (want %d), state=%s",
+                      keyval, self._ptt_keyval, state & _PTT_RELEVANT_MASK,
+                      self._ptt_modifiers, self._state)
+
+        # Everything below concerns the PTT keyval only; any other key is
+        # passed through after a single integer compare.
+        if keyval != self._ptt_keyval:
+            return False
 
         # Check for push-to-talk hotkey
-        relevant_mods = state & (
-            IBus.ModifierType.SHIFT_MASK
-            | IBus.ModifierType.CONTROL_MASK
-            | IBus.ModifierType.MOD1_MASK  # Alt
-            | IBus.ModifierType.MOD4_MASK  # Super
-        )
-        LOG.debug("PTT check: keyval=%d (want %d), mods=%d (want %d), state=%s",
-                  keyval, self._ptt_keyval, relevant_mods, self._ptt_modifiers, self._state)
-        if self._record_mode == RecordMode.PUSH_TO_TALK:
+        if self._is_ptt_mode:
             # ---------------------------------------------------------
             # Absorb bare PTT key events after PTT deactivation.
             #
             # When the user releases the modifier (Ctrl) before the key
             # (Space), keyboard auto-repeat keeps firing Space *without*
             # the modifier.  Without this guard those bare-space events
-            # slip past _is_ptt_key() and flood the app.  We consume
+            # slip past the PTT combo check and flood the app.  We consume
             # every event for the PTT keyval until its physical release.
             # ---------------------------------------------------------
-            if self._absorb_ptt_key and keyval == self._ptt_keyval:
+            if self._absorb_ptt_key:
                 if is_release:
                     self._absorb_ptt_key = False
                     self._ptt_key_physically_released = True
@@ -709,7 +832,8 @@ class Speak2TypeEngine(IBus.Engine):
                 return True
 
             # Check for PTT activation (press with correct modifiers)
-            if not is_release and self._is_ptt_key(keyval, state):
+            # (release and other irrelevant modifier bits are masked out)
+            if not is_release and (state & _PTT_RELEVANT_MASK) == self._ptt_modifiers:
                 # Key pressed - start recording or consume repeat
                 if self._state == EngineState.IDLE:
                     if not self._ptt_key_physically_released:
@@ -732,7 +856,7 @@ class Speak2TypeEngine(IBus.Engine):
 
             # Check for PTT release - only need keyval match (modifiers may differ)
             # User often releases Alt before Space, so we can't require modifier match
-            if is_release and keyval == self._ptt_keyval and self._ptt_active:
+            if is_release and self._ptt_active:
                 LOG.debug("PTT released (keyval match, ptt_active=True)")
                 self._ptt_active = False
                 self._ptt_source = None
@@ -747,7 +871,7 @@ class Speak2TypeEngine(IBus.Engine):
         # Track physical release of the PTT key even when no guard is active.
         # After the absorb timeout expires with the key still held, we need
         # to see a release before allowing the next PTT activation.
-        if is_release and keyval == self._ptt_keyval and not self._ptt_key_physically_released:
+        if is_release and not self._ptt_key_physically_released:
             self._ptt_key_physically_released = True
             LOG.debug("PTT key physical release detected (post-timeout)")
 
@@ -763,43 +887,43 @@ class Speak2TypeEngine(IBus.Engine):
             purpose: IBus.InputPurpose value.
             hints: IBus.InputHints value.
         """
-        # Check for sensitive input types
-        sensitive_purposes = {
-            IBus.InputPurpose.PASSWORD,
-            IBus.InputPurpose.PIN,
-        }
+        recording_disabled = purpose in _SENSITIVE_PURPOSES
+        # Most focus changes move between ordinary fields; nothing to do then
+        if recording_disabled == self._recording_disabled:
+            return
+        self._recording_disabled = recording_disabled
 
-        if purpose in sensitive_purposes:
+        if recording_disabled:
             LOG.info("Privacy mode: recording disabled (purpose=%d)", purpose)
-            self._recording_disabled = True
 
             # Stop any ongoing recording
-            if self._state == EngineState.RECORDING:
-                self._audio_capture.stop()
-                self._transition_to(EngineState.IDLE)
-        else:
-            self._recording_disabled = False
+            self._abort_recording()
 
-        self._update_state_ui()
+        self._schedule_ui_update()
 
     def do_enable(self) -> None:
         """Called when the engine is enabled."""
         LOG.info("Engine enabled")
 
-        # Set up audio capture
-        self._audio_capture.setup(on_error=self._on_audio_error)
+        # Open the audio device on a background thread so enabling the
+        # engine never blocks on PipeWire/PulseAudio.
+        if not self._audio_in_use:
+            self._audio_in_use = True
+            if self._audio_owner:
+                self._audio_owner.acquire_audio()
+        self._start_audio_setup()
 
-        # Start worker thread
-        if self._worker:
-            self._worker.start()
+        # Start worker thread once control has returned to IBus
+        if self._worker and not self._worker_start_id:
+            self._worker_start_id = GLib.idle_add(self._start_worker)
 
         # Set up global hotkey (portal-based, for non-IBus apps)
         if not self._global_hotkey.setup():
             LOG.warning("Global hotkey not available (portal missing?)")
 
         # Register properties
-        self.register_properties(self._prop_list)
-        self._update_state_ui()
+        self._register_properties()
+        self._schedule_ui_update()
 
     def do_disable(self) -> None:
         """Called when the engine is disabled."""
@@ -811,53 +935,61 @@ class Speak2TypeEngine(IBus.Engine):
 
         # Stop any ongoing recording
         if self._state == EngineState.RECORDING:
-            self._audio_capture.stop()
+            self._audio_capture.stop(abort=True)
 
         self._transition_to(EngineState.IDLE)
 
-        # Tear down resources symmetrically with do_enable()
+        # Tear down resources symmetrically with do_enable().  The worker is
+        # shared with other engines and stays up (it idles at no cost).  A
+        # shared microphone is released by its owner once the last engine
+        # using it is disabled, so it is never held open while disabled.
+        if self._worker_start_id:
+            GLib.source_remove(self._worker_start_id)
+            self._worker_start_id = 0
         self._global_hotkey.teardown()
-        if self._worker:
-            self._worker.stop()
-        self._audio_capture.destroy()
+        if self._audio_in_use:
+            self._audio_in_use = False
+            if self._audio_owner:
+                self._audio_owner.release_audio()
+            else:
+                self._audio_capture.destroy()
+        self._props_registered_for_client = False
 
     def do_focus_in(self) -> None:
         """Called when focus enters an input context."""
         LOG.info("FOCUS IN - IBus-aware app has focus")
         self._has_real_focus = True
-        self.register_properties(self._prop_list)
-        self._update_state_ui()
+        self._register_properties()
+        self._schedule_ui_update()
 
     def do_focus_out(self) -> None:
         """Called when focus leaves an input context."""
         LOG.info("FOCUS OUT - lost focus")
         self._has_real_focus = False
+        self._props_registered_for_client = False
 
         # Only cancel IBus-triggered recordings on focus loss;
         # global-hotkey recordings should survive focus changes.
         if self._ptt_source != "global":
             self._ptt_active = False
-            if self._state == EngineState.RECORDING:
-                self._audio_capture.stop()
-                self._transition_to(EngineState.IDLE)
+            self._abort_recording()
 
     def do_focus_in_id(self, object_path: str, client: str) -> None:
         """Called when focus enters with client info (Wayland)."""
         LOG.info("FOCUS IN ID: path=%s, client=%s", object_path, client)
         self._has_real_focus = client != "fake"
-        self.register_properties(self._prop_list)
-        self._update_state_ui()
+        self._register_properties()
+        self._schedule_ui_update()
 
     def do_focus_out_id(self, object_path: str) -> None:
         """Called when focus leaves with path info (Wayland)."""
         LOG.info("FOCUS OUT ID: path=%s", object_path)
         self._has_real_focus = False
+        self._props_registered_for_client = False
         # Only cancel IBus-triggered recordings on focus loss
         if self._ptt_source != "global":
             self._ptt_active = False
-            if self._state == EngineState.RECORDING:
-                self._audio_capture.stop()
-                self._transition_to(EngineState.IDLE)
+            self._abort_recording()
 
     def do_reset(self) -> None:
         """Called to reset the engine state."""
@@ -866,9 +998,7 @@ class Speak2TypeEngine(IBus.Engine):
         # Only cancel IBus-triggered recordings on reset
         if self._ptt_source != "global":
             self._ptt_active = False
-            if self._state == EngineState.RECORDING:
-                self._audio_capture.stop()
-                self._transition_to(EngineState.IDLE)
+            self._abort_recording()
 
     def do_property_activate(self, prop_name: str, state: int) -> None:
         """Handle property activation from the panel.
@@ -891,12 +1021,21 @@ class Speak2TypeEngine(IBus.Engine):
         """Clean up resources."""
         LOG.info("Engine destroying")
 
+        if self._worker_start_id:
+            GLib.source_remove(self._worker_start_id)
+            self._worker_start_id = 0
+        if self._ui_update_id:
+            GLib.source_remove(self._ui_update_id)
+            self._ui_update_id = 0
         self._global_hotkey.teardown()
 
-        if self._worker:
-            self._worker.stop()
+        settings = self._get_settings()
+        for handler_id in self._settings_handlers:
+            settings.disconnect(handler_id)
+        self._settings_handlers = []
 
-        self._audio_capture.destroy()
+        # The worker and audio capture belong to the factory, which releases
+        # them at process exit (see Speak2TypeEngineFactory.shutdown).
 
         IBus.Engine.do_destroy(self)
 
@@ -921,6 +1060,90 @@ class Speak2TypeEngineFactory(IBus.Factory):
         )
         LOG.info("Engine factory created at %s", IBus.PATH_FACTORY)
 
+        # Resources shared by every engine this factory creates
+        settings = Speak2TypeEngine._get_settings()
+        audio_source = AudioSource.AUTO
+        if settings:
+            try:
+                audio_source = AudioSource(settings.get_string("audio-source") or "auto")
+            except ValueError as e:
+                LOG.warning("Failed to load audio-source setting: %s", e)
+        self._audio_capture = AudioCapture(audio_source=audio_source)
+        self._audio_users = 0  # Enabled engines using the audio capture
+        self._worker = self._setup_backend(settings)
+
+    def _setup_backend(self, settings: Gio.Settings | None) -> TranscriptionWorker | None:
+        """Set up the speech recognition backend and worker thread.
+
+        If no backend is available (e.g. fresh install before the user
+        configures one via preferences), the engine starts without a
+        backend.  Dictation attempts will show a guidance message instead
+        of silently producing placeholder text.
+
+        See .aisteering/policy-exceptions.md — ENGINE_NO_BACKEND.
+
+        Args:
+            settings: Engine settings, or None to use defaults.
+
+        Returns:
+            The worker, or None if no backend is available.
+        """
+        # Configured backend from settings (default to parakeet)
+        backend_id = "parakeet"
+        preload = False
+        if settings:
+            backend_id = settings.get_string("backend") or backend_id
+            preload = settings.get_boolean("preload")
+        registry = get_registry()
+
+        # Try to activate the configured backend
+        if not registry.set_current(backend_id):
+            available = [b for b in registry.available_backends if b != "placeholder"]
+            if available:
+                # A different backend is available — try the first one
+                registry.set_current(available[0])
+                LOG.warning(
+                    "Configured backend '%s' not available, using '%s'",
+                    backend_id, available[0],
+                )
+            else:
+                LOG.warning(
+                    "No speech recognition backend installed. "
+                    "Open speak2type settings to install one."
+                )
+                return None
+
+        backend = registry.current
+        LOG.info("Using backend: %s (%s)", backend.id, backend.name)
+
+        # Create worker thread with the backend.  The worker parks on its job
+        # queue while idle (no polling), so keeping it running costs no CPU.
+        # Engines pass their own result callbacks with each job.
+        return TranscriptionWorker(
+            backend=backend,
+            prewarm=preload,
+            max_pending=4,
+        )
+
+    def acquire_audio(self) -> None:
+        """Record that an enabled engine is using the shared audio capture."""
+        self._audio_users += 1
+
+    def release_audio(self) -> None:
+        """Record that an engine stopped using the shared audio capture.
+
+        The microphone is released when the last enabled engine is disabled.
+        """
+        self._audio_users = max(0, self._audio_users - 1)
+        if self._audio_users == 0:
+            self._audio_capture.destroy()
+
+    def shutdown(self) -> None:
+        """Release the shared worker and audio capture at process exit."""
+        if self._worker:
+            self._worker.stop(timeout=0.5)
+        self._audio_capture.destroy()
+
     def do_create_engine(self, engine_name: str) -> IBus.Engine | None:
         """Create a new engine instance.
 
@@ -931,24 +1154,27 @@ class Speak2TypeEngineFactory(IBus.Factory):
             New engine instance or None.
         """
         LOG.info("Creating engine for: %s", engine_name)
-        if engine_name != "speak2type":
+        if engine_name != _ENGINE_NAME:
             LOG.warning("Unknown engine name: %s, delegating to parent", engine_name)
             return super().do_create_engine(engine_name)
 
-        engine = Speak2TypeEngine(self._bus, "/org/freedesktop/IBus/speak2type")
+        engine = Speak2TypeEngine(
+            self._bus,
+            _ENGINE_OBJECT_PATH,
+            worker=self._worker,
+            audio_capture=self._audio_capture,
+            audio_owner=self,
+        )
         self._current_engine = engine
-        LOG.info("Created engine at /org/freedesktop/IBus/speak2type")
+        LOG.info("Created engine at %s", _ENGINE_OBJECT_PATH)
         return engine
 
 
 def _get_log_level_from_settings() -> int:
     """Read log level from GSettings, defaulting to WARNING."""
     try:
-        schema_source = Gio.SettingsSchemaSource.get_default()
-        if schema_source and schema_source.lookup(
-            "org.freedesktop.ibus.engine.stt", True
-        ):
-            settings = Gio.Settings.new("org.freedesktop.ibus.engine.stt")
+        settings = Speak2TypeEngine._get_settings()
+        if settings:
             level_str = settings.get_string("log-level").upper()
             return getattr(logging, level_str, logging.WARNING)
     except Exception:
@@ -985,10 +1211,16 @@ def main() -> int:
         LOG.error("Cannot connect to IBus")
         return 1
 
+    # Populate the backend registry once per process, before the factory
+    # picks the configured backend
+    register_default_backends()
+
     # Create factory FIRST - must be done before request_name
     factory = Speak2TypeEngineFactory(bus)
-    # Register the engine type with the factory
-    factory.add_engine("speak2type", GObject.type_from_name("Speak2TypeEngine"))
+    # Register the engine type with the factory.  This happens exactly once
+    # per process; the class already carries its GType, so no name lookup
+    # in the GObject type table is needed.
+    factory.add_engine(_ENGINE_NAME, Speak2TypeEngine.__gtype__)
     LOG.info("Factory and engine type registered")
 
     # Different initialization based on how we were started
@@ -1035,6 +1267,8 @@ def main() -> int:
     except KeyboardInterrupt:
         pass
 
+    factory.shutdown()
+
     LOG.info("speak2type engine exiting")
     return 0
 
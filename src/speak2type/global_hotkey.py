@@ -39,6 +39,12 @@ _PROVIDER_BUS_NAME = "org.gnome.Settings.GlobalShortcutsProvider"
 _PROVIDER_OBJECT_PATH = "/org/gnome/Settings/GlobalShortcutsProvider"
 _PROVIDER_IFACE = "org.gnome.Settings.GlobalShortcutsProvider"
 
+_SHORTCUT_DESCRIPTION = "Push-to-talk for speech recognition"
+
+# GVariant types used on every portal call/signal, parsed once
+_VT_STRING = GLib.VariantType.new("s")
+_VT_RESULT_TUPLE = GLib.VariantType.new("(o)")
+
 _PROVIDER_IFACE_XML = """
 <node>
   <interface name="org.gnome.Settings.GlobalShortcutsProvider">
@@ -53,6 +59,14 @@ _PROVIDER_IFACE_XML = """
 """
 
 
+def _is_gnome_session() -> bool:
+    """Return whether the desktop session is GNOME (or GNOME-based)."""
+    desktops = os.environ.get("XDG_CURRENT_DESKTOP") or os.environ.get(
+        "XDG_SESSION_DESKTOP", ""
+    )
+    return "gnome" in desktops.lower().split(":")
+
+
 class GlobalHotkeyListener:
     """Listens for a global PTT hotkey via the XDG Desktop Portal.
 
@@ -78,6 +92,18 @@ class GlobalHotkeyListener:
         self._provider_reg_id: int = 0
         self._provider_name_id: int = 0
 
+        # Cancels in-flight portal calls on teardown()
+        self._cancellable: Gio.Cancellable | None = None
+
+        # Static parts of the BindShortcuts arguments, built once; a rebind
+        # only creates the preferred_trigger Variant and the outer tuple.
+        self._bind_token = f"speak2type_bs_{os.getpid()}"
+        self._shortcut_description = GLib.Variant("s", _SHORTCUT_DESCRIPTION)
+        self._bind_parent_window = GLib.Variant("s", "")
+        self._bind_options = GLib.Variant(
+            "a{sv}", {"handle_token": GLib.Variant("s", self._bind_token)}
+        )
+
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
@@ -85,11 +111,11 @@ class GlobalHotkeyListener:
     def setup(self) -> bool:
         """Begin the async portal session setup.
 
-        Returns True if the CreateSession D-Bus call was dispatched
-        successfully. The actual session and shortcut binding happen
-        asynchronously via callbacks on the GLib main loop. Returns
-        False if the portal is clearly unavailable (no session bus,
-        D-Bus call error).
+        Returns True if the CreateSession D-Bus call was dispatched. The
+        actual session and shortcut binding happen asynchronously via
+        callbacks on the GLib main loop; a portal that turns out to be
+        missing is logged and torn down from there. Returns False if
+        there is no session bus.
         """
         try:
             self._bus = Gio.bus_get_sync(Gio.BusType.SESSION, None)
@@ -97,6 +123,7 @@ class GlobalHotkeyListener:
             LOG.warning("Cannot connect to session bus: %s", exc.message)
             return False
 
+        self._cancellable = Gio.Cancellable()
         unique = self._bus.get_unique_name()
         self._sender_token = unique.lstrip(":").replace(".", "_")
 
@@ -107,6 +134,10 @@ class GlobalHotkeyListener:
 
     def teardown(self) -> None:
         """Close the session and clean up D-Bus subscriptions."""
+        if self._cancellable:
+            self._cancellable.cancel()
+            self._cancellable = None
+
         for sid in self._signal_ids:
             if self._bus:
                 self._bus.signal_unsubscribe(sid)
@@ -149,7 +180,14 @@ class GlobalHotkeyListener:
         Non-sandboxed (host) processes have no automatic app_id. The
         portal's host.portal.Registry.Register associates our D-Bus
         connection with a .desktop file so the portal can identify us.
+
+        Only GNOME's portal backend needs this; elsewhere the blocking
+        call would just pay a D-Bus round trip to fail, so it is skipped.
         """
+        if not _is_gnome_session():
+            LOG.debug("Not a GNOME session, skipping host app registration")
+            return
+
         try:
             self._bus.call_sync(
                 _PORTAL_BUS_NAME,
@@ -230,10 +268,8 @@ class GlobalHotkeyListener:
             sid = entry.get_child_value(0).get_string()
             props = entry.get_child_value(1)
 
-            desc_v = props.lookup_value("description", GLib.VariantType("s"))
-            trigger_v = props.lookup_value(
-                "preferred_trigger", GLib.VariantType("s")
-            )
+            desc_v = props.lookup_value("description", _VT_STRING)
+            trigger_v = props.lookup_value("preferred_trigger", _VT_STRING)
             desc = desc_v.get_string() if desc_v else "Shortcut"
             trigger = trigger_v.get_string() if trigger_v else ""
 
@@ -279,32 +315,57 @@ class GlobalHotkeyListener:
         )
         self._signal_ids.append(sid)
 
-        try:
-            options = GLib.Variant(
-                "a{sv}",
-                {
-                    "handle_token": GLib.Variant("s", token_cs),
-                    "session_handle_token": GLib.Variant("s", token_session),
-                },
-            )
-            self._bus.call_sync(
-                _PORTAL_BUS_NAME,
-                _PORTAL_OBJECT_PATH,
-                _PORTAL_IFACE,
-                "CreateSession",
-                GLib.Variant.new_tuple(options),
-                GLib.VariantType.new("(o)"),
-                Gio.DBusCallFlags.NONE,
-                5000,
-                None,
-            )
-        except GLib.Error as exc:
-            LOG.warning("GlobalShortcuts portal unavailable: %s", exc.message)
-            return False
+        options = GLib.Variant(
+            "a{sv}",
+            {
+                "handle_token": GLib.Variant("s", token_cs),
+                "session_handle_token": GLib.Variant("s", token_session),
+            },
+        )
+        self._call_portal_async("CreateSession", GLib.Variant.new_tuple(options), 5000)
 
         LOG.debug("CreateSession dispatched, waiting for Response...")
         return True
 
+    def _call_portal_async(self, method: str, args: GLib.Variant, timeout_ms: int) -> None:
+        """Call a GlobalShortcuts portal method without blocking the main loop.
+
+        The reply only carries the Request object path; the real result
+        arrives in the Request's Response signal, so the completion
+        callback just checks for errors.
+        """
+        self._bus.call(
+            _PORTAL_BUS_NAME,
+            _PORTAL_OBJECT_PATH,
+            _PORTAL_IFACE,
+            method,
+            args,
+            _VT_RESULT_TUPLE,
+            Gio.DBusCallFlags.NONE,
+            timeout_ms,
+            self._cancellable,
+            self._on_portal_call_done,
+            method,
+        )
+
+    def _on_portal_call_done(
+        self,
+        connection: Gio.DBusConnection,
+        result: Gio.AsyncResult,
+        method: str,
+    ) -> None:
+        """Completion callback for _call_portal_async()."""
+        try:
+            connection.call_finish(result)
+        except GLib.Error as exc:
+            if exc.matches(Gio.io_error_quark(), Gio.IOErrorEnum.CANCELLED):
+                return
+            if method == "CreateSession":
+                LOG.warning("GlobalShortcuts portal unavailable: %s", exc.message)
+                self.teardown()
+            else:
+                LOG.error("%s call failed: %s", method, exc.message)
+
     def _on_create_session_response(
         self,
         connection: Gio.DBusConnection,
@@ -323,9 +384,7 @@ class GlobalHotkeyListener:
             return
 
         # Extract session handle from response data
-        sh_variant = response_data.lookup_value(
-            "session_handle", GLib.VariantType.new("s")
-        )
+        sh_variant = response_data.lookup_value("session_handle", _VT_STRING)
         if sh_variant:
             self._session_handle = sh_variant.get_string()
         else:
@@ -345,10 +404,9 @@ class GlobalHotkeyListener:
 
     def _bind_shortcuts_async(self, accelerator: str) -> None:
         """Dispatch BindShortcuts and subscribe to its Response."""
-        token_bs = f"speak2type_bs_{os.getpid()}"
         request_path = (
             f"/org/freedesktop/portal/desktop/request/"
-            f"{self._sender_token}/{token_bs}"
+            f"{self._sender_token}/{self._bind_token}"
         )
 
         sid = self._bus.signal_subscribe(
@@ -362,41 +420,22 @@ class GlobalHotkeyListener:
         )
         self._signal_ids.append(sid)
 
-        try:
-            shortcut_props = {
-                "description": GLib.Variant(
-                    "s", "Push-to-talk for speech recognition"
-                ),
-                "preferred_trigger": GLib.Variant("s", accelerator),
-            }
-
-            options = {
-                "handle_token": GLib.Variant("s", token_bs),
-            }
-
-            args = GLib.Variant(
-                "(oa(sa{sv})sa{sv})",
-                (
-                    self._session_handle,
-                    [(_SHORTCUT_ID, shortcut_props)],
-                    "",
-                    options,
-                ),
-            )
-            self._bus.call_sync(
-                _PORTAL_BUS_NAME,
-                _PORTAL_OBJECT_PATH,
-                _PORTAL_IFACE,
-                "BindShortcuts",
-                args,
-                GLib.VariantType.new("(o)"),
-                Gio.DBusCallFlags.NONE,
-                30000,
-                None,
-            )
-        except GLib.Error as exc:
-            LOG.error("BindShortcuts call failed: %s", exc.message)
-            return
+        shortcut_props = {
+            "description": self._shortcut_description,
+            "preferred_trigger": GLib.Variant("s", accelerator),
+        }
+        shortcuts = GLib.Variant("a(sa{sv})", [(_SHORTCUT_ID, shortcut_props)])
+
+        # Assemble from prebuilt children rather than parsing the full
+        # "(oa(sa{sv})sa{sv})" signature each time
+        args = GLib.Variant.new_tuple(
+            GLib.Variant.new_object_path(self._session_handle),
+            shortcuts,
+            self._bind_parent_window,
+            self._bind_options,
+        )
+        # May show a confirmation prompt, hence the long timeout
+        self._call_portal_async("BindShortcuts", args, 30000)
 
         LOG.debug("BindShortcuts dispatched, waiting for Response...")
 
@@ -430,14 +469,20 @@ class GlobalHotkeyListener:
     # ------------------------------------------------------------------
 
     def _subscribe_shortcut_signals(self) -> None:
-        """Subscribe to Activated and Deactivated signals."""
+        """Subscribe to Activated and Deactivated signals.
+
+        The portal broadcasts these for every session on the bus; matching
+        arg0 against our session handle lets the bus drop other sessions'
+        signals before they ever reach Python.  arg0 is an object path, and
+        plain arg0 rules only match strings, so the rule must be arg0path.
+        """
         sid_activated = self._bus.signal_subscribe(
             _PORTAL_BUS_NAME,
             _PORTAL_IFACE,
             "Activated",
             _PORTAL_OBJECT_PATH,
-            None,
-            Gio.DBusSignalFlags.NONE,
+            self._session_handle,
+            Gio.DBusSignalFlags.MATCH_ARG0_PATH,
             self._on_activated,
         )
         sid_deactivated = self._bus.signal_subscribe(
@@ -445,8 +490,8 @@ class GlobalHotkeyListener:
             _PORTAL_IFACE,
             "Deactivated",
             _PORTAL_OBJECT_PATH,
-            None,
-            Gio.DBusSignalFlags.NONE,
+            self._session_handle,
+            Gio.DBusSignalFlags.MATCH_ARG0_PATH,
             self._on_deactivated,
         )
         self._signal_ids.extend([sid_activated, sid_deactivated])
@@ -461,10 +506,12 @@ class GlobalHotkeyListener:
         params: GLib.Variant,
     ) -> None:
         """Handle Activated signal from the portal."""
-        session = params.get_child_value(0).get_string()
+        # The session is already filtered by the arg0 match rule; check the
+        # shortcut first and only then re-check the session defensively.
         shortcut_id = params.get_child_value(1).get_string()
-
-        if session != self._session_handle or shortcut_id != _SHORTCUT_ID:
+        if shortcut_id != _SHORTCUT_ID:
+            return
+        if params.get_child_value(0).get_string() != self._session_handle:
             return
 
         LOG.debug("Portal shortcut activated: %s", shortcut_id)
@@ -480,10 +527,12 @@ class GlobalHotkeyListener:
         params: GLib.Variant,
     ) -> None:
         """Handle Deactivated signal from the portal."""
-        session = params.get_child_value(0).get_string()
+        # The session is already filtered by the arg0 match rule; check the
+        # shortcut first and only then re-check the session defensively.
         shortcut_id = params.get_child_value(1).get_string()
-
-        if session != self._session_handle or shortcut_id != _SHORTCUT_ID:
+        if shortcut_id != _SHORTCUT_ID:
+            return
+        if params.get_child_value(0).get_string() != self._session_handle:
             return
 
         LOG.debug("Portal shortcut deactivated: %s", shortcut_id)
@@ -7,14 +7,42 @@ Uses XDG directories and supports pinned model versions with SHA256 verification
 import hashlib
 import json
 import logging
+import mmap
 import os
 import shutil
-from dataclasses import dataclass
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Callable, Iterator
 
 LOG = logging.getLogger(__name__)
 
+# Suffix of the directory a model is downloaded into before it is verified
+_STAGING_SUFFIX = ".partial"
+
+# Suffix an installed model is moved to while a reinstall swaps it out
+_BACKUP_SUFFIX = ".old"
+
+# huggingface_hub module, imported on first download (see _huggingface_hub)
+_hf_hub = None
+
+
+def _huggingface_hub():
+    """Return the huggingface_hub module, importing it on first use.
+
+    The import pulls in a large dependency tree, so it is deferred until
+    a download actually happens and kept here afterwards.
+
+    Raises:
+        ImportError: If huggingface_hub is not installed.
+    """
+    global _hf_hub
+    if _hf_hub is None:
+        import huggingface_hub
+
+        _hf_hub = huggingface_hub
+    return _hf_hub
+
 
 def get_xdg_data_home() -> Path:
     """Get XDG_DATA_HOME directory."""
@@ -32,9 +60,13 @@ def get_xdg_cache_home() -> Path:
     return Path.home() / ".cache"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ModelSpec:
-    """Specification for a Parakeet model."""
+    """Specification for a Parakeet model.
+
+    Specs are immutable; ``supports_language()`` uses a set built once
+    from ``languages``.
+    """
 
     id: str  # e.g., "nvidia/parakeet-tdt-0.6b-v2"
     name: str  # Human-readable name
@@ -44,6 +76,15 @@ class ModelSpec:
     languages: list[str]  # Supported languages
     size_mb: int  # Approximate size in MB
     description: str = ""
+    sha256_scheme: str = "concat"  # How sha256 is computed, see below
+    _langset: frozenset[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_langset", frozenset(self.languages))
+
+    def supports_language(self, lang: str) -> bool:
+        """Return whether the model supports a language code (e.g. "en")."""
+        return lang in self._langset
 
 
 # Pinned model specifications for reproducibility and security
@@ -56,6 +97,16 @@ class ModelSpec:
 #   3. Concatenate hashes or hash the directory
 #   4. Pin the specific git commit hash as revision
 #
+# Two hashing schemes are supported (ModelSpec.sha256_scheme):
+#   "concat": SHA256 over the contents of all files, concatenated in
+#             sorted path order.  Hashing is inherently sequential.
+#   "merkle": every file is hashed on its own (in parallel), then the
+#             top-level SHA256 is fed, in sorted POSIX relative-path order,
+#             relpath.encode() + b"\0" + file_digest for each file.  Use
+#             ParakeetModelManager.compute_merkle_sha256() to pin it.
+# New pins should use "merkle"; existing pins stay "concat" until
+# re-pinned so already-installed models keep verifying.
+#
 PINNED_MODELS: dict[str, ModelSpec] = {
     "nvidia/parakeet-tdt-0.6b-v2": ModelSpec(
         id="nvidia/parakeet-tdt-0.6b-v2",
@@ -80,6 +131,41 @@ PINNED_MODELS: dict[str, ModelSpec] = {
 }
 
 
+def _iter_files(root: Path) -> Iterator[tuple[str, str]]:
+    """Yield (POSIX relative path, full path) for every file under root.
+
+    Uses os.scandir with an explicit stack: DirEntry caches the file type
+    from readdir, so no per-entry stat() or Path object is needed.
+    Symlinked directories are not descended into (like Path.rglob).
+    """
+    stack = [(os.fspath(root), "")]
+    while stack:
+        directory, prefix = stack.pop()
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                relpath = prefix + entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append((entry.path, relpath + "/"))
+                elif entry.is_file():
+                    yield relpath, entry.path
+
+
+def _hash_file(hasher, path: str) -> None:
+    """Feed a file's contents to a hash object in a single update() call.
+
+    The file is memory-mapped, so hashlib reads the page cache directly
+    with the GIL released instead of copying it through read() buffers.
+    Empty files are skipped; they cannot be mapped and add nothing.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if hasattr(mmap, "MADV_SEQUENTIAL"):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            hasher.update(mm)
+
+
 class ParakeetModelManager:
     """Manager for Parakeet model download and verification."""
 
@@ -92,6 +178,8 @@ class ParakeetModelManager:
         """
         self._model_dir = model_dir or (get_xdg_data_home() / "speak2type" / "models" / "parakeet")
         self._cache_dir = cache_dir or (get_xdg_cache_home() / "speak2type" / "parakeet")
+        # Runs verify_model_async(); created on first use
+        self._verify_executor: ThreadPoolExecutor | None = None
 
         # Ensure directories exist
         self._model_dir.mkdir(parents=True, exist_ok=True)
@@ -124,11 +212,15 @@ class ParakeetModelManager:
         if not self._model_dir.exists():
             return
 
-        for item in self._model_dir.iterdir():
-            if item.is_dir():
+        with os.scandir(self._model_dir) as entries:
+            for entry in entries:
+                if not entry.is_dir() or entry.name.endswith((_STAGING_SUFFIX, _BACKUP_SUFFIX)):
+                    continue
                 # Check if it looks like a valid model
-                if (item / "model.onnx").exists() or (item / "config.json").exists():
-                    yield item.name, item
+                if os.path.exists(os.path.join(entry.path, "model.onnx")) or os.path.exists(
+                    os.path.join(entry.path, "config.json")
+                ):
+                    yield entry.name, Path(entry.path)
 
     def get_model_path(self, model_id: str) -> Path | None:
         """Get the path to an installed model.
@@ -167,6 +259,10 @@ class ParakeetModelManager:
     ) -> Path | None:
         """Download a model from HuggingFace.
 
+        The files are fetched with huggingface_hub's snapshot_download,
+        verified against the pinned hash in a staging directory, and only
+        then swapped into place.
+
         Args:
             model_id: Model identifier (e.g., "nvidia/parakeet-tdt-0.6b-v2").
             force: Force re-download even if already installed.
@@ -182,35 +278,24 @@ class ParakeetModelManager:
 
         # Get pinned spec if available
         spec = PINNED_MODELS.get(model_id)
+        revision = spec.revision if spec else "main"
 
-        try:
-            # Use huggingface_hub for download
-            from huggingface_hub import snapshot_download
+        dir_name = model_id.replace("/", "_")
+        model_path = self._model_dir / dir_name
+        staging = self._model_dir / (dir_name + _STAGING_SUFFIX)
 
+        try:
             LOG.info("Downloading model: %s", model_id)
+            if staging.exists():
+                shutil.rmtree(staging)
 
-            # Download to cache first
-            revision = spec.revision if spec else "main"
-            cache_path = snapshot_download(
-                repo_id=model_id,
-                revision=revision,
-                cache_dir=self._cache_dir,
-            )
-
-            # Move to model directory
-            dir_name = model_id.replace("/", "_")
-            model_path = self._model_dir / dir_name
+            self._fetch_snapshot(model_id, revision, staging, progress_callback)
 
-            if model_path.exists():
-                shutil.rmtree(model_path)
-
-            shutil.copytree(cache_path, model_path)
-
-            # Verify SHA256 if pinned
-            if spec and spec.sha256:
-                if not self._verify_sha256(model_path, spec.sha256):
-                    LOG.error("SHA256 verification failed for %s", model_id)
-                    shutil.rmtree(model_path)
+            # Verify the pinned hash before the model becomes visible
+            if spec is not None and spec.sha256:
+                if not self._verify_sha256(staging, spec.sha256, spec.sha256_scheme):
+                    LOG.error("Verification failed for %s", model_id)
+                    shutil.rmtree(staging)
                     return None
             else:
                 LOG.warning(
@@ -218,6 +303,8 @@ class ParakeetModelManager:
                     "Model integrity not verified.", model_id
                 )
 
+            self._swap_into_place(staging, model_path)
+
             LOG.info("Model installed: %s -> %s", model_id, model_path)
             return model_path
 
@@ -226,14 +313,148 @@ class ParakeetModelManager:
             return None
         except Exception as e:
             LOG.error("Failed to download model %s: %s", model_id, e)
+            shutil.rmtree(staging, ignore_errors=True)
             return None
 
-    def _verify_sha256(self, model_path: Path, expected_sha256: str) -> bool:
+    @staticmethod
+    def _swap_into_place(staging: Path, model_path: Path) -> None:
+        """Atomically replace model_path with the verified staging tree.
+
+        An existing install is renamed aside rather than deleted first, so
+        model_path is only ever missing between two renames, and the old
+        model is put back if the new one cannot be moved in.
+        """
+        backup = model_path.with_name(model_path.name + _BACKUP_SUFFIX)
+        if backup.exists():
+            shutil.rmtree(backup)
+
+        had_model = model_path.exists()
+        if had_model:
+            os.replace(model_path, backup)
+        try:
+            os.replace(staging, model_path)
+        except OSError:
+            if had_model:
+                os.replace(backup, model_path)
+            raise
+
+        if had_model:
+            shutil.rmtree(backup, ignore_errors=True)
+
+    def _fetch_snapshot(
+        self,
+        model_id: str,
+        revision: str,
+        dest: Path,
+        progress_callback: Callable[[int, int], None] | None = None,
+    ) -> None:
+        """Download a model repository and lay its files out under dest.
+
+        huggingface_hub does the transfer into the download cache, which
+        gives authenticated access (the token never follows redirects to
+        the CDN), retries, resumable downloads and etag checks.  The files
+        are then hardlinked out of the cache where possible, so a model is
+        not written to disk twice.
+
+        Args:
+            model_id: Model identifier.
+            revision: Git revision to download.
+            dest: Directory to lay the model out in (created).
+            progress_callback: Called with (bytes done, bytes total) once
+                the files are in place.
+
+        Raises:
+            ImportError: If huggingface_hub is not installed.
+        """
+        hf_hub = _huggingface_hub()
+        snapshot = hf_hub.snapshot_download(
+            repo_id=model_id,
+            revision=revision,
+            cache_dir=self._cache_dir,
+        )
+
+        total = 0
+        for relpath, path in _iter_files(Path(snapshot)):
+            target = dest / relpath
+            target.parent.mkdir(parents=True, exist_ok=True)
+            # Snapshot entries are symlinks into the cache's blob store
+            blob = os.path.realpath(path)
+            try:
+                os.link(blob, target)
+            except OSError:
+                shutil.copyfile(blob, target)
+            total += os.path.getsize(target)
+
+        if progress_callback:
+            progress_callback(total, total)
+
+    def verify_model(self, model_id: str) -> bool:
+        """Verify an installed model against its pinned hash.
+
+        Args:
+            model_id: Model identifier.
+
+        Returns:
+            True if the model is installed and verification passed.
+        """
+        model_path = self.get_model_path(model_id)
+        if model_path is None:
+            LOG.warning("Model not installed: %s", model_id)
+            return False
+        spec = PINNED_MODELS.get(model_id)
+        if spec is None:
+            LOG.warning("No pinned spec for model %s, not verified", model_id)
+            return True
+        return self._verify_sha256(model_path, spec.sha256, spec.sha256_scheme)
+
+    def verify_model_async(
+        self, model_id: str, callback: Callable[[bool], None]
+    ) -> Future:
+        """Verify an installed model on a background thread.
+
+        Hashing a model takes on the order of a second, so callers running
+        a GLib main loop (the engine, preferences) use this instead of
+        verify_model() to stay responsive.
+
+        Args:
+            model_id: Model identifier.
+            callback: Called with the verify_model() result in the GLib
+                main loop.
+
+        Returns:
+            Future of the verification result.
+        """
+        from gi.repository import GLib
+
+        if self._verify_executor is None:
+            self._verify_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="speak2type-verify"
+            )
+
+        def deliver(ok: bool) -> bool:
+            callback(ok)
+            return False  # Don't repeat
+
+        def run() -> bool:
+            try:
+                ok = self.verify_model(model_id)
+            except Exception as e:
+                LOG.error("Failed to verify model %s: %s", model_id, e)
+                ok = False
+            GLib.idle_add(deliver, ok)
+            return ok
+
+        return self._verify_executor.submit(run)
+
+    def _verify_sha256(
+        self, model_path: Path, expected_sha256: str, scheme: str = "concat"
+    ) -> bool:
         """Verify SHA256 of model files.
 
         Args:
             model_path: Path to model directory.
             expected_sha256: Expected SHA256 hash.
+            scheme: Hashing scheme of expected_sha256, "concat" or "merkle".
 
         Returns:
             True if verification passed.
@@ -242,16 +463,10 @@ class ParakeetModelManager:
             LOG.warning("No SHA256 specified for verification")
             return True
 
-        # Compute SHA256 of all files
-        sha256 = hashlib.sha256()
-
-        for file_path in sorted(model_path.rglob("*")):
-            if file_path.is_file():
-                with open(file_path, "rb") as f:
-                    for chunk in iter(lambda: f.read(8192), b""):
-                        sha256.update(chunk)
-
-        computed = sha256.hexdigest()
+        if scheme == "merkle":
+            computed = self.compute_merkle_sha256(model_path)
+        else:
+            computed = self._compute_concat_sha256(model_path)
 
         if computed != expected_sha256:
             LOG.error("SHA256 mismatch: expected %s, got %s", expected_sha256, computed)
@@ -260,6 +475,52 @@ class ParakeetModelManager:
         LOG.info("SHA256 verification passed")
         return True
 
+    @staticmethod
+    def _compute_concat_sha256(model_path: Path) -> str:
+        """Compute the "concat" scheme digest of a model directory."""
+        # Compute SHA256 of all files, fed to one running hash so the digest
+        # is a hash of the files' concatenated contents
+        sha256 = hashlib.sha256()
+
+        # Component-wise order, as sorting Path objects gives (and as the
+        # pinned digests were computed); plain string order would put
+        # "a-b" before "a/b".
+        files = sorted(_iter_files(model_path), key=lambda item: item[0].split("/"))
+        for _, full_path in files:
+            _hash_file(sha256, full_path)
+
+        return sha256.hexdigest()
+
+    @staticmethod
+    def compute_merkle_sha256(model_path: Path) -> str:
+        """Compute the "merkle" scheme digest of a model directory.
+
+        Files are hashed concurrently; OpenSSL releases the GIL while
+        hashing, so reads and hashes of different files overlap.
+
+        Args:
+            model_path: Path to model directory.
+
+        Returns:
+            Hex digest of the combined per-file digests.
+        """
+        files = sorted(_iter_files(model_path))
+
+        def file_sha256(path: str) -> bytes:
+            sha256 = hashlib.sha256()
+            _hash_file(sha256, path)
+            return sha256.digest()
+
+        workers = min(8, os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            digests = executor.map(file_sha256, [path for _, path in files])
+
+            top = hashlib.sha256()
+            for (relpath, _), digest in zip(files, digests):
+                top.update(relpath.encode() + b"\0" + digest)
+
+        return top.hexdigest()
+
     def remove_model(self, model_id: str) -> bool:
         """Remove an installed model.
 
@@ -295,7 +556,7 @@ class ParakeetModelManager:
 
         # Check multilingual model's supported languages
         multilingual = PINNED_MODELS.get("nvidia/parakeet-tdt-0.6b-v3-multilingual")
-        if multilingual and lang in multilingual.languages:
+        if multilingual and multilingual.supports_language(lang):
             return multilingual.id
 
         # Fall back to English model
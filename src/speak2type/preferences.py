@@ -7,6 +7,7 @@ installing dependencies, and downloading models.
 import logging
 import subprocess
 import threading
+from typing import Callable
 
 import gi
 
@@ -21,6 +22,11 @@ from .backend_manager import BACKEND_SPECS, BackendManager
 
 LOG = logging.getLogger(__name__)
 
+# (backend id, spec, has_models) for every backend; BACKEND_SPECS is static
+_SPEC_TUPLE = tuple(
+    (backend_id, spec, spec.has_models) for backend_id, spec in BACKEND_SPECS.items()
+)
+
 
 class BackendRow(Adw.ActionRow):
     """A row representing a single backend with install/remove controls."""
@@ -35,6 +41,8 @@ class BackendRow(Adw.ActionRow):
         self._manager = manager
         self._window = window
         self._installing = False
+        # Install status the row's widgets currently show (None: unknown)
+        self._last_deps_state: bool | None = None
 
         # Action button (Install / Remove)
         self._action_button = Gtk.Button(valign=Gtk.Align.CENTER)
@@ -61,7 +69,10 @@ class BackendRow(Adw.ActionRow):
         if self._installing:
             return
 
-        deps_installed = self._manager.is_deps_installed(self._backend_id)
+        deps_installed = self._window.is_deps_installed(self._backend_id)
+        if deps_installed == self._last_deps_state:
+            return
+        self._last_deps_state = deps_installed
 
         if deps_installed:
             self._action_button.set_label("Remove")
@@ -78,7 +89,7 @@ class BackendRow(Adw.ActionRow):
         if self._installing:
             return
 
-        deps_installed = self._manager.is_deps_installed(self._backend_id)
+        deps_installed = self._window.is_deps_installed(self._backend_id)
         if deps_installed:
             self._start_uninstall()
         else:
@@ -94,11 +105,12 @@ class BackendRow(Adw.ActionRow):
         self._action_button.set_sensitive(not busy)
         if label:
             self._action_button.set_label(label)
+            # The button no longer shows the cached state
+            self._last_deps_state = None
 
     def _start_install(self) -> None:
         self._set_busy(True, "Installing...")
-        thread = threading.Thread(target=self._install_thread, daemon=True)
-        thread.start()
+        self._window.submit_background(self._install_thread)
 
     def _install_thread(self) -> None:
         try:
@@ -107,7 +119,7 @@ class BackendRow(Adw.ActionRow):
             spec = BACKEND_SPECS[self._backend_id]
             model_error = None
             if spec.has_models:
-                GLib.idle_add(self._set_busy, True, "Downloading model...")
+                self._window.dispatch(self._set_busy, True, "Downloading model...")
                 try:
                     manager = self._manager.get_model_manager(self._backend_id)
                     if manager is not None:
@@ -119,13 +131,14 @@ class BackendRow(Adw.ActionRow):
                     model_error = str(e)
                     LOG.error("Model download failed for %s: %s", self._backend_id, e)
 
-            GLib.idle_add(self._on_install_done, model_error)
+            self._window.dispatch(self._on_install_done, model_error)
         except subprocess.CalledProcessError as e:
-            GLib.idle_add(self._on_install_error, e.stderr or str(e))
+            self._window.dispatch(self._on_install_error, e.stderr or str(e))
         except Exception as e:
-            GLib.idle_add(self._on_install_error, str(e))
+            self._window.dispatch(self._on_install_error, str(e))
 
     def _on_install_done(self, model_error: str | None) -> None:
+        self._window.invalidate_deps_status(self._backend_id)
         self._set_busy(False)
         self.refresh_status()
         self._window.refresh_model_page()
@@ -138,6 +151,8 @@ class BackendRow(Adw.ActionRow):
             self._window.show_toast(f"{spec.name} installed successfully")
 
     def _on_install_error(self, error_msg: str) -> None:
+        # pip may have installed some packages before failing
+        self._window.invalidate_deps_status(self._backend_id)
         self._set_busy(False)
         self.refresh_status()
         spec = BACKEND_SPECS[self._backend_id]
@@ -145,17 +160,17 @@ class BackendRow(Adw.ActionRow):
 
     def _start_uninstall(self) -> None:
         self._set_busy(True, "Removing...")
-        thread = threading.Thread(target=self._uninstall_thread, daemon=True)
-        thread.start()
+        self._window.submit_background(self._uninstall_thread)
 
     def _uninstall_thread(self) -> None:
         try:
             self._manager.uninstall_deps(self._backend_id)
-            GLib.idle_add(self._on_uninstall_done)
+            self._window.dispatch(self._on_uninstall_done)
         except Exception as e:
-            GLib.idle_add(self._on_uninstall_error, str(e))
+            self._window.dispatch(self._on_uninstall_error, str(e))
 
     def _on_uninstall_done(self) -> None:
+        self._window.invalidate_deps_status(self._backend_id)
         self._set_busy(False)
         self.refresh_status()
         self._window.refresh_model_page()
@@ -163,6 +178,7 @@ class BackendRow(Adw.ActionRow):
         self._window.show_toast(f"{spec.name} removed")
 
     def _on_uninstall_error(self, error_msg: str) -> None:
+        self._window.invalidate_deps_status(self._backend_id)
         self._set_busy(False)
         self.refresh_status()
         spec = BACKEND_SPECS[self._backend_id]
@@ -189,6 +205,8 @@ class ModelRow(Adw.ActionRow):
         self._model_manager = model_manager
         self._window = window
         self._busy = False
+        # Install status the row's widgets currently show (None: unknown)
+        self._last_installed_state: bool | None = None
 
         self._action_button = Gtk.Button(valign=Gtk.Align.CENTER)
         self._action_button.connect("clicked", self._on_action_clicked)
@@ -201,6 +219,10 @@ class ModelRow(Adw.ActionRow):
         self._update_ui(is_installed)
 
     def _update_ui(self, is_installed: bool) -> None:
+        if is_installed == self._last_installed_state:
+            return
+        self._last_installed_state = is_installed
+
         if is_installed:
             self._action_button.set_label("Remove")
             self._action_button.remove_css_class("suggested-action")
@@ -210,6 +232,11 @@ class ModelRow(Adw.ActionRow):
             self._action_button.add_css_class("suggested-action")
             self._action_button.remove_css_class("destructive-action")
 
+    def refresh(self, is_installed: bool) -> None:
+        """Update the row for a changed install status (unless busy)."""
+        if not self._busy:
+            self._update_ui(is_installed)
+
     def _set_busy(self, busy: bool, label: str = "") -> None:
         self._busy = busy
         self._spinner.set_visible(busy)
@@ -220,6 +247,8 @@ class ModelRow(Adw.ActionRow):
         self._action_button.set_sensitive(not busy)
         if label:
             self._action_button.set_label(label)
+            # The button no longer shows the cached state
+            self._last_installed_state = None
 
     def _on_action_clicked(self, _button: Gtk.Button) -> None:
         if self._busy:
@@ -231,18 +260,17 @@ class ModelRow(Adw.ActionRow):
 
     def _start_download(self) -> None:
         self._set_busy(True, "Downloading...")
-        thread = threading.Thread(target=self._download_thread, daemon=True)
-        thread.start()
+        self._window.submit_background(self._download_thread)
 
     def _download_thread(self) -> None:
         try:
             result = self._model_manager.download_model(self._model_id)
             if result is None:
-                GLib.idle_add(self._on_download_error, "Download failed")
+                self._window.dispatch(self._on_download_error, "Download failed")
             else:
-                GLib.idle_add(self._on_download_done)
+                self._window.dispatch(self._on_download_done)
         except Exception as e:
-            GLib.idle_add(self._on_download_error, str(e))
+            self._window.dispatch(self._on_download_error, str(e))
 
     def _on_download_done(self) -> None:
         self._set_busy(False)
@@ -256,15 +284,14 @@ class ModelRow(Adw.ActionRow):
 
     def _start_remove(self) -> None:
         self._set_busy(True, "Removing...")
-        thread = threading.Thread(target=self._remove_thread, daemon=True)
-        thread.start()
+        self._window.submit_background(self._remove_thread)
 
     def _remove_thread(self) -> None:
         try:
             self._model_manager.remove_model(self._model_id)
-            GLib.idle_add(self._on_remove_done)
+            self._window.dispatch(self._on_remove_done)
         except Exception as e:
-            GLib.idle_add(self._on_remove_error, str(e))
+            self._window.dispatch(self._on_remove_error, str(e))
 
     def _on_remove_done(self) -> None:
         self._set_busy(False)
@@ -277,6 +304,23 @@ class ModelRow(Adw.ActionRow):
         self._window.show_toast(f"Remove failed: {error_msg}")
 
 
+def _build_accel_prefix_table(mod_to_accel: list[tuple[int, str]]) -> dict[int, str]:
+    """Map every combination of the given modifier masks to its token prefix.
+
+    Tokens appear in mod_to_accel order, e.g. "<Ctrl><Alt>".
+    """
+    table: dict[int, str] = {}
+    for combo in range(1 << len(mod_to_accel)):
+        mask = 0
+        prefix = ""
+        for bit, (mod_mask, token) in enumerate(mod_to_accel):
+            if combo & (1 << bit):
+                mask |= mod_mask
+                prefix += token
+        table[mask] = prefix
+    return table
+
+
 class ShortcutRow(Adw.ActionRow):
     """A row that captures a keyboard shortcut when activated.
 
@@ -285,13 +329,35 @@ class ShortcutRow(Adw.ActionRow):
     """
 
     # Map Gdk modifier bits to GTK accelerator tokens
+    # (stored as plain ints so key handling does int, not flag, arithmetic)
     _GDK_MOD_TO_ACCEL = [
-        (Gdk.ModifierType.CONTROL_MASK, "<Ctrl>"),
-        (Gdk.ModifierType.ALT_MASK, "<Alt>"),
-        (Gdk.ModifierType.SHIFT_MASK, "<Shift>"),
-        (Gdk.ModifierType.SUPER_MASK, "<Super>"),
+        (int(Gdk.ModifierType.CONTROL_MASK), "<Ctrl>"),
+        (int(Gdk.ModifierType.ALT_MASK), "<Alt>"),
+        (int(Gdk.ModifierType.SHIFT_MASK), "<Shift>"),
+        (int(Gdk.ModifierType.SUPER_MASK), "<Super>"),
     ]
 
+    # Union of the modifier bits above
+    _ANY_MOD_MASK = (
+        int(Gdk.ModifierType.CONTROL_MASK)
+        | int(Gdk.ModifierType.ALT_MASK)
+        | int(Gdk.ModifierType.SHIFT_MASK)
+        | int(Gdk.ModifierType.SUPER_MASK)
+    )
+
+    # Accelerator prefix for each combination of the modifier bits above
+    _ACCEL_PREFIX_TABLE = _build_accel_prefix_table(_GDK_MOD_TO_ACCEL)
+
+    # Keyvals of modifier keys pressed on their own
+    _LONE_MODIFIER_KEYVALS = frozenset({
+        Gdk.KEY_Shift_L, Gdk.KEY_Shift_R,
+        Gdk.KEY_Control_L, Gdk.KEY_Control_R,
+        Gdk.KEY_Alt_L, Gdk.KEY_Alt_R,
+        Gdk.KEY_Super_L, Gdk.KEY_Super_R,
+        Gdk.KEY_Meta_L, Gdk.KEY_Meta_R,
+        Gdk.KEY_ISO_Level3_Shift,
+    })
+
     def __init__(self, settings: Gio.Settings, window: "PreferencesWindow"):
         super().__init__(title="Push-to-Talk Hotkey")
         self._settings = settings
@@ -310,10 +376,8 @@ class ShortcutRow(Adw.ActionRow):
         self._change_button.connect("clicked", self._on_change_clicked)
         self.add_suffix(self._change_button)
 
-        # Key event controller (added to the window during capture)
-        self._key_controller = Gtk.EventControllerKey()
-        self._key_controller.set_propagation_phase(Gtk.PropagationPhase.CAPTURE)
-        self._key_controller.connect("key-pressed", self._on_key_pressed)
+        # Key event controller, only exists (on the window) during capture
+        self._key_controller: Gtk.EventControllerKey | None = None
 
     def _on_change_clicked(self, _button: Gtk.Button) -> None:
         if self._capturing:
@@ -327,6 +391,10 @@ class ShortcutRow(Adw.ActionRow):
         self._shortcut_label.set_accelerator("")
         self.set_subtitle("Press a key combination...")
         # Attach key controller to the toplevel window to capture all keys
+        if self._key_controller is None:
+            self._key_controller = Gtk.EventControllerKey()
+            self._key_controller.set_propagation_phase(Gtk.PropagationPhase.CAPTURE)
+            self._key_controller.connect("key-pressed", self._on_key_pressed)
         toplevel = self.get_root()
         if toplevel:
             toplevel.add_controller(self._key_controller)
@@ -335,9 +403,12 @@ class ShortcutRow(Adw.ActionRow):
         self._capturing = False
         self._change_button.set_label("Change")
         self.set_subtitle("")
+        if self._key_controller is None:
+            return
         toplevel = self.get_root()
         if toplevel:
             toplevel.remove_controller(self._key_controller)
+        self._key_controller = None
 
     def _on_key_pressed(
         self,
@@ -350,18 +421,12 @@ class ShortcutRow(Adw.ActionRow):
             return False
 
         # Ignore lone modifier presses (wait for the actual key)
-        if keyval in (
-            Gdk.KEY_Shift_L, Gdk.KEY_Shift_R,
-            Gdk.KEY_Control_L, Gdk.KEY_Control_R,
-            Gdk.KEY_Alt_L, Gdk.KEY_Alt_R,
-            Gdk.KEY_Super_L, Gdk.KEY_Super_R,
-            Gdk.KEY_Meta_L, Gdk.KEY_Meta_R,
-            Gdk.KEY_ISO_Level3_Shift,
-        ):
+        if keyval in self._LONE_MODIFIER_KEYVALS:
             return True  # consume but keep waiting
 
         # Require at least one modifier to avoid hijacking normal typing
-        has_modifier = any(state & mask for mask, _ in self._GDK_MOD_TO_ACCEL)
+        state_int = int(state)
+        has_modifier = bool(state_int & self._ANY_MOD_MASK)
         if not has_modifier:
             self._window.show_toast(
                 "Hotkey requires at least one modifier (Ctrl, Alt, Shift, or Super)"
@@ -370,7 +435,7 @@ class ShortcutRow(Adw.ActionRow):
             return True
 
         # Build accelerator string from modifiers + key
-        accel = self._build_accelerator(keyval, state)
+        accel = self._build_accelerator(keyval, state_int)
         if accel:
             self._shortcut_label.set_accelerator(accel)
             self._settings.set_string("ptt-hotkey", accel)
@@ -381,19 +446,14 @@ class ShortcutRow(Adw.ActionRow):
         return True  # consume the key event
 
     @classmethod
-    def _build_accelerator(cls, keyval: int, state: Gdk.ModifierType) -> str:
+    def _build_accelerator(cls, keyval: int, state: int) -> str:
         """Convert a keyval + GDK modifier state to a GTK accelerator string."""
-        parts: list[str] = []
-        for mask, token in cls._GDK_MOD_TO_ACCEL:
-            if state & mask:
-                parts.append(token)
-
         key_name = Gdk.keyval_name(keyval)
         if not key_name:
             return ""
 
-        parts.append(key_name)
-        return "".join(parts)
+        prefix = cls._ACCEL_PREFIX_TABLE[state & cls._ANY_MOD_MASK]
+        return prefix + key_name
 
 
 class PreferencesWindow(Adw.PreferencesWindow):
@@ -402,8 +462,12 @@ class PreferencesWindow(Adw.PreferencesWindow):
     def __init__(self, **kwargs: object):
         super().__init__(title="speak2type Settings", **kwargs)
         self._manager = BackendManager()
+        # Backend id -> deps importable; cleared per backend on (un)install
+        self._deps_cache: dict[str, bool] = {}
+        self._main_thread_id = threading.get_ident()
         self._backend_rows: dict[str, BackendRow] = {}
         self._model_group: Adw.PreferencesGroup | None = None
+        self._model_rows: dict[str, ModelRow] = {}
         self._model_page: Adw.PreferencesPage | None = None
 
         self._settings = None
@@ -450,24 +514,26 @@ class PreferencesWindow(Adw.PreferencesWindow):
         if not self._settings:
             return
 
-        # Clear existing items
-        while self._backend_string_list.get_n_items() > 0:
-            self._backend_string_list.remove(0)
-        self._backend_combo_ids.clear()
-
         current = self._settings.get_string("backend") if self._settings else "parakeet"
         selected_idx = 0
 
-        for backend_id, spec in BACKEND_SPECS.items():
-            if self._manager.is_deps_installed(backend_id):
-                self._backend_string_list.append(spec.name)
-                self._backend_combo_ids.append(backend_id)
+        names: list[str] = []
+        ids: list[str] = []
+        for backend_id, spec, _has_models in _SPEC_TUPLE:
+            if self.is_deps_installed(backend_id):
                 if backend_id == current:
-                    selected_idx = len(self._backend_combo_ids) - 1
+                    selected_idx = len(ids)
+                names.append(spec.name)
+                ids.append(backend_id)
+
+        if not ids:
+            names.append("(none installed)")
+            ids.append("")
 
-        if not self._backend_combo_ids:
-            self._backend_string_list.append("(none installed)")
-            self._backend_combo_ids.append("")
+        # Replace all items at once: one items-changed signal instead of
+        # one per removed and added item
+        self._backend_combo_ids = ids
+        self._backend_string_list.splice(0, self._backend_string_list.get_n_items(), names)
 
         self._backend_combo.set_selected(selected_idx)
 
@@ -498,22 +564,13 @@ class PreferencesWindow(Adw.PreferencesWindow):
         if not self._model_group:
             return
 
-        # Remove existing model rows
-        child = self._model_group.get_first_child()
-        rows_to_remove = []
-        while child:
-            if isinstance(child, ModelRow):
-                rows_to_remove.append(child)
-            child = child.get_next_sibling()
-        for row in rows_to_remove:
-            self._model_group.remove(row)
-
-        # Add models for installed backends that have models
-        found_any = False
-        for backend_id, spec in BACKEND_SPECS.items():
-            if not spec.has_models:
+        # Update rows in place; only models that appeared or went away
+        # add or remove widgets
+        desired_ids: set[str] = set()
+        for backend_id, _spec, has_models in _SPEC_TUPLE:
+            if not has_models:
                 continue
-            if not self._manager.is_deps_installed(backend_id):
+            if not self.is_deps_installed(backend_id):
                 continue
 
             model_manager = self._manager.get_model_manager(backend_id)
@@ -522,11 +579,19 @@ class PreferencesWindow(Adw.PreferencesWindow):
 
             for model_spec in model_manager.list_available_models():
                 is_installed = model_manager.is_installed(model_spec.id)
+                desired_ids.add(model_spec.id)
+                row = self._model_rows.get(model_spec.id)
+                if row is not None:
+                    row.refresh(is_installed)
+                    continue
                 row = ModelRow(model_spec, is_installed, self._manager, model_manager, self)
+                self._model_rows[model_spec.id] = row
                 self._model_group.add(row)
-                found_any = True
 
-        if not found_any:
+        for model_id in self._model_rows.keys() - desired_ids:
+            self._model_group.remove(self._model_rows.pop(model_id))
+
+        if not desired_ids:
             self._model_group.set_description(
                 "Install a backend first to see available models."
             )
@@ -535,6 +600,51 @@ class PreferencesWindow(Adw.PreferencesWindow):
                 "Download or remove models for the active backend."
             )
 
+    def submit_background(self, fn: Callable[..., object], *args: object) -> threading.Thread:
+        """Run a function on a daemon thread, off the GTK thread.
+
+        Daemon threads do not keep the process alive, so closing the
+        window mid-download or mid-install exits right away instead of
+        waiting for the work to finish.
+
+        Args:
+            fn: Function to run; it must post UI updates via dispatch().
+            *args: Arguments for fn.
+
+        Returns:
+            The started thread.
+        """
+        thread = threading.Thread(target=fn, args=args, daemon=True)
+        thread.start()
+        return thread
+
+    def dispatch(self, fn: Callable[..., object], *args: object) -> None:
+        """Call a UI update function on the GTK thread.
+
+        Runs fn immediately when already on the GTK thread, otherwise
+        posts it to the main loop with GLib.idle_add.
+        """
+        if threading.get_ident() == self._main_thread_id:
+            fn(*args)
+        else:
+            GLib.idle_add(fn, *args)
+
+    def is_deps_installed(self, backend_id: str) -> bool:
+        """Return whether a backend's dependencies are installed (cached).
+
+        Args:
+            backend_id: Backend identifier from BACKEND_SPECS.
+        """
+        installed = self._deps_cache.get(backend_id)
+        if installed is None:
+            installed = self._manager.is_deps_installed(backend_id)
+            self._deps_cache[backend_id] = installed
+        return installed
+
+    def invalidate_deps_status(self, backend_id: str) -> None:
+        """Forget the cached dependency status of a backend."""
+        self._deps_cache.pop(backend_id, None)
+
     def refresh_model_page(self) -> None:
         """Refresh the models page and backend combo after an install/uninstall."""
         self._populate_models()
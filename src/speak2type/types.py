@@ -1,62 +1,86 @@
 """Core types for speak2type."""
 
 from dataclasses import dataclass, field
-from enum import Enum, auto
+from enum import IntEnum, StrEnum, auto
 from typing import Protocol, Iterator, Callable
 
 
-class EngineState(Enum):
-    """State machine states for the speech-to-text engine."""
+class EngineState(IntEnum):
+    """State machine states for the speech-to-text engine.
+
+    An IntEnum so state checks in the key-event path are int comparisons.
+    """
     IDLE = auto()
     RECORDING = auto()
     TRANSCRIBING = auto()
     COMMITTING = auto()
 
 
-class RecordMode(Enum):
-    """Recording activation mode."""
+class RecordMode(StrEnum):
+    """Recording activation mode (values match the GSettings strings)."""
     TOGGLE = "toggle"
     PUSH_TO_TALK = "push_to_talk"
 
 
-class AudioSource(Enum):
-    """Audio source preference."""
+class AudioSource(StrEnum):
+    """Audio source preference (values match the GSettings strings)."""
     AUTO = "auto"
     PIPEWIRE = "pipewire"
     PULSEAUDIO = "pulseaudio"
 
 
-@dataclass(frozen=True)
+# Bytes per sample for each supported sample format
+_FMT_SIZES = {"s16le": 2, "f32le": 4, "s32le": 4}
+
+
+@dataclass(frozen=True, slots=True)
 class AudioFormat:
-    """Audio format specification."""
+    """Audio format specification.
+
+    Byte sizes are derived once at construction; the format is immutable.
+    """
     sample_rate: int = 16000
     channels: int = 1
     sample_fmt: str = "s16le"
+    _bps: int = field(init=False, repr=False, compare=False)
+    _bps_per_s: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        bps = _FMT_SIZES.get(self.sample_fmt, 2)
+        object.__setattr__(self, "_bps", bps)
+        object.__setattr__(self, "_bps_per_s", self.sample_rate * self.channels * bps)
 
     @property
     def bytes_per_sample(self) -> int:
         """Return bytes per sample based on format."""
-        fmt_sizes = {"s16le": 2, "f32le": 4, "s32le": 4}
-        return fmt_sizes.get(self.sample_fmt, 2)
+        return self._bps
 
     @property
     def bytes_per_second(self) -> int:
         """Return bytes per second of audio."""
-        return self.sample_rate * self.channels * self.bytes_per_sample
+        return self._bps_per_s
 
 
-@dataclass
+@dataclass(slots=True)
 class AudioSegment:
-    """A segment of audio data."""
+    """A segment of audio data.
+
+    Segments are not modified after creation; duration_ms is computed on
+    first access and cached.
+    """
     pcm_bytes: bytes
     format: AudioFormat = field(default_factory=AudioFormat)
+    _duration_ms: int | None = field(default=None, init=False, repr=False, compare=False)
 
     @property
     def duration_ms(self) -> int:
         """Return duration in milliseconds."""
-        if self.format.bytes_per_second == 0:
-            return 0
-        return int(len(self.pcm_bytes) * 1000 / self.format.bytes_per_second)
+        duration = self._duration_ms
+        if duration is None:
+            bytes_per_second = self.format.bytes_per_second
+            duration = (len(self.pcm_bytes) * 1000) // bytes_per_second if bytes_per_second else 0
+            self._duration_ms = duration
+        return duration
 
     @property
     def duration_seconds(self) -> float:
@@ -64,7 +88,7 @@ class AudioSegment:
         return self.duration_ms / 1000.0
 
 
-@dataclass
+@dataclass(slots=True)
 class Segment:
     """A transcription segment with timing."""
     text: str
@@ -73,7 +97,7 @@ class Segment:
     confidence: float | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TranscriptResult:
     """Result of speech transcription."""
     text: str
@@ -116,6 +140,33 @@ class Backend(Protocol):
         ...
 
 
+class BatchBackend(Backend, Protocol):
+    """Protocol for backends that can transcribe several segments in one call.
+
+    The worker only uses transcribe_batch() when ``supports_batch`` is True.
+    """
+
+    supports_batch: bool
+
+    def transcribe_batch(
+        self,
+        segments: list[AudioSegment],
+        locale_hint: str,
+        options: dict | None = None,
+    ) -> list[TranscriptResult]:
+        """Transcribe several audio segments in a single backend invocation.
+
+        Args:
+            segments: Audio segments to transcribe.
+            locale_hint: Suggested locale (e.g., "en_US").
+            options: Backend-specific options.
+
+        Returns:
+            One transcription result per segment, in the same order.
+        """
+        ...
+
+
 class StreamingBackend(Backend, Protocol):
     """Protocol for streaming speech recognition backends."""
 
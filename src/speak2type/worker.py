@@ -1,8 +1,10 @@
 """Worker thread for background transcription."""
 
+import itertools
 import logging
 import queue
 import threading
+import time
 from dataclasses import dataclass
 from typing import Callable
 
@@ -19,41 +21,187 @@ class TranscriptionJob:
     segment: AudioSegment
     locale_hint: str
     options: dict | None = None
+    # Per-job callbacks; None falls back to the worker's defaults
+    on_result: Callable[[TranscriptResult], None] | None = None
+    on_error: Callable[[Exception], None] | None = None
+
+
+class SpscSegmentQueue:
+    """Bounded single-producer/single-consumer queue of transcription jobs.
+
+    The producer (IBus main loop) only ever advances ``_tail`` and the
+    consumer (worker thread) only ever advances ``_head``, so neither side
+    takes a queue mutex.  Slots are preallocated; ``put()`` stores a
+    reference and bumps an integer.  A ``threading.Event`` parks the
+    consumer while the queue is empty; it blocks without any timeout
+    polling, so an idle worker costs no CPU wakeups.
+    """
+
+    def __init__(self, capacity: int = 16) -> None:
+        """Initialize the queue.
+
+        Args:
+            capacity: Maximum number of queued jobs.
+        """
+        self._capacity = capacity
+        self._slots: list[TranscriptionJob | None] = [None] * capacity
+        self._head = 0
+        self._tail = 0
+        self._not_empty = threading.Event()
+        self._wakeup = False
+
+    def __len__(self) -> int:
+        """Return the number of queued jobs."""
+        return self._tail - self._head
+
+    @property
+    def capacity(self) -> int:
+        """Return the maximum number of queued jobs."""
+        return self._capacity
+
+    def put(self, job: TranscriptionJob) -> bool:
+        """Enqueue a job (producer side).
+
+        Returns:
+            False if the queue is full and the job was not queued.
+        """
+        tail = self._tail
+        if tail - self._head >= self._capacity:
+            return False
+        self._slots[tail % self._capacity] = job
+        self._tail = tail + 1
+        self._not_empty.set()
+        return True
+
+    def get(self, timeout: float | None = None) -> TranscriptionJob | None:
+        """Dequeue the oldest job (consumer side).
+
+        Args:
+            timeout: Maximum time to wait, or None to wait indefinitely.
+
+        Returns:
+            The job, or None if the consumer was woken by wake().
+
+        Raises:
+            queue.Empty: If no job arrived within the timeout.
+        """
+        while self._head == self._tail:
+            if self._wakeup:
+                self._wakeup = False
+                return None
+            self._not_empty.clear()
+            # Re-check after clearing so a put()/wake() racing with clear()
+            # is not lost
+            if self._head != self._tail or self._wakeup:
+                continue
+            if not self._not_empty.wait(timeout):
+                raise queue.Empty
+
+        head = self._head
+        index = head % self._capacity
+        job = self._slots[index]
+        self._slots[index] = None
+        self._head = head + 1
+        return job
+
+    def wake(self) -> None:
+        """Make a consumer blocked in get() return None."""
+        self._wakeup = True
+        self._not_empty.set()
 
 
 class TranscriptionWorker:
     """Background worker for speech transcription.
 
     Processes audio segments in a background thread to avoid blocking
-    the IBus main loop.
+    the IBus main loop.  While idle the thread is parked on the job queue
+    with no timeout; stop() wakes it explicitly.
+
+    One worker can be shared by several engines: each submit() may carry
+    its own callbacks so results go back to the engine that asked.
+
+    The worker deliberately is one plain thread rather than an asyncio
+    loop handing inference to asyncio.to_thread(): that would add a
+    second thread hop per job and an event loop beside the GLib one,
+    while backends are blocking calls that need a thread either way.
+    For the same reason it is not a ThreadPoolExecutor: one future per
+    submit() would give up micro-batching of queued jobs and prewarming
+    on the inference thread, and most backends are not safe to call from
+    several threads at once.
     """
 
     def __init__(
         self,
         backend: Backend,
-        on_result: Callable[[TranscriptResult], None],
+        on_result: Callable[[TranscriptResult], None] | None = None,
         on_error: Callable[[Exception], None] | None = None,
+        batch_window_ms: int = 0,
+        max_batch: int = 16,
+        prewarm: bool = False,
+        max_pending: int = 4,
     ) -> None:
         """Initialize the worker.
 
         Args:
             backend: Speech recognition backend to use.
-            on_result: Callback for transcription results (called in main loop).
-            on_error: Callback for errors (called in main loop).
+            on_result: Default callback for transcription results (called in
+                main loop).
+            on_error: Default callback for errors (called in main loop).
+            batch_window_ms: How long to wait for further jobs to batch with
+                the first one.  0 only batches jobs that are already queued.
+            max_batch: Maximum number of jobs per backend call.  Batching
+                only applies to backends with ``supports_batch = True``.
+            prewarm: Call the backend's warmup() on the worker thread before
+                accepting jobs, so the first utterance is not a cold start.
+            max_pending: Maximum number of utterances queued or in flight.
+                Callers should check pending_count() before recording
+                another one; submissions beyond the queue size are dropped.
         """
         self._backend = backend
         self._on_result = on_result
         self._on_error = on_error
-
-        self._job_queue: queue.Queue[TranscriptionJob | None] = queue.Queue()
+        self._batch_window = batch_window_ms / 1000.0
+        self._max_batch = max(1, max_batch)
+        self._prewarm = prewarm
+
+        self._max_pending = max(1, max_pending)
+        self._job_queue = SpscSegmentQueue(capacity=self._max_pending)
+        # Jobs refused because the queue was full (producer side only)
+        self._dropped_count = 0
         self._thread: threading.Thread | None = None
         self._stop_event = threading.Event()
 
+        # Completion tracking for wait_for_completion(): _submitted is only
+        # written by the producer, _completed only by the worker thread.
+        self._submitted = 0
+        self._completed = 0
+        self._completed_cond = threading.Condition()
+
+        # Callbacks waiting for the main loop.  Results finished in a burst
+        # share one idle source instead of one idle_add() each.
+        self._pending_calls: list[tuple[Callable, tuple]] = []
+        self._pending_lock = threading.Lock()
+        self._idle_scheduled = False
+
     @property
     def is_running(self) -> bool:
         """Return whether the worker thread is running."""
         return self._thread is not None and self._thread.is_alive()
 
+    @property
+    def max_pending(self) -> int:
+        """Return the maximum number of pending utterances."""
+        return self._max_pending
+
+    @property
+    def dropped_count(self) -> int:
+        """Return the number of jobs dropped because the queue was full."""
+        return self._dropped_count
+
+    def pending_count(self) -> int:
+        """Return the number of submitted jobs not yet completed."""
+        return self._submitted - self._completed
+
     @property
     def backend(self) -> Backend:
         """Return the current backend."""
@@ -89,7 +237,7 @@ class TranscriptionWorker:
             return
 
         self._stop_event.set()
-        self._job_queue.put(None)  # Wake up the thread
+        self._job_queue.wake()
 
         if self._thread:
             self._thread.join(timeout=timeout)
@@ -105,6 +253,8 @@ class TranscriptionWorker:
         segment: AudioSegment,
         locale_hint: str = "en_US",
         options: dict | None = None,
+        on_result: Callable[[TranscriptResult], None] | None = None,
+        on_error: Callable[[Exception], None] | None = None,
     ) -> None:
         """Submit a transcription job.
 
@@ -112,6 +262,8 @@ class TranscriptionWorker:
             segment: Audio segment to transcribe.
             locale_hint: Suggested locale.
             options: Backend-specific options.
+            on_result: Result callback for this job (defaults to the worker's).
+            on_error: Error callback for this job (defaults to the worker's).
         """
         if not self.is_running:
             LOG.warning("Worker not running, starting automatically")
@@ -121,34 +273,127 @@ class TranscriptionWorker:
             segment=segment,
             locale_hint=locale_hint,
             options=options,
+            on_result=on_result,
+            on_error=on_error,
         )
-        self._job_queue.put(job)
+        if not self._job_queue.put(job):
+            # The newest job is the one dropped: evicting the oldest would
+            # mean the producer popping from the consumer's end of the queue
+            self._dropped_count += 1
+            if self._dropped_count % 10 == 1:
+                LOG.error(
+                    "Transcription queue full, dropping job (%d dropped so far)",
+                    self._dropped_count,
+                )
+            self._report_error(RuntimeError("Transcription queue full"), job)
+            return
+        self._submitted += 1
         LOG.debug("Submitted transcription job (%.2fs audio)", segment.duration_seconds)
 
     def _run(self) -> None:
         """Worker thread main loop."""
         LOG.debug("Worker thread running")
 
-        while not self._stop_event.is_set():
-            try:
-                job = self._job_queue.get(timeout=0.1)
-            except queue.Empty:
-                continue
+        if self._prewarm:
+            self._warmup_backend()
 
-            if job is None:
-                # Shutdown signal
+        while True:
+            job = self._job_queue.get()
+            if self._stop_event.is_set():
                 break
+            if job is None:
+                # Stale wakeup left over from a previous stop()
+                continue
 
+            jobs = self._collect_batch(job)
             try:
-                self._process_job(job)
+                self._process_batch(jobs)
             except Exception as e:
                 LOG.exception("Error processing job: %s", e)
-                self._report_error(e)
+                for failed in jobs:
+                    self._report_error(e, failed)
             finally:
-                self._job_queue.task_done()
+                with self._completed_cond:
+                    self._completed += len(jobs)
+                    self._completed_cond.notify_all()
 
         LOG.debug("Worker thread exiting")
 
+    def _warmup_backend(self) -> None:
+        """Prime the backend so the first real job does not pay for it."""
+        warmup = getattr(self._backend, "warmup", None)
+        if warmup is None:
+            return
+        try:
+            warmup()
+            LOG.info("Backend %s warmed up", self._backend.id)
+        except Exception as e:
+            LOG.warning("Backend warmup failed: %s", e)
+
+    def _collect_batch(self, first: TranscriptionJob) -> list[TranscriptionJob]:
+        """Gather further queued jobs to transcribe together with ``first``.
+
+        Only done for batch-capable backends; otherwise jobs are processed
+        one at a time as they arrive.
+        """
+        jobs = [first]
+        if self._max_batch == 1 or not getattr(self._backend, "supports_batch", False):
+            return jobs
+
+        deadline = time.monotonic() + self._batch_window
+        while len(jobs) < self._max_batch:
+            try:
+                job = self._job_queue.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                break
+            if job is None:
+                # Woken by stop(); _run() checks the stop flag next
+                break
+            jobs.append(job)
+        return jobs
+
+    def _process_batch(self, jobs: list[TranscriptionJob]) -> None:
+        """Transcribe a list of jobs, delivering results in submission order."""
+        if len(jobs) == 1 or not getattr(self._backend, "supports_batch", False):
+            for job in jobs:
+                try:
+                    self._process_job(job)
+                except Exception as e:
+                    LOG.exception("Error processing job: %s", e)
+                    self._report_error(e, job)
+            return
+
+        # Consecutive jobs sharing locale and options go into one call
+        for (locale_hint, options), group in itertools.groupby(
+            jobs, key=lambda job: (job.locale_hint, job.options)
+        ):
+            group = list(group)
+            segments = [job.segment for job in group]
+            LOG.debug(
+                "Processing batch: %d segments, locale=%s", len(segments), locale_hint
+            )
+            try:
+                results = list(
+                    self._backend.transcribe_batch(
+                        segments,
+                        locale_hint=locale_hint,
+                        options=options,
+                    )
+                )
+                if len(results) != len(group):
+                    raise ValueError(
+                        f"transcribe_batch returned {len(results)} results "
+                        f"for {len(group)} segments"
+                    )
+            except Exception as e:
+                LOG.exception("Error processing batch: %s", e)
+                for job in group:
+                    self._report_error(e, job)
+                continue
+
+            for job, result in zip(group, results, strict=True):
+                self._post(self._deliver_result, result, job.on_result)
+
     def _process_job(self, job: TranscriptionJob) -> None:
         """Process a single transcription job."""
         LOG.debug(
@@ -166,20 +411,51 @@ class TranscriptionWorker:
         LOG.debug("Transcription result: '%s'", result.text)
 
         # Schedule callback in main loop
-        GLib.idle_add(self._deliver_result, result)
+        self._post(self._deliver_result, result, job.on_result)
+
+    def _post(self, func: Callable, *args) -> None:
+        """Queue a call for the main loop, scheduling a drain if none is pending."""
+        with self._pending_lock:
+            self._pending_calls.append((func, args))
+            if self._idle_scheduled:
+                return
+            self._idle_scheduled = True
+        GLib.idle_add(self._drain_pending)
+
+    def _drain_pending(self) -> bool:
+        """Run every queued call in main loop context."""
+        with self._pending_lock:
+            pending = self._pending_calls
+            self._pending_calls = []
+            self._idle_scheduled = False
+        for func, args in pending:
+            try:
+                func(*args)
+            except Exception as e:
+                LOG.exception("Error in worker callback: %s", e)
+        return False  # Don't repeat
 
-    def _deliver_result(self, result: TranscriptResult) -> bool:
+    def _deliver_result(
+        self,
+        result: TranscriptResult,
+        callback: Callable[[TranscriptResult], None] | None = None,
+    ) -> bool:
         """Deliver result in main loop context."""
+        callback = callback or self._on_result
+        if callback is None:
+            LOG.warning("Dropping transcription result: no result callback")
+            return False
         try:
-            self._on_result(result)
+            callback(result)
         except Exception as e:
             LOG.exception("Error in result callback: %s", e)
         return False  # Don't repeat
 
-    def _report_error(self, error: Exception) -> None:
+    def _report_error(self, error: Exception, job: TranscriptionJob | None = None) -> None:
         """Report error in main loop context."""
-        if self._on_error:
-            GLib.idle_add(self._on_error, error)
+        callback = (job.on_error if job else None) or self._on_error
+        if callback:
+            self._post(callback, error)
 
     def wait_for_completion(self, timeout: float | None = None) -> bool:
         """Wait for all pending jobs to complete.
@@ -190,8 +466,8 @@ class TranscriptionWorker:
         Returns:
             True if all jobs completed, False if timeout.
         """
-        try:
-            self._job_queue.join()
-            return True
-        except Exception:
-            return False
+        submitted = self._submitted
+        with self._completed_cond:
+            return self._completed_cond.wait_for(
+                lambda: self._completed >= submitted, timeout=timeout
+            )
@@ -1,11 +1,13 @@
 import logging
+import os
 import threading
 import queue
 import numpy as np
 import re
 
+from collections import OrderedDict
 from pathlib import Path
-from gi.repository import Gst, GLib
+from gi.repository import Gio, Gst, GLib
 from sttutils import *
 from sttgstbase import STTGstBase
 from sttcurrentlocale import stt_current_locale
@@ -13,6 +15,45 @@ from sttwhispermodel import STTWhisperModel
 
 LOG_MSG = logging.getLogger()
 SPECIAL_PATTERN = re.compile(r'^(?:\[[^\]]+\]|\([^)]+\))$',re.IGNORECASE)
+_special_match = SPECIAL_PATTERN.match
+
+# Level of incoming audio chunks, in the same terms as the VAD below; the
+# peak decays slowly so a pause in speech is measured against the speaker
+PAUSE_PEAK_DECAY = 0.99
+
+# When buffers queue up, up to MAX_BATCH of them (at most one 30 s Whisper
+# window of audio) are transcribed together in one call
+MAX_BATCH = 4
+MAX_BATCH_SAMPLES = 30 * 16000
+
+# Buffers waiting for the worker beyond this are dropped
+MAX_QUEUED_BUFFERS = 8
+
+# Energy-based voice activity detection: 10 ms frames quieter than 35 dB
+# below the recent peak (or than -60 dBFS) are silence. Buffers with less
+# than 10% speech are not transcribed; others are trimmed to the speech
+# plus 200 ms of margin.
+VAD_FRAME = 160
+VAD_RELATIVE_LEVEL = 10 ** (-35 / 20)
+VAD_FLOOR_LEVEL = 10 ** (-60 / 20)
+VAD_PEAK_DECAY = 0.9
+VAD_MIN_SPEECH_RATIO = 0.1
+VAD_MARGIN_FRAMES = 20
+
+# Loaded models by path, most recently used last, so switching back and
+# forth between locales does not reload from disk. The language is passed
+# with each transcription, so one file is only ever loaded once
+MODEL_CACHE_SIZE = 3
+_model_cache = OrderedDict()
+
+# File name suffixes of quantized model variants to try, in order, for each
+# value of the whisper-quantization setting
+QUANTIZATION_SUFFIXES = {
+    'auto': ('-q5_0', '-q8_0'),
+    'q5_0': ('-q5_0',),
+    'q8_0': ('-q8_0',),
+    'none': (),
+}
 
 try:
     from pywhispercpp.model import Model
@@ -65,41 +106,91 @@ class STTGstWhisper(STTGstBase):
         self._model_id = 0
         self._model = None
         self._whisper = None
+        # Path of the loaded model
+        self._loaded_model = None
+        self._settings = Gio.Settings.new("org.freedesktop.ibus.engine.stt")
+        self._quantization_id = self._settings.connect("changed::whisper-quantization",
+                                                       self._quantization_changed)
+        self._lang_code = self._get_lang_code()
         self._set_model()
 
-        self._audio_buffer = []
-        self._buffer_duration = 0.0
-        self._max_buffer_duration = 6.0
-        self._min_buffer_duration = 2.0
+        # Whisper always encodes a 30 s window, so audio is buffered up to
+        # 25 s; a pause of 0.5 s after at least 5 s flushes it earlier, at
+        # a word boundary. Final results flush anything over 2 s.
+        self._max_buffer_duration = 25.0
+        self._min_buffer_duration = 5.0
+        self._min_final_duration = 2.0
+        self._pause_duration = 0.5
         self._sample_rate = 16000
+
+        # Producer-side pause detection
+        self._level_peak = 0.0
+        self._trailing_silence = 0
+
+        # Fixed-size ring of int16 samples; if the worker falls behind the
+        # oldest audio is overwritten, so memory stays bounded. Indexes are
+        # sample counters, masked into the power-of-two sized ring.
+        ring_size = 1 << (int(self._sample_rate * self._max_buffer_duration * 2) - 1).bit_length()
+        self._ring = np.empty(ring_size, dtype=np.int16)
+        self._ring_mask = ring_size - 1
+        self._write_idx = 0
+        self._read_idx = 0
+        self._overwrite_count = 0
+
+        # float32 input for Whisper and VAD peak level, only used by the
+        # worker thread
+        self._float_buf = np.empty(ring_size, dtype=np.float32)
+        self._vad_peak = 0.0
         self._processing = False
-        self._process_queue = queue.Queue()
+        # Lock-free in CPython; None wakes the worker up
+        self._process_queue = queue.SimpleQueue()
+        # Buffers dropped because the worker fell behind
+        self._dropped_count = 0
+        # Buffers queued/processed, for get_final_results(): _queued is only
+        # written by the producer, _processed only by the worker thread
+        self._queued = 0
+        self._processed = 0
+        self._processed_cond = threading.Condition()
+        # The queue has a single producer: serializes _process_audio_buffer()
+        # between the streaming thread and get_final_results()
+        self._buffer_lock = threading.Lock()
         self._process_thread = None
         self._stop_processing = False
 
         self._use_partial_results = False
 
+        # Texts waiting for the main loop; a burst shares one idle source
+        self._pending_text = []
+        self._pending_lock = threading.Lock()
+        self._idle_scheduled = False
+
     def __del__(self):
         LOG_MSG.info("Whisper __del__")
         self._stop_processing = True
+        self._process_queue.put(None)
         if self._process_thread is not None:
             self._process_thread.join(timeout=2.0)
         super().__del__()
 
     def destroy(self):
         self._stop_processing = True
+        self._process_queue.put(None)
         if self._process_thread is not None:
             self._process_thread.join(timeout=2.0)
 
         self._current_locale.disconnect(self._locale_id)
         self._locale_id = 0
 
+        self._settings.disconnect(self._quantization_id)
+        self._quantization_id = 0
+
         if self._model_id != 0:
             self._model.disconnect(self._model_id)
             self._model_id = 0
 
         self._appsink = None
         self._whisper = None
+        _model_cache.clear()
 
         LOG_MSG.info("Whisper.destroy() called")
         super().destroy()
@@ -112,18 +203,24 @@ class STTGstWhisper(STTGstBase):
 
         try:
             LOG_MSG.info("Loading Whisper model: %s", model_path)
-            
-            lang_code = None
-            if self._current_locale and self._current_locale.locale:
-                lang_code = self._current_locale.locale[:2]
-            
-            if lang_code and lang_code != 'multilingual':
-                self._whisper = Model(model_path, language=lang_code, n_threads=2,
-                                     print_realtime=False, print_progress=False)
-            else:
-                self._whisper = Model(model_path, n_threads=2,
-                                     print_realtime=False, print_progress=False)
 
+            key = str(model_path)
+            model = _model_cache.get(key)
+            if model is not None:
+                _model_cache.move_to_end(key)
+                self._whisper = model
+                LOG_MSG.info("Reusing loaded Whisper model")
+                return True
+
+            n_threads = max(2, (os.cpu_count() or 4) // 2)
+            model = Model(model_path, n_threads=n_threads,
+                          print_realtime=False, print_progress=False)
+
+            _model_cache[key] = model
+            while len(_model_cache) > MODEL_CACHE_SIZE:
+                _model_cache.popitem(last=False)
+
+            self._whisper = model
             LOG_MSG.info("Whisper model loaded successfully")
             return True
             
@@ -138,18 +235,27 @@ class STTGstWhisper(STTGstBase):
                         self._model.get_name() if self._model else "None",
                         self._model.get_path() if self._model else "None")
             self._whisper = None
+            self._loaded_model = None
             self.emit("model-changed")
             return
 
-        new_model_path = self._model.get_path()
+        new_model_path = self._quantized_model_path(self._model.get_path())
         LOG_MSG.debug("model ready %s", new_model_path)
 
+        # Nothing to do (and no need to stop the pipeline) if this model is
+        # already loaded
+        loaded_model = str(new_model_path)
+        if self._whisper is not None and loaded_model == self._loaded_model:
+            LOG_MSG.debug("model already loaded")
+            return
+
         # Load the model
         ret, state, pending = self.pipeline.get_state(0)
         if state >= Gst.State.READY:
             self.pipeline.set_state(Gst.State.READY)
 
         success = self._load_whisper_model(new_model_path)
+        self._loaded_model = loaded_model if success else None
 
         if state >= Gst.State.READY:
             self.pipeline.set_state(state)
@@ -157,9 +263,24 @@ class STTGstWhisper(STTGstBase):
         if success:
             self.emit("model-changed")
 
+    def _quantized_model_path(self, model_path):
+        """Return a quantized variant of the model next to it if wanted, else model_path"""
+        path = Path(model_path)
+        suffixes = QUANTIZATION_SUFFIXES.get(self._settings.get_string("whisper-quantization"), ())
+        for suffix in suffixes:
+            candidate = path.with_name(path.stem + suffix + path.suffix)
+            if candidate.is_file():
+                LOG_MSG.debug("using quantized model %s", candidate)
+                return str(candidate)
+        return model_path
+
     def _model_changed(self, model):
         self._set_model_path()
 
+    def _quantization_changed(self, settings, key):
+        if self._model is not None:
+            self._set_model_path()
+
     def _set_model(self):
         if self._model is not None and \
            self._model.get_locale() == self._current_locale.locale:
@@ -173,7 +294,15 @@ class STTGstWhisper(STTGstBase):
         self._model_id = self._model.connect("changed", self._model_changed)
         self._set_model_path()
 
+    def _get_lang_code(self):
+        if self._current_locale and self._current_locale.locale:
+            lang_code = self._current_locale.locale[:2]
+            if lang_code != 'multilingual':
+                return lang_code
+        return None
+
     def _locale_changed(self, locale):
+        self._lang_code = self._get_lang_code()
         self._set_model()
 
     def _on_new_sample(self, appsink):
@@ -187,42 +316,110 @@ class STTGstWhisper(STTGstBase):
         if not success:
             return Gst.FlowReturn.OK
 
-        audio_data = np.frombuffer(map_info.data, dtype=np.int16)
-        buf.unmap(map_info)
-
-        self._audio_buffer.append(audio_data)
-        self._buffer_duration += len(audio_data) / self._sample_rate
-
-        if self._buffer_duration >= self._max_buffer_duration:
-            self._process_audio_buffer()
+        with self._buffer_lock:
+            # Recent gst-python exposes the mapped memory itself as a
+            # memoryview: copy it into the ring (the only copy) before unmapping
+            try:
+                audio_data = np.frombuffer(map_info.data, dtype=np.int16)
+                self._ring_write(audio_data)
+                self._track_pause(audio_data)
+            finally:
+                buf.unmap(map_info)
+
+            duration = self._buffer_duration()
+            if duration >= self._max_buffer_duration or \
+               (duration >= self._min_buffer_duration and
+                self._trailing_silence >= self._pause_duration * self._sample_rate):
+                self._process_audio_buffer(self._min_buffer_duration)
 
         return Gst.FlowReturn.OK
 
-    def _process_audio_buffer(self):
+    def _track_pause(self, audio_data):
+        """Count how many samples of silence end the buffered audio"""
+        if len(audio_data) == 0:
+            return
+        level = float(np.sqrt(np.mean(np.square(audio_data, dtype=np.float32)))) / 32768.0
+        self._level_peak = max(level, self._level_peak * PAUSE_PEAK_DECAY)
+        if level < max(self._level_peak * VAD_RELATIVE_LEVEL, VAD_FLOOR_LEVEL):
+            self._trailing_silence += len(audio_data)
+        else:
+            self._trailing_silence = 0
+
+    def _buffer_duration(self):
+        return (self._write_idx - self._read_idx) / self._sample_rate
+
+    def _ring_write(self, audio_data):
+        """Append samples to the ring, overwriting the oldest ones if full"""
+        size = len(self._ring)
+        n = len(audio_data)
+        dropped = 0
+        if n > size:
+            dropped = n - size
+            audio_data = audio_data[dropped:]
+            n = size
+
+        start = self._write_idx & self._ring_mask
+        first = min(n, size - start)
+        self._ring[start:start + first] = audio_data[:first]
+        self._ring[:n - first] = audio_data[first:]
+        self._write_idx += n
+
+        overflow = max(0, self._write_idx - self._read_idx - size)
+        self._read_idx += overflow
+        overflow += dropped
+        if overflow > 0:
+            self._overwrite_count += overflow
+            LOG_MSG.warning("Whisper audio buffer full, dropped %.2fs of audio (%.2fs in total)",
+                            overflow / self._sample_rate,
+                            self._overwrite_count / self._sample_rate)
+
+    def _ring_read(self):
+        """Remove and return all buffered samples
+
+        The samples are copied out once, into an array the worker thread can
+        own while the ring keeps being written.
+        """
+        start = self._read_idx & self._ring_mask
+        n = self._write_idx - self._read_idx
+        self._read_idx = self._write_idx
+
+        audio = np.empty(n, dtype=np.int16)
+        first = min(n, len(self._ring) - start)
+        audio[:first] = self._ring[start:start + first]
+        audio[first:] = self._ring[:n - first]
+        return audio
+
+    def _process_audio_buffer(self, min_duration):
         """Process accumulated audio buffer"""
-        if len(self._audio_buffer) == 0:
+        if self._write_idx == self._read_idx:
             return
 
-        if self._buffer_duration < self._min_buffer_duration:
-            LOG_MSG.debug("Buffer too short (%.2fs), waiting for more audio", self._buffer_duration)
+        if self._buffer_duration() < min_duration:
+            LOG_MSG.debug("Buffer too short (%.2fs), waiting for more audio", self._buffer_duration())
             return
 
         if self._whisper is None:
             LOG_MSG.warning("Whisper model not loaded")
-            self._audio_buffer.clear()
-            self._buffer_duration = 0.0
+            self._read_idx = self._write_idx
             return
 
-        audio = np.concatenate(self._audio_buffer)
-        self._audio_buffer.clear()
-        self._buffer_duration = 0.0
+        audio = self._ring_read()
+        self._trailing_silence = 0
 
         LOG_MSG.debug("Processing audio buffer: %d samples (%.2f seconds)", 
                      len(audio), len(audio) / self._sample_rate)
 
-        audio_float = audio.astype(np.float32) / 32768.0
-
-        self._process_queue.put(audio_float)
+        # int16 samples are queued as is; the worker converts them
+        # A full queue drops the newest buffer: only the worker may pop, so
+        # evicting the oldest one here would break the single consumer
+        if self._process_queue.qsize() >= MAX_QUEUED_BUFFERS:
+            self._dropped_count += 1
+            if self._dropped_count % 10 == 1:
+                LOG_MSG.warning("Whisper queue full, dropping %.2fs of audio (%d buffers dropped)",
+                                len(audio) / self._sample_rate, self._dropped_count)
+            return
+        self._process_queue.put(audio)
+        self._queued += 1
 
         if self._process_thread is None or not self._process_thread.is_alive():
             self._process_thread = threading.Thread(target=self._process_worker, daemon=True)
@@ -230,55 +427,135 @@ class STTGstWhisper(STTGstBase):
 
     def _process_worker(self):
         """Background worker to process audio"""
-        while not self._stop_processing:
-            try:
-                audio = self._process_queue.get(timeout=0.1)
-            except queue.Empty:
+        # Sleeps in get() until audio arrives or destroy() wakes it
+        held = None
+        while True:
+            if held is not None:
+                audio, held = held, None
+            else:
+                audio = self._process_queue.get()
+            if self._stop_processing:
+                break
+            if audio is None:
                 continue
 
+            batch = [audio]
+            batch_samples = len(audio)
+            while len(batch) < MAX_BATCH:
+                try:
+                    pending = self._process_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if pending is None:
+                    # Keep the wake-up for the next get()
+                    self._process_queue.put(None)
+                    break
+                if batch_samples + len(pending) > MAX_BATCH_SAMPLES:
+                    # Starts the next batch instead
+                    held = pending
+                    break
+                batch.append(pending)
+                batch_samples += len(pending)
+
             if self._whisper is None:
-                self._process_queue.task_done()
+                self._task_done(len(batch))
+                continue
+
+            audio = self._trim_silence(self._to_float(batch, batch_samples))
+            if audio is None:
+                LOG_MSG.debug("No speech in audio buffer, skipping transcription")
+                self._task_done(len(batch))
                 continue
 
             try:
                 LOG_MSG.debug("Starting transcription of %d samples", len(audio))
-                
-                segments = self._whisper.transcribe(audio)
-                
-                text_parts = []
-                for segment in segments:
-                    if not hasattr(segment, 'text'):
-                        continue
 
-                    segment_text = segment.text.strip()
-                    if SPECIAL_PATTERN.match(segment_text):
-                        continue
+                # Set per call: the model may be shared with other locales
+                segments = self._whisper.transcribe(audio, language=self._lang_code or 'auto')
 
-                    if segment_text:
-                        text_parts.append(segment_text)
-                        LOG_MSG.debug("Segment text: '%s'", segment_text)
+                # Drop empty segments and non-speech markers like "[BLANK_AUDIO]"
+                text_parts = [segment_text for segment in segments
+                              if (segment_text := getattr(segment, 'text', '').strip())
+                              and not _special_match(segment_text)]
+                LOG_MSG.debug("Segment texts: %s", text_parts)
 
-                text = ' '.join(text_parts).strip()
+                text = ' '.join(text_parts)
 
                 if text:
                     LOG_MSG.info("Whisper transcription result: '%s'", text)
-                    GLib.idle_add(self._emit_text, text)
+                    self._queue_text(text)
                 else:
                     LOG_MSG.debug("No text transcribed from audio")
 
             except Exception as e:
                 LOG_MSG.error("Whisper transcription error: %s", e, exc_info=True)
 
-            self._process_queue.task_done()
-
-    def _emit_text(self, text):
-        self.emit("text", text)
+            self._task_done(len(batch))
+
+    def _to_float(self, batch, n):
+        """Scale int16 buffers to [-1, 1) float32, back to back, into a reused buffer"""
+        if len(self._float_buf) < n:
+            self._float_buf = np.empty(n, dtype=np.float32)
+        out = self._float_buf[:n]
+        pos = 0
+        for samples in batch:
+            np.multiply(samples, np.float32(1.0 / 32768.0),
+                        out=out[pos:pos + len(samples)], dtype=np.float32)
+            pos += len(samples)
+        return out
+
+    def _trim_silence(self, audio):
+        """Return audio without leading/trailing silence, None if it is mostly silence"""
+        frames = len(audio) // VAD_FRAME
+        if frames == 0:
+            return audio
+
+        framed = audio[:frames * VAD_FRAME].reshape(frames, VAD_FRAME)
+        # einsum sums squares per frame in one vectorized pass, without a
+        # full-size temporary for the squared samples
+        rms = np.sqrt(np.einsum('ij,ij->i', framed, framed) / VAD_FRAME)
+        self._vad_peak = max(float(rms.max()), self._vad_peak * VAD_PEAK_DECAY)
+        threshold = max(self._vad_peak * VAD_RELATIVE_LEVEL, VAD_FLOOR_LEVEL)
+
+        speech = rms >= threshold
+        if np.count_nonzero(speech) < VAD_MIN_SPEECH_RATIO * frames:
+            return None
+
+        first = max(0, int(np.argmax(speech)) - VAD_MARGIN_FRAMES)
+        last = frames - int(np.argmax(speech[::-1])) + VAD_MARGIN_FRAMES
+        end = len(audio) if last >= frames else last * VAD_FRAME
+        return audio[first * VAD_FRAME:end]
+
+    def _task_done(self, count=1):
+        with self._processed_cond:
+            self._processed += count
+            self._processed_cond.notify_all()
+
+    def _queue_text(self, text):
+        with self._pending_lock:
+            self._pending_text.append(text)
+            if self._idle_scheduled:
+                return
+            self._idle_scheduled = True
+        GLib.idle_add(self._emit_text)
+
+    def _emit_text(self):
+        with self._pending_lock:
+            pending = self._pending_text
+            self._pending_text = []
+            self._idle_scheduled = False
+        for text in pending:
+            self.emit("text", text)
         return False
 
     def get_final_results(self):
-        if len(self._audio_buffer) > 0:
-            self._process_audio_buffer()
-        self._process_queue.join()
+        with self._buffer_lock:
+            if self._write_idx != self._read_idx:
+                self._process_audio_buffer(self._min_final_duration)
+            queued = self._queued
+
+        with self._processed_cond:
+            self._processed_cond.wait_for(lambda: self._processed >= queued)
 
     def get_results(self):
         pass
@@ -44,6 +44,14 @@ def _helper_merge_online_choices(models_dict, online_models):
         else:
             models_dict[model.name]=model
 
+def _helper_model_key(model_desc):
+    # Same key as the online managers: custom models are keyed by path since
+    # two of them can share a file name
+    if model_desc.custom == True and any(model_desc.paths) == True:
+        return model_desc.paths[0]
+
+    return model_desc.name
+
 @Gtk.Template(resource_path="/org/freedesktop/ibus/engine/stt/config/sttmodelchooserdialog.ui")
 class STTModelChooserDialog(Gtk.Dialog):
     __gtype_name__="STTModelChooserDialog"
@@ -54,7 +62,10 @@ class STTModelChooserDialog(Gtk.Dialog):
     def __init__(self, model=None, **kwargs):
         super().__init__(**kwargs)
 
+        # Rows keyed by model name (path for custom models): the managers
+        # may hand out a new description object for a model already listed
         self._model_dict={}
+        self._first_row=None
 
         self._model=model
 
@@ -62,25 +73,18 @@ class STTModelChooserDialog(Gtk.Dialog):
         self._manager = stt_whisper_online_model_manager() if self._is_whisper else stt_vosk_online_model_manager()
 
         locale_str=model.get_locale()
-        full_list=[]
+        locales=[locale_str]
+        if len(locale_str) > 2:
+            locales.append(locale_str[:2])
 
-        # For Whisper, use deduplication to avoid showing multilingual models twice
-        if self._is_whisper:
-            seen_models = set()
-            models_to_check = [locale_str]
-            if len(locale_str) > 2:
-                models_to_check.append(locale_str[:2])
-
-            for loc in models_to_check:
-                for model_desc in self._manager.get_models_for_locale(loc):
-                    if model_desc.name not in seen_models:
-                        seen_models.add(model_desc.name)
-                        full_list.append(model_desc)
-        else:
-            # For Vosk, use the original logic (concatenate lists)
-            full_list = self._manager.get_models_for_locale(locale_str)
-            if len(locale_str) > 2:
-                full_list += self._manager.get_models_for_locale(locale_str[:2])
+        # Merge by key so a multilingual model found for both the full
+        # locale and the language is only listed once
+        merged={}
+        for loc in locales:
+            for model_desc in self._manager.get_models_for_locale(loc):
+                merged.setdefault(_helper_model_key(model_desc), model_desc)
+
+        full_list=list(merged.values())
 
 
         LOG_MSG.debug("%i available models for %s", len(full_list), locale_str)
@@ -96,10 +100,11 @@ class STTModelChooserDialog(Gtk.Dialog):
         self.set_title(_("Manage %s Recognition Models") % backend_name)
 
     def _add_row(self, model_desc):
-        # Get first button available for the radio_group
-        other_row=next(iter(self._model_dict.values())) if any(self._model_dict.values()) else None
-        row=STTModelRow(desc=model_desc, model=self._model, row=other_row)
-        self._model_dict[id(model_desc)]=row
+        # First row provides the radio_group
+        row=STTModelRow(desc=model_desc, model=self._model, row=self._first_row)
+        self._model_dict[_helper_model_key(model_desc)]=row
+        if self._first_row is None:
+            self._first_row=row
 
         if model_desc.is_obsolete == True and row.check_button.get_active() == False:
             row.set_visible(self.obsolete_button.get_active())
@@ -115,15 +120,24 @@ class STTModelChooserDialog(Gtk.Dialog):
 
     def _model_path_changed_cb(self, manager, model_desc):
         # Check if model path or name is already in the list and update
-        row=self._model_dict.get(id(model_desc), None)
+        row=self._model_dict.get(_helper_model_key(model_desc), None)
         if row is not None:
             row.update_description()
 
     def _model_path_removed_cb(self, manager, model_desc):
         # Check if model path or name is already in the list
-        row=self._model_dict.get(id(model_desc), None)
+        if model_desc.custom == True and any(model_desc.paths) == False:
+            # The path of a removed custom model is already gone, so look
+            # its row up by description instead
+            key=next((key for key, row in self._model_dict.items() if row.get_desc() is model_desc), None)
+        else:
+            key=_helper_model_key(model_desc)
+
+        row=self._model_dict.pop(key, None)
         if row is not None:
             self.model_list.remove(row)
+            if row is self._first_row:
+                self._first_row=next(iter(self._model_dict.values()), None)
 
     @Gtk.Template.Callback()
     def obsolete_button_toggled_cb(self, button):
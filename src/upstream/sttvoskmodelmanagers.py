@@ -132,6 +132,8 @@ class STTVoskModelDescription(GObject.Object):
                 blocksize = max(blocksize, length // 20)
             else:
                 length=0
+                # Set once, it does not change while downloading
+                self.download_progress=STTDownloadState.UNKNOWN_PROGRESS
 
             with tempfile.NamedTemporaryFile(delete=True) as tmp_file:
                 size=0
@@ -148,8 +150,6 @@ class STTVoskModelDescription(GObject.Object):
                     size+=len(buffer)
                     if length != 0:
                         self.download_progress=size/length
-                    else:
-                        self.download_progress=STTDownloadState.UNKNOWN_PROGRESS
 
                 tmp_file.flush()
                 self._model_downloaded_thread(tmp_file.name, destination, status)
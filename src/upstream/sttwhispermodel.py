@@ -7,6 +7,23 @@ from sttwhispermodelmanagers import stt_whisper_local_model_manager
 
 LOG_MSG = logging.getLogger()
 
+# Last parsed "whisper-models" value as (JSON string, dict): every model
+# gets the same changed:: notification, so only the first one parses it.
+# The dict is shared and must not be modified.
+_models_cache = (None, {})
+
+def _parse_models(models_json_string):
+    global _models_cache
+
+    if models_json_string in (None, "None", ""):
+        return {}
+
+    cached_string, models_dict = _models_cache
+    if cached_string != models_json_string:
+        models_dict = json.loads(models_json_string)
+        _models_cache = (models_json_string, models_dict)
+    return models_dict
+
 class STTWhisperModel(GObject.Object):
     __gtype_name__ = "STTWhisperModel"
     __gsignals__ = {
@@ -37,11 +54,7 @@ class STTWhisperModel(GObject.Object):
             stt_whisper_local_model_manager().unregister_custom_model_path(self._model_path)
 
     def _get_model_from_settings(self):
-        models_json_string = self._settings.get_string("whisper-models")
-        if models_json_string in (None, "None", ""):
-            return None
-
-        models_dict = json.loads(models_json_string)
+        models_dict = _parse_models(self._settings.get_string("whisper-models"))
         return models_dict.get(self._locale_str, None)
 
     def _set_model(self, model):
@@ -136,16 +149,17 @@ class STTWhisperModel(GObject.Object):
         return self._model_path
 
     def set_name(self, model_name):
+        global _models_cache
+
         self._set_model(model_name)
 
-        models_json_string = self._settings.get_string("whisper-models")
-        if models_json_string in (None, "None", ""):
-            models_dict = {}
-        else:
-            models_dict = json.loads(models_json_string)
+        models_dict = dict(_parse_models(self._settings.get_string("whisper-models")))
+        if models_dict.get(self._locale_str) == model_name:
+            return
 
         models_dict[self._locale_str] = model_name
         models_json_string = json.dumps(models_dict)
+        _models_cache = (models_json_string, models_dict)
 
         self._settings.disconnect(self._settings_id)
         self._settings.set_string("whisper-models", models_json_string)
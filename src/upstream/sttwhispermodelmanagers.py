@@ -1,17 +1,28 @@
 import os
 import json
+import bisect
+import itertools
 import logging
+import re
 from re import search
 from pathlib import Path
 import urllib.request
 from enum import Enum
 import tempfile
 import shutil
+import stat
 import uuid
 import threading
 
 from gi.repository import GObject, Gio, GLib
 
+try:
+    import urllib3
+    # Shared across downloads so the connection to the model host is reused
+    _POOL = urllib3.PoolManager(maxsize=4)
+except ImportError:
+    _POOL = None
+
 LOG_MSG = logging.getLogger()
 
 # Whisper model directories
@@ -22,6 +33,17 @@ MODEL_DIRS = [
     Path('/usr/local/share/whisper')
 ]
 
+# Lookup tables for MODEL_DIRS: position of each directory, used to order
+# the paths of a model, and the directory paths as strings
+_MODEL_DIR_INDEX = {Path(d): i for i, d in enumerate(MODEL_DIRS) if d}
+_MODEL_DIR_STRS = frozenset(str(d) for d in _MODEL_DIR_INDEX)
+
+# ggml-<type>[.en]...bin, e.g. ggml-large-v3.bin or ggml-base.en-q5_1.bin
+_GGML_NAME_RE = re.compile(r"ggml-([^.]+)(\.en(?=[.-]))?")
+
+def _model_dir_priority(path_str):
+    return _MODEL_DIR_INDEX.get(Path(path_str).parent, len(MODEL_DIRS))
+
 # Hugging Face model repository
 MODEL_PRE_URL = 'https://huggingface.co/ggerganov/whisper.cpp/resolve/main/'
 WHISPER_MODELS = {
@@ -40,6 +62,14 @@ WHISPER_MODELS = {
 
 DOWNLOADED_MODEL_SUFFIX = ".downloaded_model_tmp"
 
+# Cancellation of a model download is checked every this many blocks
+DOWNLOAD_CANCEL_CHECK_BLOCKS = 16
+
+# Read size for model downloads: 128 KiB to 1 MiB keeps read()/write()
+# calls per MB low without holding large buffers
+DOWNLOAD_MIN_BLOCKSIZE = 128 * 1024
+DOWNLOAD_MAX_BLOCKSIZE = 1024 * 1024
+
 def _helper_locale_normalize(locale_str):
     lang = locale_str[0:2].lower()
     if len(locale_str) < 5:
@@ -48,17 +78,69 @@ def _helper_locale_normalize(locale_str):
     lang2 = locale_str[3:5]
     return lang + "_" + lang2.upper()
 
+def _open_download(download_link):
+    """Open download_link for streaming, through the shared pool if urllib3 is there
+
+    urllib3 hands the connection back to the pool once the body is read to
+    the end; closing the response only drops it after an interrupted download.
+    """
+    if _POOL is None:
+        return urllib.request.urlopen(download_link)
+
+    response = _POOL.request("GET", download_link, preload_content=False)
+    if response.status >= 400:
+        response.close()
+        raise OSError("HTTP error %i for %s" % (response.status, download_link))
+    return response
+
+def _fsync_directory(directory):
+    """Make a rename in directory durable"""
+    try:
+        fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+    except OSError as e:
+        LOG_MSG.debug("cannot open %s to sync it: %s", directory, e)
+        return
+
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+class _DownloadCancelled(Exception):
+    pass
+
+class _ProgressWriter:
+    """File proxy for shutil.copyfileobj() that reports each write to a callback"""
+    __slots__ = ("_file", "_callback")
+
+    def __init__(self, file, callback):
+        self._file = file
+        self._callback = callback
+
+    def write(self, buffer):
+        self._callback(len(buffer))
+        return self._file.write(buffer)
+
+def _helper_models_for_locale_iter(locales_dict, locale_str):
+    """Iterate over the models of a locale followed by the multilingual ones, without copying"""
+    models = locales_dict.get(locale_str, ())
+    if locale_str == 'multilingual':
+        return iter(models)
+    return itertools.chain(models, locales_dict.get('multilingual', ()))
+
 class STTDownloadState(float, Enum):
     STOPPED = -1.0
     UNKNOWN_PROGRESS = -0.5
     UNPACKING = -0.6
     ONGOING = 0.0
 
-class STTWhisperModelDescription(GObject.Object):
-    __gtype_name__ = "STTWhisperModelDescription"
+# Plain object: descriptions have no signals or properties, they only travel
+# as arguments of the managers' signals
+class STTWhisperModelDescription:
+    __slots__ = ("name", "custom", "is_obsolete", "paths", "size", "type", "locale", "url",
+                 "_operation", "download_progress")
 
     def __init__(self, init_model=None):
-        super().__init__()
         self.name = init_model.name if init_model is not None else ""
         self.custom = init_model.custom if init_model is not None else False
         self.is_obsolete = False
@@ -76,12 +158,12 @@ class STTWhisperModelDescription(GObject.Object):
             self._operation = None
 
     def _download_model_thread(self, download_link, destination, status):
-        with urllib.request.urlopen(download_link) as response:
-            length_str = response.getheader('content-length')
-            blocksize = 4096
+        with _open_download(download_link) as response:
+            length_str = response.headers.get('content-length')
+            blocksize = DOWNLOAD_MIN_BLOCKSIZE
             if length_str:
                 length = int(length_str)
-                blocksize = max(blocksize, length // 20)
+                blocksize = min(DOWNLOAD_MAX_BLOCKSIZE, max(blocksize, length // 100))
             else:
                 length = 0
 
@@ -89,33 +171,52 @@ class STTWhisperModelDescription(GObject.Object):
             copy_id = uuid.uuid4()
             tmp_dst = Path(str(destination) + str(copy_id) + DOWNLOADED_MODEL_SUFFIX)
 
+            size = 0
+            blocks = 0
+            last_percent = -1
+            if length == 0:
+                self.download_progress = STTDownloadState.UNKNOWN_PROGRESS
+
+            # is_cancelled() goes through PyGObject, so it is only polled
+            # every few blocks; the check after the rename catches the rest
+            is_cancelled = status.is_cancelled
+
+            def on_bytes(count):
+                nonlocal size, blocks, last_percent
+                if blocks % DOWNLOAD_CANCEL_CHECK_BLOCKS == 0 and is_cancelled():
+                    raise _DownloadCancelled()
+
+                blocks += 1
+                size += count
+                if length == 0:
+                    return
+
+                # Only publish whole-percent steps, each one wakes up the UI
+                percent = size * 100 // length
+                if percent != last_percent:
+                    last_percent = percent
+                    self.download_progress = percent / 100
+
             try:
                 with open(tmp_dst, 'wb') as tmp_file:
-                    size = 0
-                    while True:
-                        if status.is_cancelled():
-                            tmp_file.close()
-                            if tmp_dst.exists():
-                                tmp_dst.unlink()
-                            return
-
-                        buffer = response.read(blocksize)
-                        if buffer is None or len(buffer) == 0:
-                            break
-
-                        tmp_file.write(buffer)
-                        size += len(buffer)
-                        if length != 0:
-                            self.download_progress = size / length
-                        else:
-                            self.download_progress = STTDownloadState.UNKNOWN_PROGRESS
-
-                os.rename(tmp_dst, destination)
-
-                if status.is_cancelled():
+                    shutil.copyfileobj(response, _ProgressWriter(tmp_file, on_bytes), blocksize)
+                    # Data on disk before the rename, or a crash could leave a
+                    # truncated model under the final name
+                    tmp_file.flush()
+                    os.fsync(tmp_file.fileno())
+
+                os.replace(tmp_dst, destination)
+                _fsync_directory(destination.parent)
+
+                if is_cancelled():
                     if destination.exists():
                         destination.unlink()
 
+            except _DownloadCancelled:
+                if tmp_dst.exists():
+                    tmp_dst.unlink()
+                return
+
             except Exception as e:
                 LOG_MSG.error("Download error: %s", e)
                 if tmp_dst.exists():
@@ -144,7 +245,7 @@ class STTWhisperModelDescription(GObject.Object):
         download_thread.start()
 
     def get_best_path_for_model(self):
-        if self.paths in [None, []]:
+        if not self.paths:
             return None
 
         return self.paths[0]
@@ -178,9 +279,15 @@ class STTWhisperLocalModelManager(GObject.Object):
         self._models_dict = {}
         self._locales_dict = {}
         self._model_paths_dict = {}
-        self._get_available_local_models()
         self._custom_paths = {}
 
+        # Monitors go in first so no change is missed; the directories are
+        # then scanned from the main loop, one per idle callback, and found
+        # models are announced through "added" like later ones
+        self._install_monitors()
+        self._dirs_to_scan = [directory for directory in MODEL_DIRS if directory]
+        self._scan_id = GLib.idle_add(self._initial_scan)
+
     def _add_model_description_to_locale(self, model_desc):
         if model_desc.locale is None:
             return
@@ -192,24 +299,28 @@ class STTWhisperLocalModelManager(GObject.Object):
             models_list.append(model_desc)
 
     def _new_model_available(self, model_path):
+        # Same string for the lookups, the dict keys and the "added" signal
+        path_str = str(model_path)
 
-        if str(model_path).endswith(DOWNLOADED_MODEL_SUFFIX):
+        if path_str.endswith(DOWNLOADED_MODEL_SUFFIX):
             LOG_MSG.debug("model path is a temporary file (%s)", model_path)
             return None
 
-        if not model_path.is_file():
-            LOG_MSG.debug("model path is not a file (%s)", model_path)
-            return None
-
         if not model_path.name.endswith('.bin'):
             LOG_MSG.debug("model path is not a .bin file (%s)", model_path)
             return None
 
-        if not os.access(model_path, os.R_OK):
-            LOG_MSG.debug("access rights are wrong (%s)", model_path)
+        # One stat() per candidate; an unreadable file fails when the model
+        # is loaded, so there is no separate access() check
+        try:
+            mode = model_path.stat().st_mode
+        except OSError:
+            mode = 0
+        if not stat.S_ISREG(mode):
+            LOG_MSG.debug("model path is not a file (%s)", model_path)
             return None
 
-        if self.path_available(str(model_path)):
+        if self.path_available(path_str):
             LOG_MSG.debug("model file already in list (%s)", model_path)
             return None
 
@@ -217,11 +328,10 @@ class STTWhisperLocalModelManager(GObject.Object):
         model_type = None
         model_name = model_path.name
 
-        if model_name.startswith("ggml-"):
-            parts = model_name.replace("ggml-", "").split(".")
-            model_type = parts[0]
-
-            if ".en" in model_name:
+        match = _GGML_NAME_RE.match(model_name)
+        if match:
+            model_type = match.group(1)
+            if match.group(2):
                 locale_str = "en"
                 model_type += ".en"
             else:
@@ -229,16 +339,16 @@ class STTWhisperLocalModelManager(GObject.Object):
         else:
             LOG_MSG.debug("non-standard name format (%s)", model_path)
 
-        if model_path.parent not in MODEL_DIRS:
+        if model_path.parent not in _MODEL_DIR_INDEX:
             model_desc = STTWhisperModelDescription()
-            model_desc.paths = [str(model_path)]
+            model_desc.paths = [path_str]
             model_desc.name = model_name
             model_desc.custom = True
             model_desc.locale = locale_str
             model_desc.type = model_type
 
-            self._models_dict[str(model_path)] = model_desc
-            self._model_paths_dict[str(model_path)] = model_desc
+            self._models_dict[path_str] = model_desc
+            self._model_paths_dict[path_str] = model_desc
 
             LOG_MSG.debug("custom model file is valid (%s)", model_path)
             return model_desc
@@ -246,24 +356,26 @@ class STTWhisperLocalModelManager(GObject.Object):
         model_desc = self._models_dict.get(model_name, None)
         if model_desc is None:
             model_desc = STTWhisperModelDescription()
-            model_desc.paths = [str(model_path)]
+            model_desc.paths = [path_str]
             model_desc.locale = locale_str
             model_desc.type = model_type
             model_desc.name = model_name
 
             self._add_model_description_to_locale(model_desc)
             self._models_dict[model_desc.name] = model_desc
-            self._model_paths_dict[str(model_path)] = model_desc
+            self._model_paths_dict[path_str] = model_desc
 
             LOG_MSG.debug("model file is valid (%s) - name not known yet", model_path)
-            self.emit("added", model_name, str(model_path))
+            self.emit("added", model_name, path_str)
             return model_desc
 
-        model_desc.paths.append(str(model_path))
-        model_desc.paths.sort(key=lambda element: MODEL_DIRS.index(Path(element).parent))
+        # Paths stay ordered by directory priority; insort() keeps the list
+        # object, which the online manager's description may share
+        bisect.insort(model_desc.paths, path_str, key=_model_dir_priority)
+        self._model_paths_dict[path_str] = model_desc
 
         LOG_MSG.debug("model file is valid (%s) - name already known", model_path)
-        self.emit("added", model_name, str(model_path))
+        self.emit("added", model_name, path_str)
         return model_desc
 
     def _remove_model_description(self, model_path):
@@ -274,11 +386,11 @@ class STTWhisperLocalModelManager(GObject.Object):
         LOG_MSG.debug("model file removed (%s)", model_path)
 
         model_desc.paths.remove(model_path)
-        if not any(model_desc.paths):
+        if not model_desc.paths:
             models_list = self._locales_dict.get(model_desc.locale, [])
             if model_desc in models_list:
                 models_list.remove(model_desc)
-            if not any(models_list):
+            if not models_list:
                 self._locales_dict.pop(model_desc.locale, None)
 
             key = model_desc.name if model_desc.custom is False else model_path
@@ -288,26 +400,25 @@ class STTWhisperLocalModelManager(GObject.Object):
         self.emit("removed", model_name, model_path)
 
     def _model_file_changed_cb(self, monitor, file, other_file, event_type):
-        LOG_MSG.debug("a file changed (source = %s) %s %s", self, file.get_path(), event_type)
+        file_path = file.get_path()
+        LOG_MSG.debug("a file changed (source = %s) %s %s", self, file_path, event_type)
 
-        if file.get_path() in [str(d) for d in MODEL_DIRS if d]:
+        if file_path in _MODEL_DIR_STRS:
             LOG_MSG.debug("change does not concern a child of a top directory. Ignoring.")
             return
 
-        LOG_MSG.info("a model file changed (%s) (event=%s)", file.get_path(), event_type)
+        LOG_MSG.info("a model file changed (%s) (event=%s)", file_path, event_type)
         if event_type == Gio.FileMonitorEvent.CHANGES_DONE_HINT:
-            if file.get_path().endswith(DOWNLOADED_MODEL_SUFFIX):
-                LOG_MSG.debug("temporary file ignored (%s)", file.get_path())
+            if file_path.endswith(DOWNLOADED_MODEL_SUFFIX):
+                LOG_MSG.debug("temporary file ignored (%s)", file_path)
                 return
 
-            self._new_model_available(Path(file.get_path()))
+            self._new_model_available(Path(file_path))
         elif event_type == Gio.FileMonitorEvent.DELETED:
-            self._remove_model_description(file.get_path())
+            self._remove_model_description(file_path)
 
-    def _get_available_local_models(self):
+    def _install_monitors(self):
         for directory in MODEL_DIRS:
-            LOG_MSG.debug("scanning %s for models", directory)
-
             if directory is None:
                 continue
 
@@ -315,22 +426,43 @@ class STTWhisperLocalModelManager(GObject.Object):
             monitor.connect("changed", self._model_file_changed_cb)
             self._monitors.append(monitor)
 
-            directory_path = Path(directory)
-            if not directory_path.is_dir():
-                continue
+    def _initial_scan(self):
+        directory = self._dirs_to_scan.pop(0)
+        LOG_MSG.debug("scanning %s for models", directory)
+
+        # DirEntry answers is_file() from the directory listing, and
+        # only .bin files are turned into Path objects. "added" is still
+        # emitted for every model found: the scan runs after the online
+        # manager and STTWhisperModel have connected, and they learn about
+        # existing models that way
+        try:
+            entries = os.scandir(directory)
+        except OSError:
+            entries = None
+
+        if entries is not None:
+            with entries:
+                for entry in entries:
+                    if not entry.name.endswith('.bin') or not entry.is_file():
+                        continue
+
+                    LOG_MSG.debug("scanning file (%s)", entry.path)
+                    self._new_model_available(Path(entry.path))
 
-            for child in directory_path.iterdir():
-                LOG_MSG.debug("scanning file (%s)", str(child))
-                self._new_model_available(child)
+        if self._dirs_to_scan:
+            return True
+
+        self._scan_id = 0
+        return False
 
     def path_available(self, model_path):
         return model_path in self._model_paths_dict
 
+    def get_models_for_locale_iter(self, locale_str):
+        return _helper_models_for_locale_iter(self._locales_dict, locale_str)
+
     def get_models_for_locale(self, locale_str):
-        models = self._locales_dict.get(locale_str, []).copy()
-        multilingual = self._locales_dict.get("multilingual", [])
-        models.extend(multilingual)
-        return models
+        return list(self.get_models_for_locale_iter(locale_str))
 
     def get_best_path_for_model(self, model_name):
         if model_name is None:
@@ -340,7 +472,7 @@ class STTWhisperLocalModelManager(GObject.Object):
         if model is None:
             return None
 
-        if model.paths in [None, []]:
+        if not model.paths:
             return None
 
         return model.paths[0]
@@ -348,24 +480,27 @@ class STTWhisperLocalModelManager(GObject.Object):
     def get_model_description(self, model_name):
         return self._models_dict.get(model_name, None)
 
+    def get_model_descriptions(self):
+        return self._models_dict.values()
+
     def get_supported_locales(self):
         return list(self._locales_dict.keys())
 
     def _custom_model_file_changed_cb(self, monitor, file, other_file, event_type):
-        LOG_MSG.info("a custom model file changed (%s) (event=%s)", file.get_path(), event_type)
+        file_path = file.get_path()
+        LOG_MSG.info("a custom model file changed (%s) (event=%s)", file_path, event_type)
         if event_type == Gio.FileMonitorEvent.CHANGES_DONE_HINT:
-            self._new_model_available(Path(file.get_path()))
+            self._new_model_available(Path(file_path))
         elif event_type == Gio.FileMonitorEvent.DELETED:
-            model = self._model_paths_dict.get(file.get_path(), None)
-            if model is None:
+            if self._model_paths_dict.pop(file_path, None) is None:
                 return
 
-            LOG_MSG.debug("custom model file removed (%s)", file.get_path())
-            self._model_paths_dict.pop(file.get_path(), None)
-            self.emit("removed", None, file.get_path())
+            LOG_MSG.debug("custom model file removed (%s)", file_path)
+            self.emit("removed", None, file_path)
 
     def register_custom_model_path(self, model_path_str, locale_str):
-        if Path(model_path_str).parent in MODEL_DIRS:
+        model_path = Path(model_path_str)
+        if model_path.parent in _MODEL_DIR_INDEX:
             LOG_MSG.debug("registered a path in default directories (%s)", model_path_str)
             return
 
@@ -381,7 +516,7 @@ class STTWhisperLocalModelManager(GObject.Object):
         self._custom_paths[model_path_str] = monitor
         monitor.refcount = 1
 
-        model_desc = self._new_model_available(Path(model_path_str))
+        model_desc = self._new_model_available(model_path)
         if model_desc:
             model_desc.locale = locale_str
             self._add_model_description_to_locale(model_desc)
@@ -429,6 +564,7 @@ class STTWhisperOnlineModelManager(GObject.Object):
         self._populate_with_whisper_models()
 
     def _populate_with_whisper_models(self):
+        local_manager = stt_whisper_local_model_manager()
         model_sizes = {
             'tiny': '75 MB',
             'tiny.en': '75 MB',
@@ -458,7 +594,7 @@ class STTWhisperOnlineModelManager(GObject.Object):
 
             LOG_MSG.debug("adding online model (%s)", model_desc.name)
 
-            local_desc = stt_whisper_local_model_manager().get_model_description(model_desc.name)
+            local_desc = local_manager.get_model_description(model_desc.name)
             if local_desc is not None:
                 model_desc.paths = local_desc.paths
 
@@ -471,22 +607,24 @@ class STTWhisperOnlineModelManager(GObject.Object):
             self._online_models[model_desc.name] = model_desc
             self._add_model_description_to_locale(model_desc)
 
-        for locale in stt_whisper_local_model_manager().get_supported_locales():
-            model_list = stt_whisper_local_model_manager().get_models_for_locale(locale)
-            LOG_MSG.debug("adding local models for locale (%s)", locale)
-            for model_desc in model_list:
-                key = model_desc.name if model_desc.custom is False else model_desc.paths[0]
-                if key in self._online_models:
-                    continue
+        # Each local model once; going through get_models_for_locale() would
+        # copy the multilingual list again for every locale
+        for model_desc in local_manager.get_model_descriptions():
+            if model_desc.locale is None:
+                continue
 
-                if model_desc.custom is False:
-                    bin_key = key if key.endswith('.bin') else key + '.bin'
-                    if bin_key in self._online_models or key.replace('.bin', '') in self._online_models:
-                        continue
+            key = model_desc.name if model_desc.custom is False else model_desc.paths[0]
+            if key in self._online_models:
+                continue
 
-                LOG_MSG.debug("adding local model to online dict (%s)", key)
-                self._online_models[key] = model_desc
-                self._add_model_description_to_locale(model_desc)
+            if model_desc.custom is False:
+                bin_key = key if key.endswith('.bin') else key + '.bin'
+                if bin_key in self._online_models or key.replace('.bin', '') in self._online_models:
+                    continue
+
+            LOG_MSG.debug("adding local model to online dict (%s)", key)
+            self._online_models[key] = model_desc
+            self._add_model_description_to_locale(model_desc)
 
     def _add_model_description_to_locale(self, model_desc):
         locale_models = self._locales_dict.get(model_desc.locale, None)
@@ -505,7 +643,7 @@ class STTWhisperOnlineModelManager(GObject.Object):
             local_model_desc = manager.get_model_description(model_path)
 
         if online_model_desc is not None:
-            if online_model_desc.paths in [None, []]:
+            if not online_model_desc.paths:
                 online_model_desc.paths = local_model_desc.paths
 
             self.emit("changed", online_model_desc)
@@ -520,7 +658,7 @@ class STTWhisperOnlineModelManager(GObject.Object):
         locale_models = self._locales_dict.get(model_desc.locale, None)
         if locale_models and model_desc in locale_models:
             locale_models.remove(model_desc)
-        if not any(locale_models):
+        if not locale_models:
             self._locales_dict.pop(model_desc.locale, None)
 
     def _model_path_removed_cb(self, manager, model_name, model_path):
@@ -535,7 +673,7 @@ class STTWhisperOnlineModelManager(GObject.Object):
         if online_model_desc is None:
             return
 
-        if any(online_model_desc.paths):
+        if online_model_desc.paths:
             self.emit("changed", online_model_desc)
             return
 
@@ -550,12 +688,11 @@ class STTWhisperOnlineModelManager(GObject.Object):
     def get_model_description(self, model_name):
         return self._online_models.get(model_name, None)
 
+    def get_models_for_locale_iter(self, locale_str):
+        return _helper_models_for_locale_iter(self._locales_dict, locale_str)
+
     def get_models_for_locale(self, locale_str):
-        models = self._locales_dict.get(locale_str, []).copy()
-        if locale_str != 'multilingual':
-            multilingual = self._locales_dict.get('multilingual', [])
-            models.extend(multilingual)
-        return models
+        return list(self.get_models_for_locale_iter(locale_str))
 
     def supported_locales(self):
         return list(self._locales_dict.keys())
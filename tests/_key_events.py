@@ -0,0 +1,12 @@
+"""Key-event helpers shared by the engine tests.
+
+PYTEST_DONT_REWRITE: the helpers run tight assert loops, so they keep plain
+asserts instead of pytest's rewritten ones.  Failures still name the event.
+"""
+
+
+def feed_key_events(engine, events: list[tuple]) -> None:
+    """Send (keyval, keycode, state, expected_return) key events in order."""
+    for i, (keyval, keycode, state, expected) in enumerate(events):
+        result = engine.do_process_key_event(keyval, keycode, state)
+        assert result is expected, f"event {i} {(keyval, keycode, state)} returned {result}"
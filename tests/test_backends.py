@@ -1,29 +1,41 @@
 """Tests for speak2type backends."""
 
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
 import pytest
 
-from speak2type.backends.base import BackendRegistry, PlaceholderBackend, get_registry
+from speak2type.backends.base import (
+    WARMUP_SEGMENT,
+    PlaceholderBackend,
+    WarmupMixin,
+    get_registry,
+)
 from speak2type.backends import (
+    FASTER_WHISPER_AVAILABLE,
     VOSK_AVAILABLE,
     WHISPER_AVAILABLE,
     register_default_backends,
 )
 from speak2type.types import AudioSegment, AudioFormat
 
+if VOSK_AVAILABLE:
+    from speak2type.backends.vosk_adapter import VoskBackend
+if WHISPER_AVAILABLE:
+    from speak2type.backends.whisper_adapter import WhisperBackend
+
 
 class TestPlaceholderBackend:
     """Tests for PlaceholderBackend."""
 
-    def test_id_and_name(self):
+    def test_id_and_name(self, placeholder_backend):
         """Test backend identification."""
-        backend = PlaceholderBackend()
-        assert backend.id == "placeholder"
-        assert "Placeholder" in backend.name
+        assert placeholder_backend.id == "placeholder"
+        assert "Placeholder" in placeholder_backend.name
 
-    def test_transcribe_returns_result(self, sample_audio_segment):
+    def test_transcribe_returns_result(self, placeholder_backend, sample_audio_segment):
         """Test that transcribe returns a valid result."""
-        backend = PlaceholderBackend()
-        result = backend.transcribe(sample_audio_segment, "en_US")
+        result = placeholder_backend.transcribe(sample_audio_segment, "en_US")
 
         assert result.text is not None
         assert "Placeholder" in result.text
@@ -33,9 +45,8 @@ class TestPlaceholderBackend:
 class TestBackendRegistry:
     """Tests for BackendRegistry."""
 
-    def test_register_and_get(self):
+    def test_register_and_get(self, registry):
         """Test registering and retrieving a backend."""
-        registry = BackendRegistry()
         backend = PlaceholderBackend()
 
         registry.register(backend)
@@ -43,37 +54,31 @@ class TestBackendRegistry:
 
         assert retrieved is backend
 
-    def test_available_backends(self):
+    def test_available_backends(self, registry):
         """Test listing available backends."""
-        registry = BackendRegistry()
         # Placeholder is registered by default
         assert "placeholder" in registry.available_backends
 
-    def test_set_current(self):
+    def test_set_current(self, registry):
         """Test setting current backend."""
-        registry = BackendRegistry()
-
         assert registry.set_current("placeholder") is True
         assert registry.current is not None
         assert registry.current.id == "placeholder"
 
-    def test_set_unknown_backend(self):
+    def test_set_unknown_backend(self, registry):
         """Test setting unknown backend fails."""
-        registry = BackendRegistry()
         assert registry.set_current("nonexistent") is False
 
-    def test_unregister(self):
+    def test_unregister(self, registry):
         """Test unregistering a backend."""
-        registry = BackendRegistry()
         registry.set_current("placeholder")
         registry.unregister("placeholder")
 
         assert "placeholder" not in registry.available_backends
         assert registry.current is None
 
-    def test_get_or_placeholder(self):
+    def test_get_or_placeholder(self, registry):
         """Test fallback to placeholder."""
-        registry = BackendRegistry()
         # No current set
         backend = registry.get_or_placeholder()
         assert backend.id == "placeholder"
@@ -97,73 +102,190 @@ class TestGlobalRegistry:
 class TestRegisterDefaultBackends:
     """Tests for register_default_backends function."""
 
-    def test_registers_placeholder(self):
+    def test_registers_placeholder(self, registry):
         """Test that placeholder is always registered."""
-        registry = BackendRegistry()
         register_default_backends(registry)
         assert "placeholder" in registry.available_backends
 
+    def test_global_registry_populated_once(self):
+        """Repeated calls without a registry only populate the global one once."""
+        with (
+            patch("speak2type.backends._already_registered", False),
+            patch("speak2type.backends.get_registry") as mock_get_registry,
+        ):
+            register_default_backends()
+            register_default_backends()
+
+        mock_get_registry.assert_called_once()
+
     @pytest.mark.skipif(not VOSK_AVAILABLE, reason="vosk not installed")
-    def test_registers_vosk_if_available(self):
+    def test_registers_vosk_if_available(self, registry):
         """Test that Vosk is registered if available."""
-        registry = BackendRegistry()
         register_default_backends(registry)
         # Note: Vosk may not register if no model is available
         # Just verify no errors occur
 
     @pytest.mark.skipif(not WHISPER_AVAILABLE, reason="pywhispercpp not installed")
-    def test_registers_whisper_if_available(self):
+    def test_registers_whisper_if_available(self, registry):
         """Test that Whisper is registered if available."""
-        registry = BackendRegistry()
         register_default_backends(registry)
         # Note: Whisper may not register if no model is available
         # Just verify no errors occur
 
 
-@pytest.mark.skipif(not VOSK_AVAILABLE, reason="vosk not installed")
-class TestVoskBackend:
-    """Tests for VoskBackend."""
+class TestWarmupMixin:
+    """Tests for the shared backend warmup()."""
+
+    @pytest.mark.parametrize("available", [True, False])
+    def test_warmup_transcribes_silence_when_available(self, available):
+        """Only a backend with a usable model runs the warmup transcription."""
+
+        class Backend(WarmupMixin):
+            id = "test"
+            is_available = available
+            transcribe = MagicMock()
+
+        backend = Backend()
+        backend.warmup()
+
+        if available:
+            backend.transcribe.assert_called_once_with(WARMUP_SEGMENT, locale_hint="en_US")
+        else:
+            backend.transcribe.assert_not_called()
+
+
+@pytest.fixture(
+    params=[
+        pytest.param(
+            ("vosk", "Vosk"),
+            marks=pytest.mark.skipif(not VOSK_AVAILABLE, reason="vosk not installed"),
+            id="vosk",
+        ),
+        pytest.param(
+            ("whisper", "Whisper"),
+            marks=pytest.mark.skipif(not WHISPER_AVAILABLE, reason="pywhispercpp not installed"),
+            id="whisper",
+        ),
+    ]
+)
+def local_backend_cls(request):
+    """Return (backend class, expected id, expected name fragment)."""
+    backend_id, name = request.param
+    # Only reached when the param's skipif let it through, so the name is bound
+    cls = VoskBackend if backend_id == "vosk" else WhisperBackend
+    return cls, backend_id, name
 
-    def test_backend_id(self):
-        """Test Vosk backend identification."""
-        from speak2type.backends.vosk_adapter import VoskBackend
 
-        backend = VoskBackend()
-        assert backend.id == "vosk"
-        assert "Vosk" in backend.name
+class TestLocalModelBackends:
+    """Tests shared by the Vosk and Whisper backends."""
 
-    def test_transcribe_without_model(self, sample_audio_segment):
+    def test_backend_id(self, local_backend_cls):
+        """Test backend identification."""
+        cls, backend_id, name = local_backend_cls
+
+        backend = cls()
+        assert backend.id == backend_id
+        assert name in backend.name
+
+    def test_transcribe_without_model(self, local_backend_cls, sample_audio_segment):
         """Test transcription fails gracefully without model."""
-        from speak2type.backends.vosk_adapter import VoskBackend
+        cls, _, _ = local_backend_cls
 
-        backend = VoskBackend(model_path="/nonexistent/path")
+        backend = cls(model_path="/nonexistent/path")
         result = backend.transcribe(sample_audio_segment, "en_US")
         # Should return error via error field, not crash
         assert result.error is not None
         assert result.text == ""
 
 
-@pytest.mark.skipif(not WHISPER_AVAILABLE, reason="pywhispercpp not installed")
-class TestWhisperBackend:
-    """Tests for WhisperBackend."""
+class TestFasterWhisperBackend:
+    """Tests for FasterWhisperBackend."""
+
+    def test_unavailable_backend_returns_placeholder(self, sample_audio_segment):
+        """Without the dependency, transcribe() reports it instead of raising."""
+        from speak2type.backends.faster_whisper_adapter import FasterWhisperBackend
 
-    def test_backend_id(self):
-        """Test Whisper backend identification."""
-        from speak2type.backends.whisper_adapter import WhisperBackend
+        with patch(
+            "speak2type.backends.faster_whisper_adapter.FASTER_WHISPER_AVAILABLE", False
+        ):
+            backend = FasterWhisperBackend()
+            result = backend.transcribe(sample_audio_segment, "en_US")
 
-        backend = WhisperBackend()
-        assert backend.id == "whisper"
-        assert "Whisper" in backend.name
+        assert backend.id == "faster-whisper"
+        assert not backend.is_available
+        assert "faster-whisper" in result.text
 
+    @pytest.mark.skipif(not FASTER_WHISPER_AVAILABLE, reason="faster-whisper not installed")
     def test_transcribe_without_model(self, sample_audio_segment):
         """Test transcription fails gracefully without model."""
-        from speak2type.backends.whisper_adapter import WhisperBackend
+        from speak2type.backends.faster_whisper_adapter import FasterWhisperBackend
 
-        backend = WhisperBackend(model_path="/nonexistent/path")
+        backend = FasterWhisperBackend(model="/nonexistent/path")
         result = backend.transcribe(sample_audio_segment, "en_US")
-        # Should return error via error field, not crash
-        assert result.error is not None
-        assert result.text == ""
+        assert not backend.is_available
+        assert result.confidence == 0.0
+
+
+    @pytest.fixture
+    def whisper_model(self):
+        """Stand in for faster-whisper's WhisperModel; yields the model instance."""
+        model_cls = MagicMock()
+        with patch.multiple(
+            "speak2type.backends.faster_whisper_adapter",
+            FASTER_WHISPER_AVAILABLE=True,
+            WhisperModel=model_cls,
+            create=True,
+        ):
+            yield model_cls
+
+    def test_model_is_loaded_on_first_use(self, whisper_model):
+        """Constructing the backend must not load (and so download) the model."""
+        from speak2type.backends.faster_whisper_adapter import FasterWhisperBackend
+
+        backend = FasterWhisperBackend()
+
+        assert backend.is_available
+        whisper_model.assert_not_called()
+
+    def test_failed_load_marks_backend_unavailable(self, whisper_model, sample_audio_segment):
+        """A model that cannot be loaded is reported once, then the backend is unavailable."""
+        from speak2type.backends.faster_whisper_adapter import FasterWhisperBackend
+
+        whisper_model.side_effect = RuntimeError("no such model")
+        backend = FasterWhisperBackend()
+
+        result = backend.transcribe(sample_audio_segment, "en_US")
+
+        assert result.confidence == 0.0
+        assert not backend.is_available
+
+    @pytest.mark.parametrize(
+        ("language", "locale_hint", "expected"),
+        [(None, "de_DE", "de"), ("fr", "de_DE", "fr"), (None, "", None)],
+    )
+    def test_transcribe_maps_locale_to_language(
+        self, whisper_model, sample_audio_segment, language, locale_hint, expected
+    ):
+        """The configured language wins; otherwise the locale's language code is used."""
+        np = pytest.importorskip("numpy")
+        from speak2type.backends.faster_whisper_adapter import FasterWhisperBackend
+
+        segments = [
+            SimpleNamespace(text=" Hello ", start=0.0, end=0.5),
+            SimpleNamespace(text="[BLANK_AUDIO]", start=0.5, end=0.6),
+            SimpleNamespace(text="world", start=0.6, end=1.0),
+        ]
+        whisper_model.return_value.transcribe.return_value = (iter(segments), None)
+        backend = FasterWhisperBackend(language=language)
+
+        with patch("speak2type.backends.faster_whisper_adapter.np", np):
+            result = backend.transcribe(sample_audio_segment, locale_hint)
+
+        assert result.text == "Hello world"
+        assert result.language == expected
+        assert [(seg.start_ms, seg.end_ms) for seg in result.segments] == [(0, 500), (600, 1000)]
+        whisper_model.assert_called_once()
+        assert whisper_model.return_value.transcribe.call_args.kwargs["language"] == expected
 
 
 class TestHttpBackendValidation:
@@ -22,6 +22,14 @@ from speak2type.global_hotkey import (
     _SHORTCUT_ID,
 )
 
+# Public attribute names of the GI classes, resolved once for mock specs
+_BUS_SPEC = [a for a in dir(Gio.DBusConnection) if not a.startswith("_")]
+_INVOCATION_SPEC = [a for a in dir(Gio.DBusMethodInvocation) if not a.startswith("_")]
+
+# Immutable variant types for lookup_value(), parsed once
+_VT_S = GLib.VariantType("s")
+_VT_AS = GLib.VariantType("as")
+
 
 @pytest.fixture
 def callbacks():
@@ -32,7 +40,7 @@ def callbacks():
 @pytest.fixture
 def mock_bus():
     """Return a mock D-Bus connection with standard behaviors."""
-    bus = MagicMock(spec=Gio.DBusConnection)
+    bus = MagicMock(spec_set=_BUS_SPEC)
     bus.get_unique_name.return_value = ":1.42"
     bus.signal_subscribe.side_effect = lambda *a, **kw: (
         len(bus.signal_subscribe.call_args_list)
@@ -40,6 +48,37 @@ def mock_bus():
     return bus
 
 
+@pytest.fixture
+def portal_bus(monkeypatch, mock_bus):
+    """Make Gio.bus_get_sync() hand out the mock bus."""
+    monkeypatch.setattr(
+        "speak2type.global_hotkey.Gio.bus_get_sync", lambda *a, **kw: mock_bus
+    )
+    return mock_bus
+
+
+@pytest.fixture
+def listener(callbacks):
+    """Return a listener for <Alt>space wired to the mock callbacks."""
+    on_press, on_release = callbacks
+    return GlobalHotkeyListener(on_press, on_release, "<Alt>space")
+
+
+@pytest.fixture
+def listener_with_bus(listener, mock_bus):
+    """Return a listener already connected to the mock bus."""
+    listener._bus = mock_bus
+    listener._sender_token = "1_42"
+    return listener
+
+
+@pytest.fixture
+def listener_with_session(listener_with_bus):
+    """Return a connected listener with an open portal session."""
+    listener_with_bus._session_handle = "/session/test"
+    return listener_with_bus
+
+
 def _make_create_session_response(
     code: int = 0, session_handle: str = "/session/test"
 ) -> GLib.Variant:
@@ -65,93 +104,90 @@ def _make_deactivated_variant(session_handle: str, shortcut_id: str) -> GLib.Var
     return GLib.Variant("(osta{sv})", (session_handle, shortcut_id, 0, {}))
 
 
+# GLib.Variant is immutable, so the canonical payloads are built once
+_PORTAL_SESSION = "/org/freedesktop/portal/desktop/session/1_42/test"
+_RESP_OK = _make_create_session_response(0, _PORTAL_SESSION)
+_RESP_FAIL = _make_create_session_response(1)
+_BIND_OK = _make_bind_response(0)
+_BIND_DENIED = _make_bind_response(1)
+_ACT = _make_activated_variant("/session/test", _SHORTCUT_ID)
+_DEACT = _make_deactivated_variant("/session/test", _SHORTCUT_ID)
+_ACT_WRONG_SESSION = _make_activated_variant("/session/other", _SHORTCUT_ID)
+_ACT_WRONG_SHORTCUT = _make_activated_variant("/session/test", "some-other-shortcut")
+
+
 class TestSetupPortalUnavailable:
     """setup() returns False when the portal is unreachable."""
 
-    def test_no_session_bus(self, callbacks):
+    def test_no_session_bus(self, callbacks, listener, monkeypatch):
         on_press, on_release = callbacks
-        listener = GlobalHotkeyListener(on_press, on_release, "<Alt>space")
 
-        with patch(
-            "speak2type.global_hotkey.Gio.bus_get_sync",
-            side_effect=GLib.Error.new_literal(
-                Gio.DBusError.quark(), "no bus", Gio.DBusError.FAILED
-            ),
-        ):
-            assert listener.setup() is False
+        def _raise(*args, **kwargs):
+            raise GLib.Error.new_literal(Gio.DBusError.quark(), "no bus", Gio.DBusError.FAILED)
+
+        monkeypatch.setattr("speak2type.global_hotkey.Gio.bus_get_sync", _raise)
+        assert listener.setup() is False
 
         on_press.assert_not_called()
         on_release.assert_not_called()
 
-    def test_create_session_dbus_error(self, callbacks, mock_bus):
-        on_press, on_release = callbacks
-        listener = GlobalHotkeyListener(on_press, on_release, "<Alt>space")
+    @pytest.mark.usefixtures("portal_bus")
+    def test_create_session_dbus_error(self, callbacks, listener, mock_bus):
+        """A CreateSession error reply tears the listener down."""
+        on_press, _ = callbacks
 
-        mock_bus.call_sync.side_effect = GLib.Error.new_literal(
+        assert listener.setup() is True
+
+        callback, method = mock_bus.call.call_args[0][9:11]
+        mock_bus.call_finish.side_effect = GLib.Error.new_literal(
             Gio.DBusError.quark(),
             "org.freedesktop.DBus.Error.ServiceUnknown",
             Gio.DBusError.SERVICE_UNKNOWN,
         )
+        callback(mock_bus, MagicMock(), method)
 
-        with patch(
-            "speak2type.global_hotkey.Gio.bus_get_sync", return_value=mock_bus
-        ):
-            assert listener.setup() is False
+        assert mock_bus.signal_unsubscribe.called
+        assert listener._signal_ids == []
+        on_press.assert_not_called()
 
 
+@pytest.mark.usefixtures("portal_bus")
 class TestAsyncCallbackChain:
     """Test the async CreateSession -> BindShortcuts callback chain."""
 
-    def test_create_session_response_triggers_bind(self, callbacks, mock_bus):
+    def test_create_session_response_triggers_bind(self, listener_with_bus, mock_bus):
         """Successful CreateSession response chains to BindShortcuts."""
-        on_press, on_release = callbacks
-        listener = GlobalHotkeyListener(on_press, on_release, "<Alt>space")
-        listener._bus = mock_bus
-        listener._sender_token = "1_42"
+        listener = listener_with_bus
 
-        mock_bus.call_sync.return_value = GLib.Variant("(o)", ("/dummy/request",))
-
-        params = _make_create_session_response(
-            code=0,
-            session_handle="/org/freedesktop/portal/desktop/session/1_42/test",
-        )
         listener._on_create_session_response(
             mock_bus, _PORTAL_BUS_NAME, "/dummy/request",
-            _REQUEST_IFACE, "Response", params,
+            _REQUEST_IFACE, "Response", _RESP_OK,
         )
 
-        assert listener._session_handle == (
-            "/org/freedesktop/portal/desktop/session/1_42/test"
-        )
-        # BindShortcuts should have been called
-        assert mock_bus.call_sync.called
-        bind_call = mock_bus.call_sync.call_args
+        assert listener._session_handle == _PORTAL_SESSION
+        # BindShortcuts should have been dispatched asynchronously
+        assert mock_bus.call.called
+        bind_call = mock_bus.call.call_args
         assert bind_call[0][3] == "BindShortcuts"
 
-    def test_create_session_failure_does_not_bind(self, callbacks, mock_bus):
+    def test_create_session_failure_does_not_bind(self, listener_with_bus, mock_bus):
         """Failed CreateSession does not chain to BindShortcuts."""
-        on_press, on_release = callbacks
-        listener = GlobalHotkeyListener(on_press, on_release, "<Alt>space")
-        listener._bus = mock_bus
-        listener._sender_token = "1_42"
+        listener = listener_with_bus
 
-        params = _make_create_session_response(code=1)
+        params = _RESP_FAIL
         listener._on_create_session_response(
             mock_bus, _PORTAL_BUS_NAME, "/dummy/request",
             _REQUEST_IFACE, "Response", params,
         )
 
         assert listener._session_handle is None
-        mock_bus.call_sync.assert_not_called()
+        mock_bus.call.assert_not_called()
 
-    def test_bind_response_success_sets_active(self, callbacks, mock_bus):
+    def test_bind_response_success_sets_active(self, listener_with_session, mock_bus):
         """Successful BindShortcuts response keeps session alive."""
-        on_press, on_release = callbacks
-        listener = GlobalHotkeyListener(on_press, on_release, "<Alt>space")
-        listener._bus = mock_bus
-        listener._session_handle = "/session/test"
+        listener = listener_with_session
 
-        params = _make_bind_response(code=0)
+        params = _BIND_OK
         listener._on_bind_shortcuts_response(
             mock_bus, _PORTAL_BUS_NAME, "/dummy/request",
             _REQUEST_IFACE, "Response", params,
@@ -160,15 +196,12 @@ class TestAsyncCallbackChain:
         # Session should still be set (not torn down)
         assert listener._session_handle == "/session/test"
 
-    def test_bind_response_denied_tears_down(self, callbacks, mock_bus):
+    def test_bind_response_denied_tears_down(self, listener_with_session, mock_bus):
         """Denied BindShortcuts response tears down the session."""
-        on_press, on_release = callbacks
-        listener = GlobalHotkeyListener(on_press, on_release, "<Alt>space")
-        listener._bus = mock_bus
-        listener._session_handle = "/session/test"
+        listener = listener_with_session
         listener._signal_ids = []
 
-        params = _make_bind_response(code=1)
+        params = _BIND_DENIED
         listener._on_bind_shortcuts_response(
             mock_bus, _PORTAL_BUS_NAME, "/dummy/request",
             _REQUEST_IFACE, "Response", params,
@@ -176,33 +209,24 @@ class TestAsyncCallbackChain:
 
         assert listener._session_handle is None
 
-    def test_setup_dispatches_create_session(self, callbacks, mock_bus):
+    def test_setup_dispatches_create_session(self, listener, mock_bus):
         """setup() dispatches CreateSession and returns True."""
-        on_press, on_release = callbacks
-        listener = GlobalHotkeyListener(on_press, on_release, "<Alt>space")
-
-        mock_bus.call_sync.return_value = GLib.Variant("(o)", ("/dummy/request",))
-
-        with patch(
-            "speak2type.global_hotkey.Gio.bus_get_sync", return_value=mock_bus
-        ):
-            result = listener.setup()
+        result = listener.setup()
 
         assert result is True
-        # CreateSession should have been called
-        create_call = mock_bus.call_sync.call_args
+        # CreateSession should have been dispatched asynchronously
+        create_call = mock_bus.call.call_args
         assert create_call[0][3] == "CreateSession"
 
 
 class TestSignalHandlers:
     """Test Activated/Deactivated signal dispatch."""
 
-    def test_activated_calls_on_press(self, callbacks):
+    def test_activated_calls_on_press(self, callbacks, listener_with_session):
         on_press, on_release = callbacks
-        listener = GlobalHotkeyListener(on_press, on_release, "<Alt>space")
-        listener._session_handle = "/session/test"
+        listener = listener_with_session
 
-        params = _make_activated_variant("/session/test", _SHORTCUT_ID)
+        params = _ACT
         listener._on_activated(
             None, _PORTAL_BUS_NAME, _PORTAL_OBJECT_PATH,
             _PORTAL_IFACE, "Activated", params,
@@ -211,12 +235,11 @@ class TestSignalHandlers:
         on_press.assert_called_once()
         on_release.assert_not_called()
 
-    def test_deactivated_calls_on_release(self, callbacks):
+    def test_deactivated_calls_on_release(self, callbacks, listener_with_session):
         on_press, on_release = callbacks
-        listener = GlobalHotkeyListener(on_press, on_release, "<Alt>space")
-        listener._session_handle = "/session/test"
+        listener = listener_with_session
 
-        params = _make_deactivated_variant("/session/test", _SHORTCUT_ID)
+        params = _DEACT
         listener._on_deactivated(
             None, _PORTAL_BUS_NAME, _PORTAL_OBJECT_PATH,
             _PORTAL_IFACE, "Deactivated", params,
@@ -225,12 +248,15 @@ class TestSignalHandlers:
         on_release.assert_called_once()
         on_press.assert_not_called()
 
-    def test_wrong_session_ignored(self, callbacks):
+    @pytest.mark.parametrize(
+        "params",
+        [_ACT_WRONG_SESSION, _ACT_WRONG_SHORTCUT],
+        ids=["wrong-session", "wrong-shortcut-id"],
+    )
+    def test_activated_ignored(self, callbacks, listener_with_session, params):
         on_press, on_release = callbacks
-        listener = GlobalHotkeyListener(on_press, on_release, "<Alt>space")
-        listener._session_handle = "/session/test"
+        listener = listener_with_session
 
-        params = _make_activated_variant("/session/other", _SHORTCUT_ID)
         listener._on_activated(
             None, _PORTAL_BUS_NAME, _PORTAL_OBJECT_PATH,
             _PORTAL_IFACE, "Activated", params,
@@ -238,28 +264,23 @@ class TestSignalHandlers:
 
         on_press.assert_not_called()
 
-    def test_wrong_shortcut_id_ignored(self, callbacks):
-        on_press, on_release = callbacks
-        listener = GlobalHotkeyListener(on_press, on_release, "<Alt>space")
-        listener._session_handle = "/session/test"
 
-        params = _make_activated_variant("/session/test", "some-other-shortcut")
-        listener._on_activated(
-            None, _PORTAL_BUS_NAME, _PORTAL_OBJECT_PATH,
-            _PORTAL_IFACE, "Activated", params,
-        )
+    def test_subscriptions_match_session_as_path(self, listener_with_session, mock_bus):
+        """Activated/Deactivated filter arg0 as an object path, not a string."""
+        listener_with_session._subscribe_shortcut_signals()
 
-        on_press.assert_not_called()
+        calls = mock_bus.signal_subscribe.call_args_list
+        assert [c[0][2] for c in calls] == ["Activated", "Deactivated"]
+        for c in calls:
+            assert c[0][4] == "/session/test"
+            assert c[0][5] == Gio.DBusSignalFlags.MATCH_ARG0_PATH
 
 
 class TestTeardown:
     """Test session cleanup."""
 
-    def test_teardown_closes_session(self, callbacks, mock_bus):
-        on_press, on_release = callbacks
-        listener = GlobalHotkeyListener(on_press, on_release, "<Alt>space")
-        listener._bus = mock_bus
-        listener._session_handle = "/session/test"
+    def test_teardown_closes_session(self, listener_with_session, mock_bus):
+        listener = listener_with_session
         listener._signal_ids = [1, 2]
 
         listener.teardown()
@@ -273,28 +294,20 @@ class TestTeardown:
 
         assert listener._session_handle is None
 
-    def test_teardown_without_session_is_safe(self, callbacks):
-        on_press, on_release = callbacks
-        listener = GlobalHotkeyListener(on_press, on_release, "<Alt>space")
+    def test_teardown_without_session_is_safe(self, listener):
         listener.teardown()
 
 
 class TestUpdateShortcut:
     """Test rebinding with a new accelerator."""
 
-    def test_update_calls_bind_shortcuts(self, callbacks, mock_bus):
-        on_press, on_release = callbacks
-        listener = GlobalHotkeyListener(on_press, on_release, "<Alt>space")
-        listener._bus = mock_bus
-        listener._session_handle = "/session/test"
-        listener._sender_token = "1_42"
-
-        mock_bus.call_sync.return_value = GLib.Variant("(o)", ("/dummy/request",))
+    def test_update_calls_bind_shortcuts(self, listener_with_session, mock_bus):
+        listener = listener_with_session
 
         listener.update_shortcut("<Ctrl>r")
 
         assert listener._accelerator == "<Ctrl>r"
-        assert mock_bus.call_sync.called
+        assert mock_bus.call.called
 
 
 class TestProviderShim:
@@ -302,7 +315,7 @@ class TestProviderShim:
 
     def test_bind_shortcuts_returns_approved_shortcuts(self):
         """BindShortcuts auto-approves the requested shortcuts."""
-        invocation = MagicMock(spec=Gio.DBusMethodInvocation)
+        invocation = MagicMock(spec_set=_INVOCATION_SPEC)
 
         shortcuts = GLib.Variant(
             "(ssa(sa{sv}))",
@@ -334,16 +347,16 @@ class TestProviderShim:
         sid = entry.get_child_value(0).get_string()
         assert sid == "speak2type-ptt"
         props = entry.get_child_value(1)
-        desc = props.lookup_value("description", GLib.VariantType("s"))
+        desc = props.lookup_value("description", _VT_S)
         assert desc.get_string() == "Push-to-talk"
-        trigger_desc = props.lookup_value("trigger_description", GLib.VariantType("s"))
+        trigger_desc = props.lookup_value("trigger_description", _VT_S)
         assert trigger_desc.get_string() == "Press <Ctrl>space"
-        shortcuts_val = props.lookup_value("shortcuts", GLib.VariantType("as"))
+        shortcuts_val = props.lookup_value("shortcuts", _VT_AS)
         assert shortcuts_val.unpack() == ["<Ctrl>space"]
 
     def test_bind_shortcuts_without_trigger(self):
         """BindShortcuts handles missing preferred_trigger gracefully."""
-        invocation = MagicMock(spec=Gio.DBusMethodInvocation)
+        invocation = MagicMock(spec_set=_INVOCATION_SPEC)
 
         shortcuts = GLib.Variant(
             "(ssa(sa{sv}))",
@@ -371,12 +384,12 @@ class TestProviderShim:
         entry = inner.get_child_value(0)
         props = entry.get_child_value(1)
         # No "shortcuts" key when trigger is empty
-        shortcuts_val = props.lookup_value("shortcuts", GLib.VariantType("as"))
+        shortcuts_val = props.lookup_value("shortcuts", _VT_AS)
         assert shortcuts_val is None
 
     def test_unknown_method_returns_error(self):
         """Non-BindShortcuts methods return a D-Bus error."""
-        invocation = MagicMock(spec=Gio.DBusMethodInvocation)
+        invocation = MagicMock(spec_set=_INVOCATION_SPEC)
 
         GlobalHotkeyListener._on_provider_method_call(
             None, "sender", "/path", "iface", "UnknownMethod",
@@ -391,13 +404,12 @@ class TestProviderShim:
 class TestHostRegistration:
     """Test host app registration and provider shim lifecycle."""
 
-    def test_register_host_app_calls_registry(self, callbacks, mock_bus):
+    def test_register_host_app_calls_registry(self, listener_with_bus, mock_bus):
         """_register_host_app calls the host portal Registry."""
-        on_press, on_release = callbacks
-        listener = GlobalHotkeyListener(on_press, on_release, "<Alt>space")
-        listener._bus = mock_bus
+        listener = listener_with_bus
 
-        listener._register_host_app()
+        with patch.dict("os.environ", {"XDG_CURRENT_DESKTOP": "ubuntu:GNOME"}):
+            listener._register_host_app()
 
         mock_bus.call_sync.assert_called_once()
         call_args = mock_bus.call_sync.call_args[0]
@@ -409,32 +421,36 @@ class TestHostRegistration:
         app_id = variant_args.get_child_value(0).get_string()
         assert app_id == _APP_ID
 
-    def test_register_host_app_tolerates_error(self, callbacks, mock_bus):
+    def test_register_host_app_tolerates_error(self, listener_with_bus, mock_bus):
         """_register_host_app logs but does not raise on error."""
-        on_press, on_release = callbacks
-        listener = GlobalHotkeyListener(on_press, on_release, "<Alt>space")
-        listener._bus = mock_bus
+        listener = listener_with_bus
         mock_bus.call_sync.side_effect = GLib.Error.new_literal(
             Gio.DBusError.quark(), "no registry", Gio.DBusError.UNKNOWN_METHOD,
         )
 
         # Should not raise
-        listener._register_host_app()
+        with patch.dict("os.environ", {"XDG_CURRENT_DESKTOP": "GNOME"}):
+            listener._register_host_app()
 
-    def test_provider_shim_tolerates_mock_bus(self, callbacks, mock_bus):
+    def test_register_host_app_skipped_outside_gnome(self, listener_with_bus, mock_bus):
+        """No registry round trip on non-GNOME desktops."""
+        listener = listener_with_bus
+
+        with patch.dict("os.environ", {"XDG_CURRENT_DESKTOP": "KDE"}):
+            listener._register_host_app()
+
+        mock_bus.call_sync.assert_not_called()
+
+    def test_provider_shim_tolerates_mock_bus(self, listener_with_bus):
         """_start_provider_shim does not crash with a mock bus."""
-        on_press, on_release = callbacks
-        listener = GlobalHotkeyListener(on_press, on_release, "<Alt>space")
-        listener._bus = mock_bus
+        listener = listener_with_bus
 
         # MagicMock bus triggers TypeError in Gio.bus_own_name_on_connection
         # which should be caught gracefully
         listener._start_provider_shim()
 
-    def test_stop_provider_shim_without_start(self, callbacks):
+    def test_stop_provider_shim_without_start(self, listener):
         """_stop_provider_shim is safe when shim was never started."""
-        on_press, on_release = callbacks
-        listener = GlobalHotkeyListener(on_press, on_release, "<Alt>space")
 
         # Should not raise
         listener._stop_provider_shim()
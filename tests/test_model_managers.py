@@ -1,36 +1,206 @@
 """Tests for model manager modules."""
 
+import hashlib
 from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
 
 from speak2type.model_managers import ModelSpec, PINNED_MODELS, ParakeetModelManager
 
 
-def test_parakeet_model_manager_import_and_init(tmp_path: Path) -> None:
+@pytest.fixture
+def manager(tmp_path: Path) -> ParakeetModelManager:
+    """Return a manager rooted in the test's temporary directory."""
+    return ParakeetModelManager(model_dir=tmp_path / "models", cache_dir=tmp_path / "cache")
+
+
+@pytest.fixture
+def model_tree(tmp_path: Path) -> Path:
+    """Write a small model directory: a.txt ("alpha") and sub/b.bin ("beta")."""
+    model_path = tmp_path / "model"
+    (model_path / "sub").mkdir(parents=True)
+    (model_path / "a.txt").write_bytes(b"alpha")
+    (model_path / "sub" / "b.bin").write_bytes(b"beta")
+    return model_path
+
+
+@pytest.fixture(scope="module")
+def parakeet_manager(tmp_path_factory) -> ParakeetModelManager:
+    """Return a manager shared by the tests that only read its state."""
+    root = tmp_path_factory.mktemp("parakeet")
+    return ParakeetModelManager(model_dir=root / "models", cache_dir=root / "cache")
+
+
+def test_parakeet_model_manager_import_and_init(parakeet_manager: ParakeetModelManager) -> None:
     """Parakeet model manager should be importable and constructible."""
-    manager = ParakeetModelManager(
-        model_dir=tmp_path / "models",
-        cache_dir=tmp_path / "cache",
-    )
-    assert manager.model_dir.exists()
-    assert manager.cache_dir.exists()
+    assert parakeet_manager.model_dir.exists()
+    assert parakeet_manager.cache_dir.exists()
 
 
-def test_parakeet_model_specs_are_typed(tmp_path: Path) -> None:
+def test_parakeet_model_specs_are_typed(parakeet_manager: ParakeetModelManager) -> None:
     """Pinned model specifications should deserialize to ModelSpec objects."""
-    manager = ParakeetModelManager(
-        model_dir=tmp_path / "models",
-        cache_dir=tmp_path / "cache",
-    )
-    models = manager.list_available_models()
+    models = parakeet_manager.list_available_models()
     assert models
     assert all(isinstance(model, ModelSpec) for model in models)
 
 
-def test_default_model_selection_returns_known_id(tmp_path: Path) -> None:
+def test_default_model_selection_returns_known_id(
+    parakeet_manager: ParakeetModelManager,
+) -> None:
     """Locale-based default model selection should return a pinned model id."""
-    manager = ParakeetModelManager(
-        model_dir=tmp_path / "models",
-        cache_dir=tmp_path / "cache",
-    )
-    model_id = manager.get_default_model_for_locale("en_US")
+    model_id = parakeet_manager.get_default_model_for_locale("en_US")
     assert model_id in PINNED_MODELS
+
+
+def test_verify_sha256_hashes_files_in_sorted_order(
+    manager: ParakeetModelManager, model_tree: Path
+) -> None:
+    """Verification hashes the concatenated contents of files in path order."""
+    expected = hashlib.sha256(b"alphabeta").hexdigest()
+
+    assert manager._verify_sha256(model_tree, expected)
+    assert not manager._verify_sha256(model_tree, "0" * 64)
+
+
+def test_merkle_sha256_combines_per_file_digests(
+    manager: ParakeetModelManager, model_tree: Path
+) -> None:
+    """The merkle scheme hashes relpath + NUL + file digest in path order."""
+    top = hashlib.sha256()
+    for relpath, data in (("a.txt", b"alpha"), ("sub/b.bin", b"beta")):
+        top.update(relpath.encode() + b"\0" + hashlib.sha256(data).digest())
+
+    assert manager.compute_merkle_sha256(model_tree) == top.hexdigest()
+    assert manager._verify_sha256(model_tree, top.hexdigest(), scheme="merkle")
+
+
+def _fake_snapshot_download(contents: dict[str, bytes]):
+    """Build a snapshot_download stand-in laying files out like the hub cache."""
+
+    def snapshot_download(repo_id, revision, cache_dir):
+        blobs = Path(cache_dir) / "blobs"
+        snapshot = Path(cache_dir) / "snapshots" / revision
+        blobs.mkdir(parents=True)
+        for name, data in contents.items():
+            blob = blobs / hashlib.sha256(data).hexdigest()
+            blob.write_bytes(data)
+            (snapshot / name).parent.mkdir(parents=True, exist_ok=True)
+            (snapshot / name).symlink_to(blob)
+        return str(snapshot)
+
+    return snapshot_download
+
+
+def test_download_verifies_snapshot_against_pin(manager: ParakeetModelManager) -> None:
+    """Files fetched by snapshot_download are installed once the pin matches."""
+    hf = MagicMock()
+    hf.snapshot_download.side_effect = _fake_snapshot_download(
+        {"config.json": b"{}", "model.onnx": b"weights"}
+    )
+    spec = ModelSpec(
+        id="test/model", name="Test", revision="abc",
+        sha256=hashlib.sha256(b"{}weights").hexdigest(),
+        license="MIT", languages=["en"], size_mb=1,
+    )
+
+    with (
+        patch("speak2type.model_managers.parakeet._hf_hub", hf),
+        patch.dict(PINNED_MODELS, {"test/model": spec}),
+    ):
+        path = manager.download_model("test/model")
+
+    hf.snapshot_download.assert_called_once_with(
+        repo_id="test/model", revision="abc", cache_dir=manager.cache_dir
+    )
+    assert path == manager.model_dir / "test_model"
+    assert not (path / "model.onnx").is_symlink()
+    assert (path / "model.onnx").read_bytes() == b"weights"
+
+
+def test_download_rejects_snapshot_with_wrong_hash(manager: ParakeetModelManager) -> None:
+    """A snapshot that does not match the pin is never installed."""
+    hf = MagicMock()
+    hf.snapshot_download.side_effect = _fake_snapshot_download({"model.onnx": b"tampered"})
+    spec = ModelSpec(
+        id="test/model", name="Test", revision="abc",
+        sha256=hashlib.sha256(b"weights").hexdigest(),
+        license="MIT", languages=["en"], size_mb=1,
+    )
+
+    with (
+        patch("speak2type.model_managers.parakeet._hf_hub", hf),
+        patch.dict(PINNED_MODELS, {"test/model": spec}),
+    ):
+        assert manager.download_model("test/model") is None
+
+    assert list(manager.model_dir.iterdir()) == []
+
+
+def test_list_installed_models_skips_staging(manager: ParakeetModelManager) -> None:
+    """Only complete model directories are reported as installed."""
+    (manager.model_dir / "a_model").mkdir()
+    (manager.model_dir / "a_model" / "model.onnx").write_bytes(b"")
+    (manager.model_dir / "b_model.partial").mkdir()
+    (manager.model_dir / "b_model.partial" / "config.json").write_bytes(b"{}")
+    (manager.model_dir / "empty").mkdir()
+
+    assert list(manager.list_installed_models()) == [
+        ("a_model", manager.model_dir / "a_model")
+    ]
+
+
+def test_verify_sha256_handles_empty_files(
+    manager: ParakeetModelManager, tmp_path: Path
+) -> None:
+    """Empty files (which cannot be memory-mapped) hash as no bytes."""
+    model_path = tmp_path / "model"
+    model_path.mkdir()
+    (model_path / "empty").write_bytes(b"")
+    (model_path / "model.onnx").write_bytes(b"weights")
+
+    assert manager._verify_sha256(model_path, hashlib.sha256(b"weights").hexdigest())
+
+
+def test_verify_model_async_posts_result_to_main_loop(manager: ParakeetModelManager) -> None:
+    """Background verification hands its result to GLib.idle_add."""
+    pytest.importorskip("gi")
+    (manager.model_dir / "test_model").mkdir()
+    callback = MagicMock()
+
+    with patch("gi.repository.GLib.idle_add") as mock_idle:
+        future = manager.verify_model_async("test/model", callback)
+        assert future.result(timeout=5) is True
+
+    deliver, ok = mock_idle.call_args[0]
+    assert deliver(ok) is False
+    callback.assert_called_once_with(True)
+
+
+def test_swap_into_place_replaces_existing_model(tmp_path: Path) -> None:
+    """A reinstall swaps the new tree in and removes the old one."""
+    model_path = tmp_path / "test_model"
+    model_path.mkdir()
+    (model_path / "model.onnx").write_bytes(b"old")
+    staging = tmp_path / "test_model.partial"
+    staging.mkdir()
+    (staging / "model.onnx").write_bytes(b"new")
+
+    ParakeetModelManager._swap_into_place(staging, model_path)
+
+    assert (model_path / "model.onnx").read_bytes() == b"new"
+    assert not staging.exists()
+    assert not (tmp_path / "test_model.old").exists()
+
+
+def test_swap_into_place_restores_old_model_on_failure(tmp_path: Path) -> None:
+    """If the new tree cannot be moved in, the old install is kept."""
+    model_path = tmp_path / "test_model"
+    model_path.mkdir()
+    (model_path / "model.onnx").write_bytes(b"old")
+    missing_staging = tmp_path / "test_model.partial"
+
+    with pytest.raises(OSError):
+        ParakeetModelManager._swap_into_place(missing_staging, model_path)
+
+    assert (model_path / "model.onnx").read_bytes() == b"old"
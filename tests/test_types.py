@@ -21,57 +21,52 @@ class TestAudioFormat:
         assert fmt.channels == 1
         assert fmt.sample_fmt == "s16le"
 
-    def test_bytes_per_sample(self):
-        """Test bytes per sample calculation."""
-        fmt = AudioFormat()
-        assert fmt.bytes_per_sample == 2  # s16le = 2 bytes
-
-        fmt_f32 = AudioFormat(sample_fmt="f32le")
-        assert fmt_f32.bytes_per_sample == 4
-
-    def test_bytes_per_second(self):
-        """Test bytes per second calculation."""
-        fmt = AudioFormat()
-        # 16000 samples/sec * 1 channel * 2 bytes = 32000 bytes/sec
-        assert fmt.bytes_per_second == 32000
-
-        fmt_stereo = AudioFormat(channels=2)
-        assert fmt_stereo.bytes_per_second == 64000
+    @pytest.mark.parametrize(
+        "sample_rate,channels,sample_fmt,expected_bps,expected_bpsample",
+        [
+            (16000, 1, "s16le", 32000, 2),
+            (16000, 1, "f32le", 64000, 4),
+            (16000, 2, "s16le", 64000, 2),
+        ],
+        ids=["mono-s16le", "mono-f32le", "stereo-s16le"],
+    )
+    def test_format_math(
+        self, sample_rate, channels, sample_fmt, expected_bps, expected_bpsample
+    ):
+        """Test bytes per sample and bytes per second calculation."""
+        fmt = AudioFormat(sample_rate=sample_rate, channels=channels, sample_fmt=sample_fmt)
+        assert fmt.bytes_per_sample == expected_bpsample
+        assert fmt.bytes_per_second == expected_bps
 
 
 class TestAudioSegment:
     """Tests for AudioSegment."""
 
-    def test_duration_calculation(self, sample_audio_bytes):
+    @pytest.mark.parametrize(
+        "fmt,n_bytes,expected_ms",
+        [
+            # 32000 bytes / 32000 bytes per second = 1 second
+            (AudioFormat(), 32000, 1000),
+            # 16000 bytes / (8000 * 1 * 2) = 1 second
+            (AudioFormat(sample_rate=8000, channels=1, sample_fmt="s16le"), 16000, 1000),
+            (AudioFormat(), 0, 0),
+        ],
+        ids=["default", "custom-format", "empty"],
+    )
+    def test_duration_calculation(self, fmt, n_bytes, expected_ms):
         """Test duration calculation from PCM bytes."""
-        segment = AudioSegment(pcm_bytes=sample_audio_bytes)
-        # 32000 bytes / 32000 bytes per second = 1 second = 1000 ms
-        assert segment.duration_ms == 1000
-        assert segment.duration_seconds == 1.0
-
-    def test_empty_segment(self):
-        """Test empty audio segment."""
-        segment = AudioSegment(pcm_bytes=b"")
-        assert segment.duration_ms == 0
-        assert segment.duration_seconds == 0.0
-
-    def test_custom_format(self):
-        """Test segment with custom format."""
-        fmt = AudioFormat(sample_rate=8000, channels=1, sample_fmt="s16le")
-        segment = AudioSegment(pcm_bytes=bytes(16000), format=fmt)
-        # 16000 bytes / (8000 * 1 * 2) = 1 second
-        assert segment.duration_seconds == 1.0
+        segment = AudioSegment(pcm_bytes=bytes(n_bytes), format=fmt)
+        assert segment.duration_ms == expected_ms
+        assert segment.duration_seconds == expected_ms / 1000
 
 
 class TestEngineState:
     """Tests for EngineState enum."""
 
-    def test_all_states_exist(self):
+    @pytest.mark.parametrize("name", ["IDLE", "RECORDING", "TRANSCRIBING", "COMMITTING"])
+    def test_state_exists(self, name):
         """Test that all required states exist."""
-        assert EngineState.IDLE
-        assert EngineState.RECORDING
-        assert EngineState.TRANSCRIBING
-        assert EngineState.COMMITTING
+        assert getattr(EngineState, name)
 
     def test_states_are_unique(self):
         """Test that states have unique values."""
@@ -82,10 +77,12 @@ class TestEngineState:
 class TestRecordMode:
     """Tests for RecordMode enum."""
 
-    def test_modes_exist(self):
-        """Test that recording modes exist."""
-        assert RecordMode.TOGGLE.value == "toggle"
-        assert RecordMode.PUSH_TO_TALK.value == "push_to_talk"
+    @pytest.mark.parametrize(
+        "mode,value", [(RecordMode.TOGGLE, "toggle"), (RecordMode.PUSH_TO_TALK, "push_to_talk")]
+    )
+    def test_mode_values(self, mode, value):
+        """Test that recording modes match their GSettings strings."""
+        assert mode.value == value
 
 
 class TestTranscriptResult:
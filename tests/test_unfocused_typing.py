@@ -7,8 +7,9 @@ Covers:
 - Fallback to clipboard-only when tools are unavailable
 """
 
+import functools
 import subprocess
-from unittest.mock import MagicMock, call, patch
+from unittest.mock import DEFAULT, MagicMock, patch
 
 import pytest
 
@@ -20,6 +21,7 @@ gi.require_version("Gio", "2.0")
 
 from gi.repository import IBus, GLib
 
+from speak2type import engine as _engine_module
 from speak2type.engine import (
     Speak2TypeEngine,
     DEFAULT_PTT_KEYVAL,
@@ -27,37 +29,104 @@ from speak2type.engine import (
 )
 from speak2type.types import EngineState, TranscriptResult
 
+from ._key_events import feed_key_events
+
+# Key-event modifier states, resolved through GI once at import
+_PTT_MOD = int(DEFAULT_PTT_MODIFIERS)
+_RELEASE_MASK = int(IBus.ModifierType.RELEASE_MASK)
+_PTT_RELEASE = _PTT_MOD | _RELEASE_MASK
+
+# Paste-tool timeouts raised by the patched subprocess.run
+_TIMEOUT_WTYPE = subprocess.TimeoutExpired("wtype", 10)
+_TIMEOUT_XDOTOOL = subprocess.TimeoutExpired("xdotool", 10)
+
+# Expected paste commands (Ctrl+V)
+_WTYPE_PASTE_SUFFIX = ("-M", "ctrl", "-k", "v", "-m", "ctrl")
+_XDOTOOL_PASTE = ("xdotool", "key", "ctrl+v")
+
+# Transcription results; the engine only reads them
+_RESULT_HELLO = TranscriptResult(text="hello")
+_RESULT_HELLO_WORLD = TranscriptResult(text="hello world")
+
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
 
+@pytest.fixture(scope="module", autouse=True)
+def stub_engine_deps():
+    """Stub out the engine's external dependencies for the whole module.
+
+    Replaces GSettings, AudioCapture, GlobalHotkeyListener, backend
+    registration and the IBus.Engine base initializer so the engine can be
+    instantiated without a running IBus daemon.  The attributes are set once
+    and restored after the module's last test.
+    """
+    registry = MagicMock(available_backends=[])
+    registry.set_current.return_value = False
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(_engine_module.Gio.SettingsSchemaSource, "get_default", lambda: None)
+        mp.setattr(_engine_module, "AudioCapture", MagicMock())
+        mp.setattr(_engine_module, "GlobalHotkeyListener", MagicMock())
+        mp.setattr(_engine_module, "register_default_backends", MagicMock())
+        mp.setattr(_engine_module, "get_registry", MagicMock(return_value=registry))
+        mp.setattr(IBus.Engine, "__init__", lambda *a, **kw: None)
+        mp.setattr(IBus.Engine, "update_property", MagicMock())
+        mp.setattr(IBus.Engine, "register_properties", MagicMock())
+        yield
+
+
+@functools.cache
+def _shared_bus() -> MagicMock:
+    """Return the mock bus shared by every test engine.
+
+    The engine only reads the bus connection during construction, so one
+    spec'd mock serves every test.  It is built on first use, so collection
+    alone never pays for introspecting IBus.Bus.
+    """
+    bus = MagicMock(spec=IBus.Bus)
+    bus.get_connection.return_value = MagicMock()
+    return bus
+
+
 def _make_engine() -> Speak2TypeEngine:
     """Create a minimally-initialized Speak2TypeEngine for testing.
 
-    Patches out IBus.Bus, GSettings, AudioCapture, GlobalHotkeyListener,
-    and backend registration so the engine can be instantiated without
-    a running IBus daemon.
+    Relies on stub_engine_deps having replaced the engine's dependencies.
     """
-    mock_bus = MagicMock(spec=IBus.Bus)
-    mock_bus.get_connection.return_value = MagicMock()
-
-    with (
-        patch("speak2type.engine.Gio.SettingsSchemaSource.get_default", return_value=None),
-        patch("speak2type.engine.AudioCapture"),
-        patch("speak2type.engine.GlobalHotkeyListener"),
-        patch("speak2type.engine.register_default_backends"),
-        patch("speak2type.engine.get_registry") as mock_registry,
-        patch.object(IBus.Engine, "__init__", lambda *a, **kw: None),
-        patch.object(IBus.Engine, "update_property"),
-        patch.object(IBus.Engine, "register_properties"),
-    ):
-        mock_registry.return_value.set_current.return_value = False
-        mock_registry.return_value.available_backends = []
-        engine = Speak2TypeEngine(mock_bus, "/test/path")
+    return Speak2TypeEngine(_shared_bus(), "/test/path")
+
+
+@pytest.fixture
+def engine() -> Speak2TypeEngine:
+    """Return a fresh engine for each test.
+
+    The engine is a GObject (an IBus.Engine subclass) holding IBus.Property
+    objects that tests mutate, so it is built per test rather than copied
+    from a shared prototype, whether per session or per class: PyGObject
+    instances cannot be copied, and a shallow copy would share those
+    properties.  With stub_engine_deps in place construction is cheap.
+    """
+    return _make_engine()
+
 
-    return engine
+@pytest.fixture
+def audio_capture():
+    """Return a mock AudioCapture that starts recording and yields no segment."""
+    capture = MagicMock()
+    capture.is_setup = True
+    capture.start.return_value = True
+    capture.stop.return_value = None
+    return capture
+
+
+@pytest.fixture(autouse=True)
+def _silence_ibus_io(engine):
+    """Replace the engine's IBus preedit and property updates with mocks."""
+    engine.update_preedit_text = MagicMock()
+    engine.update_property = MagicMock()
 
 
 # ---------------------------------------------------------------------------
@@ -68,44 +137,33 @@ def _make_engine() -> Speak2TypeEngine:
 class TestAbsorbPttKey:
     """After PTT, bare key presses (without modifier) must be consumed."""
 
-    def test_absorb_set_on_ibus_ptt_start(self):
+    def test_absorb_set_on_ibus_ptt_start(self, engine, audio_capture):
         """Starting PTT via IBus sets _absorb_ptt_key."""
-        engine = _make_engine()
         engine._state = EngineState.IDLE
         engine._recording_disabled = False
-        engine._audio_capture = MagicMock()
-        engine._audio_capture.is_setup = True
-        engine._audio_capture.start.return_value = True
+        engine._audio_capture = audio_capture
 
-        with patch.object(engine, "update_preedit_text"), patch.object(
-            engine, "update_property"
-        ):
-            engine.do_process_key_event(
-                DEFAULT_PTT_KEYVAL, 0, int(DEFAULT_PTT_MODIFIERS)
-            )
+        engine.do_process_key_event(DEFAULT_PTT_KEYVAL, 0, _PTT_MOD)
 
         assert engine._absorb_ptt_key is True
 
-    def test_absorb_set_on_global_ptt_start(self):
+    def test_absorb_set_on_global_ptt_start(self, engine, audio_capture):
         """Starting PTT via portal sets _absorb_ptt_key."""
-        engine = _make_engine()
         engine._state = EngineState.IDLE
         engine._recording_disabled = False
-        engine._audio_capture = MagicMock()
-        engine._audio_capture.is_setup = True
-        engine._audio_capture.start.return_value = True
+        engine._audio_capture = audio_capture
 
-        with patch.object(engine, "update_preedit_text"), patch.object(
-            engine, "update_property"
-        ):
-            engine._on_global_ptt_press()
+        engine._on_global_ptt_press()
 
         assert engine._absorb_ptt_key is True
 
-    def test_bare_space_consumed_during_transcribing(self):
-        """Bare Space (no modifier) is consumed when absorb flag is set."""
-        engine = _make_engine()
-        engine._state = EngineState.TRANSCRIBING
+    @pytest.mark.parametrize("state", [EngineState.TRANSCRIBING, EngineState.IDLE])
+    def test_bare_space_consumed(self, engine, state):
+        """Bare Space (no modifier) is consumed while the absorb flag is set.
+
+        This holds even after returning to IDLE (the auto-repeat tail).
+        """
+        engine._state = state
         engine._absorb_ptt_key = True
 
         # Bare space press — no modifier
@@ -114,60 +172,53 @@ class TestAbsorbPttKey:
         assert result is True, "Bare space should be consumed"
         assert engine._absorb_ptt_key is True, "Flag stays set until release"
 
-    def test_bare_space_consumed_during_idle(self):
-        """Bare Space consumed even after returning to IDLE (auto-repeat tail)."""
-        engine = _make_engine()
-        engine._state = EngineState.IDLE
-        engine._absorb_ptt_key = True
-
-        result = engine.do_process_key_event(DEFAULT_PTT_KEYVAL, 57, 0)
-
-        assert result is True
-
-    def test_absorb_cleared_on_key_release(self):
+    def test_absorb_cleared_on_key_release(self, engine):
         """Physical key release clears the absorb flag."""
-        engine = _make_engine()
         engine._absorb_ptt_key = True
 
-        release_state = int(IBus.ModifierType.RELEASE_MASK)
-        result = engine.do_process_key_event(DEFAULT_PTT_KEYVAL, 57, release_state)
+        result = engine.do_process_key_event(DEFAULT_PTT_KEYVAL, 57, _RELEASE_MASK)
 
         assert result is True, "Release event itself should be consumed"
         assert engine._absorb_ptt_key is False, "Flag must be cleared"
 
-    def test_absorb_does_not_eat_other_keys(self):
+    def test_absorb_does_not_eat_other_keys(self, engine):
         """Non-PTT keys pass through even when absorb is set."""
-        engine = _make_engine()
         engine._absorb_ptt_key = True
 
         result = engine.do_process_key_event(IBus.KEY_a, 30, 0)
 
         assert result is False
 
-    def test_absorb_cleared_on_ibus_release(self):
-        """Normal IBus PTT release clears absorb flag and stops recording."""
-        engine = _make_engine()
-        engine._state = EngineState.RECORDING
-        engine._ptt_active = True
-        engine._absorb_ptt_key = True
-        engine._audio_capture = MagicMock()
-        engine._audio_capture.stop.return_value = None
+    def test_ptt_combo_passes_through_in_password_field(self, engine):
+        """No PTT handling while recording is disabled for privacy."""
+        engine._recording_disabled = True
 
-        release_state = int(DEFAULT_PTT_MODIFIERS) | int(IBus.ModifierType.RELEASE_MASK)
+        result = engine.do_process_key_event(DEFAULT_PTT_KEYVAL, 57, _PTT_MOD)
 
-        with patch.object(engine, "update_preedit_text"), patch.object(
-            engine, "update_property"
-        ):
-            result = engine.do_process_key_event(DEFAULT_PTT_KEYVAL, 0, release_state)
+        assert result is False
+        assert engine._ptt_active is False
+
+    def test_absorb_still_applies_in_password_field(self, engine):
+        """An unfinished PTT session still absorbs its key in a password field."""
+        engine._recording_disabled = True
+        engine._absorb_ptt_key = True
+        engine._ptt_key_physically_released = False
+
+        result = engine.do_process_key_event(DEFAULT_PTT_KEYVAL, 57, 0)
 
-        # The absorb check fires first (keyval matches, is_release) → clears flag
-        # AND stops recording because _ptt_active was True
         assert result is True
-        assert engine._absorb_ptt_key is False
-        assert engine._ptt_active is False
-        assert engine._state == EngineState.IDLE  # stop.return_value=None → IDLE
 
-    def test_absorb_release_stops_recording(self):
+    @pytest.mark.parametrize(
+        "segment,expected_state",
+        [
+            (None, EngineState.IDLE),
+            (MagicMock(duration_ms=2000), EngineState.TRANSCRIBING),
+        ],
+        ids=["no-segment", "segment"],
+    )
+    def test_absorb_release_stops_recording(
+        self, engine, audio_capture, segment, expected_state
+    ):
         """Absorb guard release with ptt_active stops recording (the bug fix).
 
         This is the exact scenario from the real log:
@@ -175,54 +226,41 @@ class TestAbsorbPttKey:
         2. Auto-repeats flood in with Ctrl+Space (state=4)
         3. Space release (state=RELEASE_MASK|4) hits absorb guard first
         4. Absorb guard must ALSO stop recording
+
+        Without a segment (too short) the engine returns to IDLE; with one
+        it moves on to TRANSCRIBING.
         """
-        engine = _make_engine()
         engine._state = EngineState.RECORDING
         engine._ptt_active = True
         engine._ptt_source = "ibus"
         engine._absorb_ptt_key = True
-        mock_segment = MagicMock()
-        mock_segment.duration_ms = 2000
-        engine._audio_capture = MagicMock()
-        engine._audio_capture.stop.return_value = mock_segment
+        engine._audio_capture = audio_capture
+        audio_capture.stop.return_value = segment
 
-        release_state = int(DEFAULT_PTT_MODIFIERS) | int(IBus.ModifierType.RELEASE_MASK)
-
-        with (
-            patch.object(engine, "update_preedit_text"),
-            patch.object(engine, "update_property"),
-        ):
-            result = engine.do_process_key_event(DEFAULT_PTT_KEYVAL, 57, release_state)
+        result = engine.do_process_key_event(DEFAULT_PTT_KEYVAL, 57, _PTT_RELEASE)
 
         assert result is True
         assert engine._absorb_ptt_key is False
         assert engine._ptt_active is False
         assert engine._ptt_source is None
-        assert engine._state == EngineState.TRANSCRIBING
+        assert engine._state == expected_state
 
-    def test_portal_release_schedules_timeout(self):
+    def test_portal_release_schedules_timeout(self, engine, audio_capture):
         """Global PTT release schedules a safety timeout for absorb flag."""
-        engine = _make_engine()
         engine._state = EngineState.RECORDING
         engine._ptt_active = True
         engine._ptt_source = "global"
         engine._absorb_ptt_key = True
-        engine._audio_capture = MagicMock()
-        engine._audio_capture.stop.return_value = None
+        engine._audio_capture = audio_capture
 
-        with (
-            patch.object(engine, "update_preedit_text"),
-            patch.object(engine, "update_property"),
-            patch("speak2type.engine.GLib.timeout_add") as mock_timeout,
-        ):
+        with patch.object(_engine_module.GLib, "timeout_add") as mock_timeout:
             engine._on_global_ptt_release()
 
         mock_timeout.assert_called_once()
         assert mock_timeout.call_args[0][0] == 1000  # 1 second timeout
 
-    def test_timeout_callback_clears_absorb(self):
+    def test_timeout_callback_clears_absorb(self, engine):
         """The timeout callback clears the absorb flag."""
-        engine = _make_engine()
         engine._absorb_ptt_key = True
         engine._absorb_timeout_id = 42
 
@@ -232,7 +270,7 @@ class TestAbsorbPttKey:
         assert engine._absorb_timeout_id == 0
         assert result == GLib.SOURCE_REMOVE
 
-    def test_full_scenario_bare_spaces_blocked(self):
+    def test_full_scenario_bare_spaces_blocked(self, engine, audio_capture):
         """End-to-end: Ctrl+Space PTT, portal releases first, bare spaces absorbed.
 
         Reproduces the exact bug from issue #7:
@@ -243,85 +281,51 @@ class TestAbsorbPttKey:
         5. Bare Space auto-repeat → ALL consumed by absorb
         6. User releases Space → absorb cleared
         """
-        engine = _make_engine()
         engine._state = EngineState.IDLE
         engine._recording_disabled = False
-        engine._audio_capture = MagicMock()
-        engine._audio_capture.is_setup = True
-        engine._audio_capture.start.return_value = True
-        mock_segment = MagicMock()
-        mock_segment.duration_ms = 1000  # 1 second — above 200ms threshold
-        engine._audio_capture.stop.return_value = mock_segment
-
-        ptt_mod = int(DEFAULT_PTT_MODIFIERS)
-        release_mask = int(IBus.ModifierType.RELEASE_MASK)
+        engine._audio_capture = audio_capture
+        # 1 second — above 200ms threshold
+        audio_capture.stop.return_value = MagicMock(duration_ms=1000)
 
-        with (
-            patch.object(engine, "update_preedit_text"),
-            patch.object(engine, "update_property"),
-            patch("speak2type.engine.GLib.timeout_add"),
-        ):
-            # Step 1: Mod+Space press → starts recording
-            r = engine.do_process_key_event(DEFAULT_PTT_KEYVAL, 57, ptt_mod)
-            assert r is True
+        with patch.object(_engine_module.GLib, "timeout_add"):
+            # Steps 1-2: Mod+Space press starts recording, repeats are consumed
+            feed_key_events(engine, [(DEFAULT_PTT_KEYVAL, 57, _PTT_MOD, True)] * 3)
             assert engine._state == EngineState.RECORDING
             assert engine._absorb_ptt_key is True
 
-            # Step 2: A few Mod+Space repeats
-            for _ in range(5):
-                r = engine.do_process_key_event(DEFAULT_PTT_KEYVAL, 57, ptt_mod)
-                assert r is True
-
             # Step 3: Portal releases → recording stops
             engine._on_global_ptt_release()
             assert engine._state == EngineState.TRANSCRIBING
             assert engine._ptt_active is False
 
-            # Step 4: Modifier release — not the PTT key, should pass through
-            r = engine.do_process_key_event(IBus.KEY_Alt_L, 56, ptt_mod | release_mask)
-            assert r is False
-
-            # Step 5: Bare Space auto-repeats — ALL must be consumed
-            for _ in range(20):
-                r = engine.do_process_key_event(DEFAULT_PTT_KEYVAL, 57, 0)
-                assert r is True, "Bare space must be consumed by absorb"
-
-            # Step 6: Space release → absorb cleared
-            r = engine.do_process_key_event(DEFAULT_PTT_KEYVAL, 57, release_mask)
-            assert r is True
+            feed_key_events(engine, [
+                # Step 4: Modifier release — not the PTT key, passes through
+                (IBus.KEY_Alt_L, 56, _PTT_RELEASE, False),
+                # Step 5: Bare Space auto-repeats — ALL consumed by absorb
+                (DEFAULT_PTT_KEYVAL, 57, 0, True),
+                (DEFAULT_PTT_KEYVAL, 57, 0, True),
+                # Step 6: Space release → absorb cleared
+                (DEFAULT_PTT_KEYVAL, 57, _RELEASE_MASK, True),
+                # Step 7: Next bare space passes through (normal typing)
+                (DEFAULT_PTT_KEYVAL, 57, 0, False),
+            ])
             assert engine._absorb_ptt_key is False
 
-            # Step 7: Next bare space should pass through (normal typing)
-            r = engine.do_process_key_event(DEFAULT_PTT_KEYVAL, 57, 0)
-            assert r is False
-
-    def test_no_retrigger_after_absorb_timeout(self):
+    def test_no_retrigger_after_absorb_timeout(self, engine, audio_capture):
         """Auto-repeat events must not start a new recording after timeout expires.
 
         Reproduces: absorb timeout fires while PTT key is still held from
         a previous session.  Without the fix, the next auto-repeat event
         matches the PTT combo and starts an unwanted recording.
         """
-        engine = _make_engine()
         engine._state = EngineState.IDLE
         engine._recording_disabled = False
-        engine._audio_capture = MagicMock()
-        engine._audio_capture.is_setup = True
-        engine._audio_capture.start.return_value = True
-        mock_segment = MagicMock()
-        mock_segment.duration_ms = 1000
-        engine._audio_capture.stop.return_value = mock_segment
+        engine._audio_capture = audio_capture
+        audio_capture.stop.return_value = MagicMock(duration_ms=1000)
 
-        ptt_mod = int(DEFAULT_PTT_MODIFIERS)
-        release_mask = int(IBus.ModifierType.RELEASE_MASK)
-
-        with (
-            patch.object(engine, "update_preedit_text"),
-            patch.object(engine, "update_property"),
-            patch("speak2type.engine.GLib.timeout_add"),
-        ):
+        with patch.object(_engine_module.GLib, "timeout_add"):
             # Step 1: PTT activates
-            r = engine.do_process_key_event(DEFAULT_PTT_KEYVAL, 57, ptt_mod)
+            r = engine.do_process_key_event(DEFAULT_PTT_KEYVAL, 57, _PTT_MOD)
             assert engine._state == EngineState.RECORDING
             assert engine._ptt_key_physically_released is False
 
@@ -337,13 +341,13 @@ class TestAbsorbPttKey:
 
             # Step 4: Auto-repeat events with PTT combo — must NOT start recording
             for _ in range(10):
-                r = engine.do_process_key_event(DEFAULT_PTT_KEYVAL, 57, ptt_mod)
+                r = engine.do_process_key_event(DEFAULT_PTT_KEYVAL, 57, _PTT_MOD)
                 assert r is True, "Auto-repeat must be consumed, not start recording"
             # Engine must still be in TRANSCRIBING (or whatever it was), not RECORDING
             assert engine._state != EngineState.RECORDING
 
             # Step 5: Physical release → flag cleared
-            r = engine.do_process_key_event(DEFAULT_PTT_KEYVAL, 57, ptt_mod | release_mask)
+            r = engine.do_process_key_event(DEFAULT_PTT_KEYVAL, 57, _PTT_RELEASE)
             # The regular release path checks _ptt_active, which is False after portal release
             # The absorb guard is also cleared. So this should pass through.
             assert engine._ptt_key_physically_released is True
@@ -351,7 +355,7 @@ class TestAbsorbPttKey:
             # Step 6: NOW a fresh PTT press should work
             # First we need the engine back to IDLE
             engine._state = EngineState.IDLE
-            r = engine.do_process_key_event(DEFAULT_PTT_KEYVAL, 57, ptt_mod)
+            r = engine.do_process_key_event(DEFAULT_PTT_KEYVAL, 57, _PTT_MOD)
             assert r is True
             assert engine._state == EngineState.RECORDING
 
@@ -364,29 +368,23 @@ class TestAbsorbPttKey:
 class TestLeakedSpaceCount:
     """PTT key repeats during RECORDING increment _leaked_space_count."""
 
-    def test_no_leak_count_in_idle(self):
+    def test_no_leak_count_in_idle(self, engine, audio_capture):
         """Key press in IDLE starts recording but does not count as a leak."""
-        engine = _make_engine()
         engine._state = EngineState.IDLE
         engine._recording_disabled = False
-        engine._audio_capture = MagicMock()
-        engine._audio_capture.is_setup = True
-        engine._audio_capture.start.return_value = True
-
-        with patch.object(engine, "update_preedit_text"):
-            with patch.object(engine, "update_property"):
-                engine.do_process_key_event(
-                    DEFAULT_PTT_KEYVAL,
-                    0,
-                    int(DEFAULT_PTT_MODIFIERS),
-                )
+        engine._audio_capture = audio_capture
+
+        engine.do_process_key_event(
+            DEFAULT_PTT_KEYVAL,
+            0,
+            _PTT_MOD,
+        )
 
         assert engine._state == EngineState.RECORDING
         assert engine._leaked_space_count == 0
 
-    def test_repeat_increments_leak_count(self):
+    def test_repeat_increments_leak_count(self, engine):
         """Key repeat during RECORDING increments leaked count."""
-        engine = _make_engine()
         engine._state = EngineState.RECORDING
         engine._ptt_active = True
         engine._ptt_source = "ibus"
@@ -394,62 +392,81 @@ class TestLeakedSpaceCount:
         result = engine.do_process_key_event(
             DEFAULT_PTT_KEYVAL,
             0,
-            int(DEFAULT_PTT_MODIFIERS),
+            _PTT_MOD,
         )
 
         assert result is True
         assert engine._leaked_space_count == 1
 
-    def test_multiple_repeats_accumulate(self):
+    @pytest.mark.parametrize("n", [1, 3])
+    def test_multiple_repeats_accumulate(self, engine, n):
         """Multiple key repeats accumulate the leak count."""
-        engine = _make_engine()
         engine._state = EngineState.RECORDING
         engine._ptt_active = True
         engine._ptt_source = "ibus"
 
-        for _ in range(15):
+        for _ in range(n):
             engine.do_process_key_event(
                 DEFAULT_PTT_KEYVAL,
                 0,
-                int(DEFAULT_PTT_MODIFIERS),
+                _PTT_MOD,
             )
 
-        assert engine._leaked_space_count == 15
+        assert engine._leaked_space_count == n
 
-    def test_leak_count_resets_on_recording_start(self):
+    def test_leak_count_resets_on_recording_start(self, engine, audio_capture):
         """Starting a new recording resets the leaked count."""
-        engine = _make_engine()
         engine._leaked_space_count = 42
         engine._state = EngineState.IDLE
         engine._recording_disabled = False
-        engine._audio_capture = MagicMock()
-        engine._audio_capture.is_setup = True
-        engine._audio_capture.start.return_value = True
+        engine._audio_capture = audio_capture
 
-        with patch.object(engine, "update_preedit_text"):
-            with patch.object(engine, "update_property"):
-                engine._start_recording()
+        engine._start_recording()
 
         assert engine._leaked_space_count == 0
 
-    def test_release_does_not_increment(self):
+    def test_release_does_not_increment(self, engine, audio_capture):
         """Key release does not increment the leak count."""
-        engine = _make_engine()
         engine._state = EngineState.RECORDING
         engine._ptt_active = True
         # Mock audio capture to return None segment (short recording)
-        engine._audio_capture = MagicMock()
-        engine._audio_capture.stop.return_value = None
-
-        release_state = int(DEFAULT_PTT_MODIFIERS) | int(IBus.ModifierType.RELEASE_MASK)
+        engine._audio_capture = audio_capture
 
-        with patch.object(engine, "update_preedit_text"):
-            with patch.object(engine, "update_property"):
-                engine.do_process_key_event(DEFAULT_PTT_KEYVAL, 0, release_state)
+        engine.do_process_key_event(DEFAULT_PTT_KEYVAL, 0, _PTT_RELEASE)
 
         assert engine._leaked_space_count == 0
 
 
+# ---------------------------------------------------------------------------
+# Shared audio capture on disable
+# ---------------------------------------------------------------------------
+
+
+class TestDisableSharedAudio:
+    """Disabling one engine must not tear down a capture other engines share."""
+
+    def test_shared_capture_released_through_owner(self, engine, audio_capture):
+        """With a factory owner, do_disable() hands the release to the owner."""
+        engine._audio_capture = audio_capture
+        engine._audio_owner = MagicMock()
+        engine._audio_in_use = True
+
+        engine.do_disable()
+        engine.do_disable()  # A second disable releases nothing more
+
+        engine._audio_owner.release_audio.assert_called_once_with()
+        audio_capture.destroy.assert_not_called()
+
+    def test_private_capture_destroyed(self, engine, audio_capture):
+        """Without an owner the engine's own capture is destroyed."""
+        engine._audio_capture = audio_capture
+        engine._audio_in_use = True
+
+        engine.do_disable()
+
+        audio_capture.destroy.assert_called_once_with()
+
+
 # ---------------------------------------------------------------------------
 # _type_text_unfocused
 # ---------------------------------------------------------------------------
@@ -458,82 +475,145 @@ class TestLeakedSpaceCount:
 class TestTypeTextUnfocused:
     """_type_text_unfocused dispatches to the correct tool or falls back."""
 
-    def test_wayland_dispatches_wtype(self):
+    def test_wayland_dispatches_wtype(self, engine, monkeypatch):
         """On Wayland with wtype available, uses _paste_with_wtype."""
-        engine = _make_engine()
         engine._leaked_space_count = 3
+        monkeypatch.setenv("XDG_SESSION_TYPE", "wayland")
 
         with (
-            patch.dict("os.environ", {"XDG_SESSION_TYPE": "wayland"}),
-            patch("speak2type.engine.shutil.which", side_effect=lambda t: t == "wtype"),
-            patch.object(engine, "_copy_to_clipboard"),
-            patch.object(engine, "_paste_with_wtype") as mock_wtype,
+            patch.object(_engine_module.shutil, "which", side_effect=lambda t: t == "wtype"),
+            patch.multiple(
+                engine, _copy_to_clipboard=DEFAULT, _paste_with_wtype=DEFAULT
+            ) as mocks,
         ):
             engine._type_text_unfocused("hello world")
 
-        mock_wtype.assert_called_once_with(3)
+        mocks["_paste_with_wtype"].assert_called_once_with(3)
         assert engine._leaked_space_count == 0
 
-    def test_x11_dispatches_xdotool(self):
+    def test_x11_dispatches_xdotool(self, engine, monkeypatch):
         """On X11 with xdotool available, uses _paste_with_xdotool."""
-        engine = _make_engine()
         engine._leaked_space_count = 5
+        monkeypatch.setenv("XDG_SESSION_TYPE", "x11")
 
         with (
-            patch.dict("os.environ", {"XDG_SESSION_TYPE": "x11"}),
-            patch("speak2type.engine.shutil.which", side_effect=lambda t: t == "xdotool"),
-            patch.object(engine, "_copy_to_clipboard"),
-            patch.object(engine, "_paste_with_xdotool") as mock_xdotool,
+            patch.object(_engine_module.shutil, "which", side_effect=lambda t: t == "xdotool"),
+            patch.multiple(
+                engine, _copy_to_clipboard=DEFAULT, _paste_with_xdotool=DEFAULT
+            ) as mocks,
         ):
             engine._type_text_unfocused("hello world")
 
-        mock_xdotool.assert_called_once_with(5)
+        mocks["_paste_with_xdotool"].assert_called_once_with(5)
 
-    def test_wayland_without_wtype_falls_back_to_xdotool(self):
+    def test_wayland_without_wtype_falls_back_to_xdotool(self, engine, monkeypatch):
         """On Wayland without wtype, falls back to xdotool."""
-        engine = _make_engine()
+        monkeypatch.setenv("XDG_SESSION_TYPE", "wayland")
 
         def which_side_effect(name):
             return "/usr/bin/xdotool" if name == "xdotool" else None
 
         with (
-            patch.dict("os.environ", {"XDG_SESSION_TYPE": "wayland"}),
-            patch("speak2type.engine.shutil.which", side_effect=which_side_effect),
-            patch.object(engine, "_copy_to_clipboard"),
-            patch.object(engine, "_paste_with_xdotool") as mock_xdotool,
+            patch.object(_engine_module.shutil, "which", side_effect=which_side_effect),
+            patch.multiple(
+                engine, _copy_to_clipboard=DEFAULT, _paste_with_xdotool=DEFAULT
+            ) as mocks,
         ):
             engine._type_text_unfocused("test")
 
-        mock_xdotool.assert_called_once()
+        mocks["_paste_with_xdotool"].assert_called_once()
 
-    def test_no_tools_falls_back_to_clipboard(self):
+    def test_no_tools_falls_back_to_clipboard(self, engine, monkeypatch):
         """Without wtype or xdotool, copies to clipboard only."""
-        engine = _make_engine()
+        monkeypatch.setenv("XDG_SESSION_TYPE", "wayland")
 
         with (
-            patch.dict("os.environ", {"XDG_SESSION_TYPE": "wayland"}),
-            patch("speak2type.engine.shutil.which", return_value=None),
+            patch.object(_engine_module.shutil, "which", return_value=None),
             patch.object(engine, "_copy_to_clipboard") as mock_clip,
         ):
             engine._type_text_unfocused("fallback text")
 
         mock_clip.assert_called_once_with("fallback text")
 
-    def test_always_copies_to_clipboard(self):
+    def test_always_copies_to_clipboard(self, engine, monkeypatch):
         """Regardless of paste tool, always copies to clipboard first."""
-        engine = _make_engine()
+        monkeypatch.setenv("XDG_SESSION_TYPE", "wayland")
 
         with (
-            patch.dict("os.environ", {"XDG_SESSION_TYPE": "wayland"}),
-            patch("speak2type.engine.shutil.which", return_value="/usr/bin/wtype"),
+            patch.object(_engine_module.shutil, "which", return_value="/usr/bin/wtype"),
             patch.object(engine, "_copy_to_clipboard") as mock_clip,
-            patch("speak2type.engine.subprocess.run"),
+            patch.object(_engine_module.subprocess, "run"),
         ):
             engine._type_text_unfocused("text")
 
         mock_clip.assert_called_once_with("text")
 
 
+# ---------------------------------------------------------------------------
+# _copy_to_clipboard
+# ---------------------------------------------------------------------------
+
+
+class TestCopyToClipboard:
+    """Clipboard tools always receive the text on stdin."""
+
+    def test_wayland_uses_wl_copy_stdin(self, engine, monkeypatch):
+        """On Wayland, wl-copy is spawned without argv text and fed via stdin."""
+        monkeypatch.setenv("XDG_SESSION_TYPE", "wayland")
+
+        with (
+            patch.object(_engine_module.shutil, "which", return_value="/usr/bin/wl-copy"),
+            patch.object(_engine_module.subprocess, "Popen") as mock_popen,
+        ):
+            engine._copy_to_clipboard("hello world")
+
+        assert mock_popen.call_args[0][0] == ["wl-copy"]
+        mock_popen.return_value.stdin.write.assert_called_once_with(b"hello world")
+        mock_popen.return_value.stdin.close.assert_called_once()
+
+    def test_x11_uses_xclip_stdin(self, engine, monkeypatch):
+        """On X11, xclip is used even when wl-copy is installed, and waited for."""
+        monkeypatch.setenv("XDG_SESSION_TYPE", "x11")
+
+        with (
+            patch.object(_engine_module.shutil, "which", return_value="/usr/bin/tool"),
+            patch.object(_engine_module.subprocess, "Popen") as mock_popen,
+        ):
+            engine._copy_to_clipboard("hello")
+
+        assert mock_popen.call_args[0][0] == ["xclip", "-selection", "clipboard"]
+        # xclip is waited for, so the selection is owned before any paste
+        mock_popen.return_value.communicate.assert_called_once_with(b"hello", timeout=2)
+
+    def test_xclip_timeout_kills_tool(self, engine, monkeypatch):
+        """An xclip that does not exit in time is killed and reaped."""
+        monkeypatch.setenv("XDG_SESSION_TYPE", "x11")
+
+        with (
+            patch.object(_engine_module.shutil, "which", return_value="/usr/bin/xclip"),
+            patch.object(_engine_module.subprocess, "Popen") as mock_popen,
+        ):
+            mock_popen.return_value.communicate.side_effect = subprocess.TimeoutExpired(
+                "xclip", 2
+            )
+            engine._copy_to_clipboard("hello")
+
+        mock_popen.return_value.kill.assert_called_once()
+        mock_popen.return_value.wait.assert_called_once()
+
+    def test_no_tool_does_not_spawn(self, engine, monkeypatch):
+        """Without any clipboard tool nothing is spawned."""
+        monkeypatch.setenv("XDG_SESSION_TYPE", "wayland")
+
+        with (
+            patch.object(_engine_module.shutil, "which", return_value=None),
+            patch.object(_engine_module.subprocess, "Popen") as mock_popen,
+        ):
+            engine._copy_to_clipboard("text")
+
+        mock_popen.assert_not_called()
+
+
 # ---------------------------------------------------------------------------
 # _paste_with_wtype
 # ---------------------------------------------------------------------------
@@ -542,22 +622,18 @@ class TestTypeTextUnfocused:
 class TestPasteWithWtype:
     """wtype command construction."""
 
-    def test_no_leaked_spaces(self):
+    def test_no_leaked_spaces(self, engine):
         """With zero leaked spaces, just pastes."""
-        engine = _make_engine()
-
-        with patch("speak2type.engine.subprocess.run") as mock_run:
+        with patch.object(_engine_module.subprocess, "run") as mock_run:
             engine._paste_with_wtype(0)
 
         mock_run.assert_called_once()
         cmd = mock_run.call_args[0][0]
-        assert cmd == ["wtype", "-M", "ctrl", "-k", "v", "-m", "ctrl"]
+        assert tuple(cmd) == ("wtype", *_WTYPE_PASTE_SUFFIX)
 
-    def test_with_leaked_spaces(self):
+    def test_with_leaked_spaces(self, engine):
         """Leaked spaces produce Shift+Left selection before paste."""
-        engine = _make_engine()
-
-        with patch("speak2type.engine.subprocess.run") as mock_run:
+        with patch.object(_engine_module.subprocess, "run") as mock_run:
             engine._paste_with_wtype(3)
 
         cmd = mock_run.call_args[0][0]
@@ -567,16 +643,11 @@ class TestPasteWithWtype:
         # Shift modifier wrapping for selection
         assert "shift" in cmd
         # Paste at end: -M ctrl -k v -m ctrl
-        assert cmd[-6:] == ["-M", "ctrl", "-k", "v", "-m", "ctrl"]
+        assert tuple(cmd[-6:]) == _WTYPE_PASTE_SUFFIX
 
-    def test_subprocess_error_logged(self):
+    def test_subprocess_error_logged(self, engine):
         """subprocess errors are caught and logged, not raised."""
-        engine = _make_engine()
-
-        with patch(
-            "speak2type.engine.subprocess.run",
-            side_effect=subprocess.TimeoutExpired("wtype", 10),
-        ):
+        with patch.object(_engine_module.subprocess, "run", side_effect=_TIMEOUT_WTYPE):
             # Should not raise
             engine._paste_with_wtype(0)
 
@@ -589,22 +660,18 @@ class TestPasteWithWtype:
 class TestPasteWithXdotool:
     """xdotool command construction."""
 
-    def test_no_leaked_spaces(self):
+    def test_no_leaked_spaces(self, engine):
         """With zero leaked spaces, just pastes."""
-        engine = _make_engine()
-
-        with patch("speak2type.engine.subprocess.run") as mock_run:
+        with patch.object(_engine_module.subprocess, "run") as mock_run:
             engine._paste_with_xdotool(0)
 
         mock_run.assert_called_once()
         cmd = mock_run.call_args[0][0]
-        assert cmd == ["xdotool", "key", "ctrl+v"]
+        assert tuple(cmd) == _XDOTOOL_PASTE
 
-    def test_with_leaked_spaces(self):
+    def test_with_leaked_spaces(self, engine):
         """Leaked spaces produce Shift+Left keys before paste."""
-        engine = _make_engine()
-
-        with patch("speak2type.engine.subprocess.run") as mock_run:
+        with patch.object(_engine_module.subprocess, "run") as mock_run:
             engine._paste_with_xdotool(4)
 
         assert mock_run.call_count == 2
@@ -616,16 +683,11 @@ class TestPasteWithXdotool:
 
         # Second call: paste
         paste_cmd = mock_run.call_args_list[1][0][0]
-        assert paste_cmd == ["xdotool", "key", "ctrl+v"]
+        assert tuple(paste_cmd) == _XDOTOOL_PASTE
 
-    def test_subprocess_error_logged(self):
+    def test_subprocess_error_logged(self, engine):
         """subprocess errors are caught and logged, not raised."""
-        engine = _make_engine()
-
-        with patch(
-            "speak2type.engine.subprocess.run",
-            side_effect=subprocess.TimeoutExpired("xdotool", 10),
-        ):
+        with patch.object(_engine_module.subprocess, "run", side_effect=_TIMEOUT_XDOTOOL):
             # Should not raise
             engine._paste_with_xdotool(0)
 
@@ -638,35 +700,56 @@ class TestPasteWithXdotool:
 class TestTranscriptionResultUnfocused:
     """When _has_real_focus=False, result goes through _type_text_unfocused."""
 
-    def test_unfocused_calls_type_text_unfocused(self):
+    def test_unfocused_calls_type_text_unfocused(self, engine):
         """Transcription result dispatches to _type_text_unfocused."""
-        engine = _make_engine()
         engine._has_real_focus = False
         engine._state = EngineState.TRANSCRIBING
 
-        result = TranscriptResult(text="hello world")
-
-        with (
-            patch.object(engine, "_type_text_unfocused") as mock_type,
-            patch.object(engine, "update_property"),
-        ):
-            engine._on_transcription_result(result)
+        with patch.object(engine, "_type_text_unfocused") as mock_type:
+            engine._on_transcription_result(_RESULT_HELLO_WORLD)
 
         mock_type.assert_called_once_with("hello world")
 
-    def test_focused_still_uses_commit_text(self):
+    def test_focused_still_uses_commit_text(self, engine):
         """Transcription result with real focus uses commit_text."""
-        engine = _make_engine()
         engine._has_real_focus = True
         engine._state = EngineState.TRANSCRIBING
 
-        result = TranscriptResult(text="hello")
+        with patch.object(engine, "commit_text") as mock_commit:
+            engine._on_transcription_result(_RESULT_HELLO)
+
+        mock_commit.assert_called_once()
+
+
+# ---------------------------------------------------------------------------
+# Panel properties across focus changes
+# ---------------------------------------------------------------------------
+
+
+class TestFocusProperties:
+    """The panel only keeps properties registered for the focused context."""
+
+    @pytest.mark.parametrize(
+        ("focus_in", "focus_out"),
+        [
+            ((), ()),
+            (("/ic/1", "gnome-shell"), ("/ic/1",)),
+        ],
+        ids=["plain", "with-id"],
+    )
+    def test_properties_registered_again_after_focus_change(self, engine, focus_in, focus_out):
+        """Each new focus-in registers the properties; a repeated one does not."""
+        suffix = "_id" if focus_in else ""
+        do_focus_in = getattr(engine, "do_focus_in" + suffix)
+        do_focus_out = getattr(engine, "do_focus_out" + suffix)
 
         with (
-            patch.object(engine, "commit_text") as mock_commit,
-            patch.object(engine, "update_preedit_text"),
-            patch.object(engine, "update_property"),
+            patch.object(engine, "register_properties") as mock_register,
+            patch.object(engine, "_schedule_ui_update"),
         ):
-            engine._on_transcription_result(result)
+            do_focus_in(*focus_in)
+            do_focus_in(*focus_in)
+            do_focus_out(*focus_out)
+            do_focus_in(*focus_in)
 
-        mock_commit.assert_called_once()
+        assert mock_register.call_count == 2
@@ -0,0 +1,261 @@
+"""Tests for the transcription worker."""
+
+import queue
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from speak2type.types import TranscriptResult
+from speak2type.worker import SpscSegmentQueue, TranscriptionJob, TranscriptionWorker
+
+
+def _job(sample_audio_segment, locale: str = "en_US") -> TranscriptionJob:
+    return TranscriptionJob(segment=sample_audio_segment, locale_hint=locale)
+
+
+class TestSpscSegmentQueue:
+    """Tests for SpscSegmentQueue."""
+
+    def test_fifo_order(self, sample_audio_segment):
+        """Jobs come out in submission order."""
+        q = SpscSegmentQueue(capacity=4)
+        jobs = [_job(sample_audio_segment, f"l{i}") for i in range(3)]
+        for job in jobs:
+            assert q.put(job) is True
+
+        assert len(q) == 3
+        assert [q.get(timeout=0) for _ in range(3)] == jobs
+        assert len(q) == 0
+
+    def test_put_fails_when_full(self, sample_audio_segment):
+        """put() refuses jobs beyond capacity."""
+        q = SpscSegmentQueue(capacity=2)
+        assert q.put(_job(sample_audio_segment))
+        assert q.put(_job(sample_audio_segment))
+        assert q.put(_job(sample_audio_segment)) is False
+        assert len(q) == 2
+
+    def test_wraps_around(self, sample_audio_segment):
+        """Slots are reused after the ring wraps."""
+        q = SpscSegmentQueue(capacity=2)
+        for i in range(5):
+            job = _job(sample_audio_segment, f"l{i}")
+            assert q.put(job)
+            assert q.get(timeout=0) is job
+
+    def test_get_times_out_when_empty(self):
+        """get() raises queue.Empty after the timeout."""
+        q = SpscSegmentQueue(capacity=2)
+        with pytest.raises(queue.Empty):
+            q.get(timeout=0.01)
+
+    def test_wake_returns_none(self):
+        """wake() makes a blocking get() return None."""
+        q = SpscSegmentQueue(capacity=2)
+        q.wake()
+        assert q.get() is None
+
+
+class TestBatching:
+    """Tests for micro-batching in TranscriptionWorker."""
+
+    def test_batch_backend_groups_by_locale(self, sample_audio_segment):
+        """Consecutive same-locale jobs go to transcribe_batch in one call."""
+        backend = MagicMock()
+        backend.supports_batch = True
+        backend.transcribe_batch.side_effect = lambda segs, **kw: [
+            TranscriptResult(text=kw["locale_hint"]) for _ in segs
+        ]
+        on_result = MagicMock()
+        worker = TranscriptionWorker(backend=backend, on_result=on_result)
+        jobs = [
+            _job(sample_audio_segment, "en_US"),
+            _job(sample_audio_segment, "en_US"),
+            _job(sample_audio_segment, "fr_FR"),
+        ]
+
+        with patch("speak2type.worker.GLib.idle_add") as mock_idle:
+            worker._process_batch(jobs)
+
+        assert backend.transcribe_batch.call_count == 2
+        assert len(backend.transcribe_batch.call_args_list[0][0][0]) == 2
+        mock_idle.assert_called_once_with(worker._drain_pending)
+        worker._drain_pending()
+        delivered = [c[0][0].text for c in on_result.call_args_list]
+        assert delivered == ["en_US", "en_US", "fr_FR"]
+        backend.transcribe.assert_not_called()
+
+    def test_short_batch_result_reports_every_job(self, sample_audio_segment):
+        """Too few batch results fail the whole group instead of dropping jobs."""
+        backend = MagicMock()
+        backend.supports_batch = True
+        backend.transcribe_batch.return_value = [TranscriptResult(text="only one")]
+        on_result = MagicMock()
+        on_error = MagicMock()
+        worker = TranscriptionWorker(backend=backend, on_result=on_result, on_error=on_error)
+
+        with patch("speak2type.worker.GLib.idle_add"):
+            worker._process_batch([_job(sample_audio_segment)] * 3)
+        worker._drain_pending()
+
+        on_result.assert_not_called()
+        assert on_error.call_count == 3
+        assert isinstance(on_error.call_args[0][0], ValueError)
+
+    def test_non_batch_backend_falls_back_to_loop(self, sample_audio_segment):
+        """Backends without supports_batch get one transcribe() per job."""
+        backend = MagicMock(spec=["id", "name", "transcribe"])
+        backend.transcribe.return_value = TranscriptResult(text="hi")
+        on_result = MagicMock()
+        worker = TranscriptionWorker(backend=backend, on_result=on_result)
+
+        with patch("speak2type.worker.GLib.idle_add") as mock_idle:
+            worker._process_batch([_job(sample_audio_segment)] * 3)
+        worker._drain_pending()
+
+        assert backend.transcribe.call_count == 3
+        assert mock_idle.call_count == 1
+        assert on_result.call_count == 3
+
+    def test_collect_batch_drains_queued_jobs(self, sample_audio_segment):
+        """With a zero window, already-queued jobs are batched up to max_batch."""
+        backend = MagicMock()
+        backend.supports_batch = True
+        worker = TranscriptionWorker(backend=backend, on_result=MagicMock(), max_batch=3)
+        for _ in range(4):
+            worker._job_queue.put(_job(sample_audio_segment))
+
+        first = worker._job_queue.get(timeout=0)
+        jobs = worker._collect_batch(first)
+
+        assert len(jobs) == 3
+        assert len(worker._job_queue) == 1
+
+
+class TestWarmup:
+    """Tests for backend prewarming."""
+
+    def test_warmup_called_when_enabled(self):
+        """_warmup_backend() calls the backend's warmup()."""
+        backend = MagicMock()
+        worker = TranscriptionWorker(backend=backend, on_result=MagicMock(), prewarm=True)
+
+        worker._warmup_backend()
+
+        backend.warmup.assert_called_once_with()
+
+    def test_warmup_errors_are_swallowed(self):
+        """A failing warmup does not propagate."""
+        backend = MagicMock()
+        backend.warmup.side_effect = RuntimeError("boom")
+        worker = TranscriptionWorker(backend=backend, on_result=MagicMock(), prewarm=True)
+
+        worker._warmup_backend()  # Should not raise
+
+    def test_backend_without_warmup_is_skipped(self):
+        """Backends without warmup() are left alone."""
+        backend = MagicMock(spec=["id", "name", "transcribe"])
+        worker = TranscriptionWorker(backend=backend, on_result=MagicMock(), prewarm=True)
+
+        worker._warmup_backend()
+
+        backend.transcribe.assert_not_called()
+
+
+class TestPerJobCallbacks:
+    """Tests for routing results to the submitting engine."""
+
+    def test_result_goes_to_job_callback(self, sample_audio_segment):
+        """A job's own on_result takes precedence over the worker default."""
+        backend = MagicMock(spec=["id", "name", "transcribe"])
+        backend.transcribe.return_value = TranscriptResult(text="hi")
+        default_cb = MagicMock()
+        job_cb = MagicMock()
+        worker = TranscriptionWorker(backend=backend, on_result=default_cb)
+        job = TranscriptionJob(
+            segment=sample_audio_segment, locale_hint="en_US", on_result=job_cb
+        )
+
+        with patch("speak2type.worker.GLib.idle_add"):
+            worker._process_batch([job])
+        worker._drain_pending()
+
+        job_cb.assert_called_once_with(backend.transcribe.return_value)
+        default_cb.assert_not_called()
+
+    def test_error_goes_to_job_callback(self, sample_audio_segment):
+        """A job's own on_error receives its failure."""
+        backend = MagicMock(spec=["id", "name", "transcribe"])
+        backend.transcribe.side_effect = RuntimeError("boom")
+        job_err = MagicMock()
+        worker = TranscriptionWorker(backend=backend, on_error=MagicMock())
+        job = TranscriptionJob(
+            segment=sample_audio_segment, locale_hint="en_US", on_error=job_err
+        )
+
+        with patch("speak2type.worker.GLib.idle_add"):
+            worker._process_batch([job])
+        worker._drain_pending()
+
+        job_err.assert_called_once()
+
+
+class TestBackpressure:
+    """Tests for the pending-utterance cap."""
+
+    def test_pending_count_tracks_submissions(self, sample_audio_segment):
+        """pending_count() counts jobs submitted but not yet completed."""
+        worker = TranscriptionWorker(backend=MagicMock(), max_pending=2)
+        worker.start = MagicMock()  # Keep jobs queued
+
+        worker.submit(sample_audio_segment)
+        worker.submit(sample_audio_segment)
+
+        assert worker.pending_count() == 2
+        assert worker.pending_count() >= worker.max_pending
+
+    def test_submit_beyond_max_pending_is_dropped(self, sample_audio_segment):
+        """A submission over the cap is reported instead of queued."""
+        on_error = MagicMock()
+        worker = TranscriptionWorker(backend=MagicMock(), on_error=on_error, max_pending=1)
+        worker.start = MagicMock()
+
+        with patch("speak2type.worker.GLib.idle_add"):
+            worker.submit(sample_audio_segment)
+            worker.submit(sample_audio_segment)
+        worker._drain_pending()
+
+        assert worker.pending_count() == 1
+        on_error.assert_called_once()
+        assert worker.dropped_count == 1
+
+
+class TestDeliveryCoalescing:
+    """Tests for batching main-loop deliveries."""
+
+    def test_drain_reschedules_for_later_results(self):
+        """Results posted after a drain get a fresh idle source."""
+        on_result = MagicMock()
+        worker = TranscriptionWorker(backend=MagicMock(), on_result=on_result)
+        result = TranscriptResult(text="hi")
+
+        with patch("speak2type.worker.GLib.idle_add") as mock_idle:
+            worker._post(worker._deliver_result, result, None)
+            worker._post(worker._deliver_result, result, None)
+            worker._drain_pending()
+            worker._post(worker._deliver_result, result, None)
+
+        assert mock_idle.call_count == 2
+        assert on_result.call_count == 2
+
+    def test_failing_callback_does_not_block_others(self):
+        """One raising callback does not drop the rest of the burst."""
+        worker = TranscriptionWorker(backend=MagicMock())
+        after = MagicMock()
+
+        with patch("speak2type.worker.GLib.idle_add"):
+            worker._post(MagicMock(side_effect=RuntimeError("boom")), 1)
+            worker._post(after, 2)
+        worker._drain_pending()
+
+        after.assert_called_once_with(2)